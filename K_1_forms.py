@@ -29,6 +29,14 @@ class K(AtomicExpr):  # type: ignore
         """
         self.index = index
 
+    def __reduce__(self) -> Tuple[type, Tuple[int]]:
+        """Pickle as just the index (sympy's default pickles the cached state)."""
+        return (K, (self.index,))
+
+    def __reduce_ex__(self, protocol: Any) -> Tuple[type, Tuple[int]]:
+        """Use __reduce__ for every protocol."""
+        return self.__reduce__()
+
     @property
     def is_number(self) -> bool:
         """Used by sympy to process expressions."""
@@ -75,20 +75,24 @@ def _create_Q_matrix(n: int) -> Matrix:
     )
 
 
+def _category_3_P_matrix(n: int) -> Matrix:
+    """Create the P matrix used by the category 3 K2L mappings."""
+    # _create_P_matrix only works for N = (n - 1) > 2 so we provide two special cases
+    if n == 2:
+        return eye(2)
+    if n == 3:
+        return Matrix([[1, 1, 0], [1, -1, 0], [0, 0, 1]])
+
+    return _create_P_matrix(n)
+
+
 def _category_3_K2L(n: int) -> Iterator[Expr]:
     """Create the category 3 K2L mappings."""
     # Create a columns vector from the L 1-forms which is used in the matrix based
     # creation of the mapping to K 1-forms
     l = Matrix([[L(i, i) for i in range(n)]]).T
 
-    # _create_P_matrix only works for N = (n - 1) > 2 so we provide two special cases
-    if n == 2:
-        P = eye(2)
-    if n == 3:
-        P = Matrix([[1, 1, 0], [1, -1, 0], [0, 0, 1]])
-    else:
-        P = _create_P_matrix(n)
-
+    P = _category_3_P_matrix(n)
     Q = _create_Q_matrix(n)
 
     k = P * Q * l
@@ -43,6 +43,14 @@ class L(AtomicExpr):  # type: ignore
         self.index_1 = index_1
         self.index_2 = index_2
 
+    def __reduce__(self) -> Tuple[type, Tuple[int, int]]:
+        """Pickle as just the indices (sympy's default pickles the cached state)."""
+        return (L, (self.index_1, self.index_2))
+
+    def __reduce_ex__(self, protocol: Any) -> Tuple[type, Tuple[int, int]]:
+        """Use __reduce__ for every protocol."""
+        return self.__reduce__()
+
     @property
     def is_number(self) -> bool:
         """Used by sympy to process expressions."""
@@ -0,0 +1,163 @@
+"""
+Metric-independent sums of the structure constants and the Ricci tensor from them.
+
+For a diagonal metric g_aa = x_L(a), where L(a) is the label of the index a (e.g. its
+category of K 1-forms), the Ricci tensor of the pipeline (half the usual one, see
+ricci.create_R_uddd) is
+
+    4 R_bd = - Σ_ac c_ba^c c_da^c x_L(c) / x_L(a) - Σ_ac c_ba^c c_dc^a
+             + 1/2 Σ_ac c_ac^b c_ac^d x_L(b) x_L(d) / (x_L(a) x_L(c))
+
+Grouping the sums over a and c by their labels gives numbers which depend on the
+structure constants and the labels only, so they are calculated once per n and R_bd
+is then an explicit combination of them with monomials in the x. Another ansatz for
+the metric (e.g. its own x for every diagonal generator) is just another grouping of
+the sums: calculate them with the finest labels once and regroup them.
+"""
+
+from sympy import Add, Expr, Symbol, expand, factor
+from typing import Dict, List, Mapping, NamedTuple, Sequence, Tuple, TypeVar
+
+from laurent import as_expr
+from metric import create_diagonal_metric, x1, x2
+from structure_constants import CTable
+from surd import Surd, from_surd, surd_mul, surd_sum, to_surd
+
+
+# Sums keyed by (b, d, L(a), L(c))
+LabelledSums = Dict[Tuple[int, int, int, int], Expr]
+
+Key = TypeVar("Key")
+V = TypeVar("V")
+
+
+class BracketSums(NamedTuple):
+    """The sums of products of structure constants grouped by the labels."""
+
+    labels: Tuple[int, ...]  # L(a) for every index a
+    adjoint: LabelledSums  # Σ c_ba^c c_da^c
+    killing: Dict[Tuple[int, int], Expr]  # Σ c_ba^c c_dc^a (the Killing form)
+    bracket: LabelledSums  # Σ c_ac^b c_ac^d
+
+
+def category_labels(n: int) -> Tuple[int, ...]:
+    """The category (0, 1 or 2) of every index, i.e. the metric of the pipeline."""
+    return tuple(e - 1 for e in create_diagonal_metric(n, (1, 2, 3)).entries)
+
+
+def split_labels(n: int) -> Tuple[int, ...]:
+    """Categories 0 and 1 as in category_labels but a label per diagonal generator."""
+    labels = category_labels(n)
+    start = labels.index(2)
+
+    return labels[:start] + tuple(range(2, 2 + len(labels) - start))
+
+
+def _add(sums: Dict[Key, List[V]], key: Key, value: V) -> None:
+    """Append a term to the list of terms of the key."""
+    sums.setdefault(key, []).append(value)
+
+
+def _total(sums: Dict[Key, List[Expr]]) -> Dict[Key, Expr]:
+    """Sum the lists of terms, dropping the sums which cancel."""
+    totals = {key: expand(Add(*terms)) for key, terms in sums.items()}
+
+    return {key: value for key, value in totals.items() if value != 0}
+
+
+def _total_surds(sums: Dict[Key, List[Surd]]) -> Dict[Key, Expr]:
+    """Sum the lists of Surd terms, dropping the sums which cancel."""
+    totals = {key: surd_sum(terms) for key, terms in sums.items()}
+
+    return {key: from_surd(surd) for key, surd in totals.items() if surd}
+
+
+def create_bracket_sums(c_table: CTable, labels: Sequence[int]) -> BracketSums:
+    """
+    Calculate the sums from the non-zero structure constants (as in create_c_table).
+
+    The entries may also be LaurentPolynomial constants (as in the c_table stage).
+    """
+    # c_ba^c keyed by (a, c) and c_ac^b keyed by (a, c), as lists of (b, value),
+    # with the values as Surds (as in create_c_table) so the sums are cheap
+    by_last: Dict[Tuple[int, int], List[Tuple[int, Surd]]] = {}
+    by_first: Dict[Tuple[int, int], List[Tuple[int, Surd]]] = {}
+
+    for (i, j, k), value in c_table.items():
+        value = to_surd(as_expr(value))
+        by_last.setdefault((j, k), []).append((i, value))
+        by_first.setdefault((i, j), []).append((k, value))
+
+    adjoint: Dict[Tuple[int, int, int, int], List[Surd]] = {}
+    killing: Dict[Tuple[int, int], List[Surd]] = {}
+    bracket: Dict[Tuple[int, int, int, int], List[Surd]] = {}
+
+    for (a, c), entries in by_last.items():
+        for b, v in entries:
+            for d, w in entries:
+                _add(adjoint, (b, d, labels[a], labels[c]), surd_mul(v, w))
+
+            for d, w in by_last.get((c, a), []):
+                _add(killing, (b, d), surd_mul(v, w))
+
+    for (a, c), entries in by_first.items():
+        for b, v in entries:
+            for d, w in entries:
+                _add(bracket, (b, d, labels[a], labels[c]), surd_mul(v, w))
+
+    return BracketSums(
+        tuple(labels),
+        _total_surds(adjoint),
+        _total_surds(killing),
+        _total_surds(bracket),
+    )
+
+
+def regroup(sums: BracketSums, mapping: Mapping[int, int]) -> BracketSums:
+    """Regroup the sums for coarser labels, mapping[label] being the new label."""
+
+    def _regroup(labelled: LabelledSums) -> LabelledSums:
+        regrouped: Dict[Tuple[int, int, int, int], List[Expr]] = {}
+
+        for (b, d, l_a, l_c), value in labelled.items():
+            _add(regrouped, (b, d, mapping[l_a], mapping[l_c]), value)
+
+        return _total(regrouped)
+
+    return BracketSums(
+        tuple(mapping[label] for label in sums.labels),
+        _regroup(sums.adjoint),
+        dict(sums.killing),
+        _regroup(sums.bracket),
+    )
+
+
+def create_R_dd(
+    sums: BracketSums, constants: Sequence[Expr]
+) -> Dict[Tuple[int, int], Expr]:
+    """
+    Assemble the non-zero R_bd for the metric with g_aa = constants[L(a)].
+
+    :param constants: The metric constant of every label (e.g. x1, x2, x3)
+    """
+    x = constants
+    L = sums.labels
+    terms: Dict[Tuple[int, int], List[Expr]] = {}
+
+    for (b, d, l_a, l_c), value in sums.adjoint.items():
+        _add(terms, (b, d), -value * x[l_c] / x[l_a] / 4)
+
+    for (b, d), value in sums.killing.items():
+        _add(terms, (b, d), -value / 4)
+
+    for (b, d, l_a, l_c), value in sums.bracket.items():
+        _add(terms, (b, d), value * x[L[b]] * x[L[d]] / (x[l_a] * x[l_c]) / 8)
+
+    R_dd = {key: factor(Add(*values)) for key, values in terms.items()}
+
+    return {key: value for key, value in R_dd.items() if value != 0}
+
+
+def split_constants(n: int, prefix: str = "x3_") -> Tuple[Symbol, ...]:
+    """Symbols x1, x2 and one per diagonal generator (for split_labels)."""
+    return (x1, x2, *(Symbol(f"{prefix}{i}") for i in range(n - 1)))
@@ -7,17 +7,20 @@ Based on the definitions:
 2. c_abc = g_cd c_ab^d
 """
 
-from sympy import Expr, Add, Mul, Array
-from sympy.tensor import tensorcontraction as tc, tensorproduct as tp
-from typing import List
+from itertools import combinations
+from sympy import Expr, Add, Mul, Array, Integer
+from typing import Dict, List, Tuple, Union
 
-from wedge import extract_wedge_coeff
+from forms import TwoForm, as_two_form
 from K_1_forms import K
+from metric import DiagonalMetric, as_diagonal_metric
+from structure_constants import CTable
+from symmetric import SymmetricTensor, antisymmetric
 
 
-def _coeff(dK: List[Expr], a: int, b: int, c: int) -> Expr:
+def _coeff(dK_coeffs: List[Dict[Tuple[int, int], Expr]], a: int, b: int, c: int) -> Expr:
     """
-    Calculate the c_ab^c coefficients from dK.
+    Calculate the c_ab^c coefficients from the wedge coefficients of dK.
 
     Based on the definition dK^a = 1/2 c_ab^c K^b ∧ K^c.
     The dK have had the anti-symmetric terms combined so we will extract for b < c and
@@ -27,32 +30,57 @@ def _coeff(dK: List[Expr], a: int, b: int, c: int) -> Expr:
         return 0
 
     if b < c:
-        return extract_wedge_coeff(dK[a], b, c)
+        return dK_coeffs[a].get((b, c), Integer(0))
 
     else:
-        return -1 * extract_wedge_coeff(dK[a], c, b)
+        return -1 * dK_coeffs[a].get((c, b), Integer(0))
 
 
-def create_c_ddu(dK: List[Expr], n: int) -> Array:
+def create_c_ddu(dK: List[Union[Expr, TwoForm]], n: int) -> SymmetricTensor:
     """
     Create the c_ddu tensor using the mapping from dK to K 2-forms (Wedges).
 
     Based on the definition: dK^a = -1/2 * c_bc^a K^b ^ K^c
+    The dK can be given either as sympy expressions or as TwoForms. Only the
+    independent components (b < c) are stored, as in create_c_ddu_from_table.
     """
     dim = n ** 2 - 1
 
-    return Array(
-        [
-            [[-1 * _coeff(dK, a, b, c) for a in range(dim)] for c in range(dim)]
-            for b in range(dim)
-        ]
+    # Decompose each dK once instead of walking it for every (b, c) pair
+    dK_coeffs = [as_two_form(e).coeffs for e in dK]
+
+    # Only b < c is extracted, the rest follows from the antisymmetry in b and c
+    c_ddu = SymmetricTensor((dim, dim, dim), (antisymmetric(0, 1, 3),))
+
+    for a in range(dim):
+        for b, c in combinations(range(dim), 2):
+            c_ddu[b, c, a] = -1 * _coeff(dK_coeffs, a, b, c)
+
+    return c_ddu
+
+
+def create_c_ddu_from_table(c_table: CTable, n: int) -> SymmetricTensor:
+    """
+    Create the c_ddu tensor from the sparse table of structure constants.
+
+    Only the independent components (b < c) are stored.
+    """
+    dim = n ** 2 - 1
+
+    return SymmetricTensor(
+        (dim, dim, dim),
+        (antisymmetric(0, 1, 3),),
+        {(b, c, a): value for (b, c, a), value in c_table.items() if b < c},
     )
 
 
-def create_c_ddd(c_ddu: Array, g_dd: Array) -> Array:
+def create_c_ddd(
+    c_ddu: Union[Array, SymmetricTensor], g_dd: Union[Array, DiagonalMetric]
+) -> Union[Array, SymmetricTensor]:
     """
     Create the c_ddd tensor using c_ddu and the metric tensor (to lower).
 
     Definition: c_abc = g_cd * c_ab^d = c_ab^d * g_cd
+    Since the metric is diagonal this is just a scaling of the last index.
     """
-    return tc(tp(c_ddu, g_dd), (2, 4))
+    return as_diagonal_metric(g_dd=g_dd).lower_index(c_ddu, 2)
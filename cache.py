@@ -1,70 +1,12 @@
 """Cache the results of expensive calculations here to save time."""
 
-from metric import x1, x2, x3
+import closed_form
 
+from ricci_store import RicciStore
 
-# A dictionary that maps the value of n to the 3 unique elements of the Ricci tensor
-ricci = {
-    2: [
-        (2 * x1 - 2 * x2 + x3) * (2 * x1 + 2 * x2 - x3) / (8 * x2 * x3),
-        -(2 * x1 - 2 * x2 - x3) * (2 * x1 + 2 * x2 - x3) / (8 * x1 * x3),
-        -(2 * x1 - 2 * x2 - x3) * (2 * x1 - 2 * x2 + x3) / (8 * x1 * x2),
-    ],
-    3: [
-        (
-            4 * x1 ** 3
-            - 4 * x1 * x2 ** 2
-            + 6 * x1 * x2 * x3
-            - 2 * x1 * x3 ** 2
-            - x2 ** 2 * x3
-        )
-        / (8 * x1 * x2 * x3),
-        -(
-            8 * x1 ** 3
-            - 9 * x1 ** 2 * x3
-            - 8 * x1 * x2 ** 2
-            + 4 * x1 * x3 ** 2
-            - x2 ** 2 * x3
-        )
-        / (16 * x1 ** 2 * x3),
-        -3 * (2 * x1 ** 2 - 4 * x1 * x2 + 2 * x2 ** 2 - x3 ** 2) / (8 * x1 * x2),
-    ],
-    4: [
-        (
-            4 * x1 ** 3
-            - 4 * x1 * x2 ** 2
-            + 8 * x1 * x2 * x3
-            - x1 * x3 ** 2
-            - 2 * x2 ** 2 * x3
-        )
-        / (8 * x1 * x2 * x3),
-        -(
-            4 * x1 ** 3
-            - 5 * x1 ** 2 * x3
-            - 4 * x1 * x2 ** 2
-            + x1 * x3 ** 2
-            - x2 ** 2 * x3
-        )
-        / (8 * x1 ** 2 * x3),
-        -(2 * x1 - 2 * x2 - x3) * (2 * x1 - 2 * x2 + x3) / (4 * x1 * x2),
-    ],
-    5: [
-        (
-            4 * x1 ** 3
-            - 4 * x1 * x2 ** 2
-            + 10 * x1 * x2 * x3
-            - x1 * x3 ** 2
-            - 3 * x2 ** 2 * x3
-        )
-        / (8 * x1 * x2 * x3),
-        -(
-            8 * x1 ** 3
-            - 11 * x1 ** 2 * x3
-            - 8 * x1 * x2 ** 2
-            + 2 * x1 * x3 ** 2
-            - 3 * x2 ** 2 * x3
-        )
-        / (16 * x1 ** 2 * x3),
-        -5 * (2 * x1 - 2 * x2 - x3) * (2 * x1 - 2 * x2 + x3) / (16 * x1 * x2),
-    ],
-}
+
+# A mapping from the value of n to the 3 unique elements of the Ricci tensor. The
+# results are stored in ricci.json and parsed on demand. A miss is answered from the
+# closed forms in n (fitted and verified against the calculated results), so no
+# tensor pipeline needs to run for a new n, and never written to ricci.json.
+ricci = RicciStore(calculate=closed_form.ricci)
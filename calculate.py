@@ -1,54 +1,480 @@
 """Carry out the full sequence of calculations to find Einstein Metrics."""
 
-import dill
-import sys
+import argparse
+import bracket_sums
+import c_tensor
+import differentials
+import forms
+import K_L_mappings
+import laurent as laurent_module
+import metric as metric_module
+import parallel
+import random
+import ricci
+import structure_constants
+import symmetric
+import theta_tensor
+import w_tensor
 
-from c_tensor import create_c_ddd, create_c_ddu
-from differentials import create_dK
-from K_1_forms import create_K_u
-from metric import create_metric, x1, x2, x3
-from ricci import create_R_uddd, create_R_dd, calculate_Riem_2
-from theta_tensor import create_theta_ud
-from w_tensor import create_w_dd, create_w_ud, create_w_wedge_ud, create_dw_ud
+from sympy import Array, Expr, Rational
+from typing import Dict, List, Optional, Sequence, Tuple
 
-# Choose the dimenions of the Group SU(n)
-n = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+from bracket_sums import (
+    BracketSums,
+    category_labels,
+    create_bracket_sums,
+    create_R_dd as create_R_dd_sums,
+)
+from checkpoint import Checkpoint
+from c_tensor import create_c_ddd, create_c_ddu_from_table
+from differentials import create_dK_from_table
+from einstein import ricci_tensor
+from forms import OneFormMatrix, TwoForm, TwoFormMatrix
+from laurent import LaurentPolynomial, laurent_generators
+from metric import DiagonalMetric, create_diagonal_metric, x1, x2, x3
+from ricci import (
+    create_R_dd_diagonal,
+    create_R_dd_direct,
+    create_R_dd_structure,
+    iter_R_uddd,
+    representative_indices,
+)
+from reconstruct import reconstruct_ricci
+from ricci_store import RicciStore
+from riemann_io import RiemannWriter, riemann_path
+from structure_constants import (
+    CartanTable,
+    CTable,
+    create_cartan_table,
+    create_c_table_from_cartan,
+    extend_cartan_table,
+)
+from symmetric import SymmetricTensor
+from theta_tensor import create_theta_ud_forms
+from w_tensor import (
+    create_w_dd_forms,
+    create_w_ud_forms,
+    create_w_wedge_ud_forms,
+    create_dw_ud_forms,
+)
 
-dim = n ** 2 - 1
-m = int(n * (n - 1) / 2)
 
-dK = create_dK(n)
+def create_structure_table(
+    n: int, laurent: bool = True, checkpoint: Optional[Checkpoint] = None
+) -> CTable:
+    """
+    Create the table of structure constants (extending that of SU(n - 1) if stored).
 
-g_dd, g_uu = create_metric(n)
+    If laurent is True the coefficients are LaurentPolynomials instead of sympy
+    expressions, which is much faster since they never need expanding.
+    """
+    cp = checkpoint if checkpoint is not None else Checkpoint(n)
 
-c_ddu = create_c_ddu(dK, n)
-c_ddd = create_c_ddd(c_ddu, g_dd)
+    modules = (structure_constants, K_L_mappings)
 
-K_u = create_K_u(n)
+    def _cartan_table() -> CartanTable:
+        # Extend the table of SU(n - 1) if a previous run stored it
+        previous = None
 
-w_dd = create_w_dd(c_ddd, K_u)
-w_ud = create_w_ud(w_dd, g_uu)
+        if n > 2 and cp.directory is not None:
+            previous = Checkpoint(n - 1, cp.directory).load(
+                "cartan_table", modules=modules
+            )
 
-dw_ud = create_dw_ud(w_ud, dK)
-w_wedge_ud = create_w_wedge_ud(n, w_ud)
-theta_ud = create_theta_ud(dw_ud, w_wedge_ud)
+        if previous is None:
+            return create_cartan_table(n)
 
-R_uddd = create_R_uddd(n, theta_ud)
-R_dd = create_R_dd(R_uddd)
+        return extend_cartan_table(previous, n - 1)
 
-assert len(set(R_dd[i, i] for i in range(dim))) == 3
+    cartan_table = cp.stage("cartan_table", _cartan_table, modules=modules)
 
-e_00 = R_dd[0, 0]
-e_11 = R_dd[m, m]
-e_22 = R_dd[2 * m, 2 * m]
+    def _c_table() -> CTable:
+        c_table = create_c_table_from_cartan(cartan_table, n)
 
-print(f"Calculation for n = {n}\n")
-print("Unique elements of Ricci tensor:\n")
-print(e_00)
-print(e_11)
-print(e_22)
+        if laurent:
+            return {key: LaurentPolynomial.constant(c) for key, c in c_table.items()}
 
-# Serialize and save the R_uddd tensor
-dill.settings["recurse"] = True
-with open(f"R_uddd_n_{n}.dat", "wb") as fout:
-    dill.dump(R_uddd, fout)
+        return c_table
+
+    return cp.stage(
+        "c_table",
+        _c_table,
+        inputs=("cartan_table",),
+        modules=(*modules, laurent_module),
+        params=laurent,
+    )
+
+
+def create_structure_constants(
+    n: int,
+    metric: DiagonalMetric,
+    laurent: bool = True,
+    checkpoint: Optional[Checkpoint] = None,
+) -> Tuple[CTable, SymmetricTensor]:
+    """
+    Create the table of structure constants and the c_ddd tensor.
+
+    If laurent is True the coefficients are LaurentPolynomials (see
+    create_structure_table).
+    """
+    cp = checkpoint if checkpoint is not None else Checkpoint(n)
+    c_table = create_structure_table(n, laurent, cp)
+
+    c_ddu = cp.stage(
+        "c_ddu",
+        lambda: create_c_ddu_from_table(c_table, n),
+        inputs=("c_table",),
+        modules=(c_tensor, symmetric),
+    )
+    c_ddd = cp.stage(
+        "c_ddd",
+        lambda: create_c_ddd(c_ddu, metric),
+        inputs=("c_ddu",),
+        modules=(c_tensor, metric_module),
+        params=repr(metric.entries),
+    )
+
+    return c_table, c_ddd
+
+
+def create_connection(
+    n: int,
+    metric: DiagonalMetric,
+    laurent: bool = True,
+    checkpoint: Optional[Checkpoint] = None,
+) -> Tuple[List[TwoForm], OneFormMatrix]:
+    """
+    Create dK and the connection 1-forms w_ud from the structure constants.
+
+    If laurent is True the coefficients are LaurentPolynomials (see
+    create_structure_constants).
+
+    Each stage goes through the checkpoint (if specified) so it is only recalculated
+    when its inputs or code change.
+    """
+    cp = checkpoint if checkpoint is not None else Checkpoint(n)
+    g = repr(metric.entries)
+
+    c_table, c_ddd = create_structure_constants(n, metric, laurent, cp)
+
+    dK = cp.stage(
+        "dK",
+        lambda: create_dK_from_table(c_table, n),
+        inputs=("c_table",),
+        modules=(differentials, forms),
+    )
+
+    w_dd = cp.stage(
+        "w_dd",
+        lambda: create_w_dd_forms(c_ddd),
+        inputs=("c_ddd",),
+        modules=(w_tensor, forms),
+    )
+    w_ud = cp.stage(
+        "w_ud",
+        lambda: create_w_ud_forms(w_dd, metric),
+        inputs=("w_dd",),
+        modules=(w_tensor,),
+        params=g,
+    )
+
+    return dK, w_ud
+
+
+def create_theta(
+    n: int,
+    metric: Optional[DiagonalMetric] = None,
+    columns: Optional[Sequence[int]] = None,
+    laurent: bool = True,
+    checkpoint: Optional[Checkpoint] = None,
+) -> TwoFormMatrix:
+    """
+    Run the pipeline from the structure constants up to theta_ud.
+
+    If columns is specified only the theta^a_b with b in columns are calculated, with
+    one column per entry of columns (in the same order).
+
+    If laurent is True the coefficients are LaurentPolynomials (see create_connection).
+    """
+    if metric is None:
+        constants = laurent_generators() if laurent else (x1, x2, x3)
+        metric = create_diagonal_metric(n, constants)
+
+    cp = checkpoint if checkpoint is not None else Checkpoint(n)
+    dK, w_ud = create_connection(n, metric, laurent, cp)
+
+    params = (repr(metric.entries), columns)
+
+    if columns is not None:
+        w_columns = [[row[b] for b in columns] for row in w_ud]
+
+        def _dw_ud() -> TwoFormMatrix:
+            return create_dw_ud_forms(w_columns, dK)
+
+        def _w_wedge_ud() -> TwoFormMatrix:
+            return create_w_wedge_ud_forms(n, w_ud, columns)
+
+        def _theta_ud() -> TwoFormMatrix:
+            return create_theta_ud_forms(dw_ud, w_wedge_ud)
+
+    else:
+        # Only calculate the a < b half using the antisymmetry of the lowered forms
+        def _dw_ud() -> TwoFormMatrix:
+            return create_dw_ud_forms(w_ud, dK, metric)
+
+        def _w_wedge_ud() -> TwoFormMatrix:
+            return create_w_wedge_ud_forms(n, w_ud, metric=metric)
+
+        def _theta_ud() -> TwoFormMatrix:
+            return create_theta_ud_forms(dw_ud, w_wedge_ud, metric)
+
+    dw_ud = cp.stage(
+        "dw_ud", _dw_ud, inputs=("w_ud", "dK"), modules=(w_tensor,), params=params
+    )
+    w_wedge_ud = cp.stage(
+        "w_wedge_ud", _w_wedge_ud, inputs=("w_ud",), modules=(w_tensor,), params=params
+    )
+
+    return cp.stage(
+        "theta_ud",
+        _theta_ud,
+        inputs=("dw_ud", "w_wedge_ud"),
+        modules=(theta_tensor,),
+        params=params,
+    )
+
+
+def create_representative_R_dd(
+    n: int, laurent: bool = True, checkpoint: Optional[Checkpoint] = None
+) -> Dict[int, Expr]:
+    """Create only R_00, R_mm and R_2m2m, building just the columns of theta needed."""
+    cp = checkpoint if checkpoint is not None else Checkpoint(n)
+    columns = representative_indices(n)
+    theta_columns = create_theta(n, columns=columns, laurent=laurent, checkpoint=cp)
+
+    return cp.stage(
+        "R_dd_diagonal",
+        lambda: create_R_dd_diagonal(theta_columns, columns),
+        inputs=("theta_ud",),
+        modules=(ricci,),
+    )
+
+
+def create_structure_R_dd(
+    n: int, laurent: bool = True, checkpoint: Optional[Checkpoint] = None
+) -> Array:
+    """
+    Create the Ricci tensor straight from the structure constants and the metric.
+
+    None of the connection or curvature forms are built (see create_R_dd_structure).
+    """
+    constants = laurent_generators() if laurent else (x1, x2, x3)
+    metric = create_diagonal_metric(n, constants)
+
+    cp = checkpoint if checkpoint is not None else Checkpoint(n)
+    _, c_ddd = create_structure_constants(n, metric, laurent, cp)
+
+    return cp.stage(
+        "R_dd_structure",
+        lambda: create_R_dd_structure(c_ddd, metric),
+        inputs=("c_ddd",),
+        modules=(ricci,),
+    )
+
+
+def create_bracket_sums_stage(
+    n: int, labels: Sequence[int], checkpoint: Optional[Checkpoint] = None
+) -> BracketSums:
+    """Create the metric-independent sums of the structure constants (once per n)."""
+    cp = checkpoint if checkpoint is not None else Checkpoint(n)
+    c_table = create_structure_table(n, checkpoint=cp)
+
+    return cp.stage(
+        "bracket_sums",
+        lambda: create_bracket_sums(c_table, labels),
+        inputs=("c_table",),
+        modules=(bracket_sums, structure_constants),
+        params=tuple(labels),
+    )
+
+
+def has_block_structure(
+    n: int, components: Dict[int, Expr], samples: int = 1, seed: int = 0
+) -> bool:
+    """
+    Spot check that R_dd is diagonal with one value per category of K 1-forms.
+
+    The full Ricci tensor is calculated exactly at random rational values of x1, x2
+    and x3 (see einstein.ricci_tensor), which is much cheaper than symbolically, and
+    compared with the representative components evaluated at the same point.
+    """
+    rng = random.Random(seed)
+    dim = n ** 2 - 1
+    starts = representative_indices(n)
+
+    for _ in range(samples):
+        values = [Rational(rng.randint(1, 97), rng.randint(1, 97)) for _ in range(3)]
+        point = dict(zip((x1, x2, x3), values))
+
+        R_dd = ricci_tensor(n, *values)
+
+        if any(a != b for a, b in R_dd):
+            return False
+
+        for a in range(dim):
+            # The category of the index is the last representative index not after it
+            rep = max(start for start in starts if start <= a)
+
+            if R_dd.get((a, a), 0) != components[rep].subs(point):
+                return False
+
+    return True
+
+
+def main() -> None:
+    """Entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "n", type=int, nargs="?", default=2, help="Calculate for the group SU(n)"
+    )
+    parser.add_argument(
+        "--no-riemann",
+        action="store_true",
+        help="Skip saving the (sparse) R_uddd tensor",
+    )
+    parser.add_argument(
+        "--sympy",
+        action="store_true",
+        help="Use sympy expressions for the coefficients instead of Laurent polynomials",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of processes for the parallel stages (default: $SUN_WORKERS or 1)",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        help="Number of entries sent to a worker at a time (default: $SUN_CHUNKSIZE)",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        default="checkpoints",
+        help="Directory caching the artifact of every stage (default: checkpoints)",
+    )
+    parser.add_argument(
+        "--no-checkpoint",
+        action="store_true",
+        help="Do not read or write any stage artifacts",
+    )
+    parser.add_argument(
+        "--resume",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Reuse the stage artifacts whose inputs and code are unchanged",
+    )
+    parser.add_argument(
+        "--representative",
+        action="store_true",
+        help=(
+            "Only calculate the three representative Ricci components and spot check "
+            "the block structure numerically (implies --no-riemann)"
+        ),
+    )
+    parser.add_argument(
+        "--structure",
+        action="store_true",
+        help=(
+            "Calculate the Ricci tensor straight from the structure constants, "
+            "without any connection or curvature forms (implies --no-riemann)"
+        ),
+    )
+    parser.add_argument(
+        "--sums",
+        action="store_true",
+        help=(
+            "Assemble the Ricci tensor from the metric-independent sums of the "
+            "structure constants (implies --no-riemann)"
+        ),
+    )
+    parser.add_argument(
+        "--reconstruct",
+        action="store_true",
+        help=(
+            "Reconstruct the Ricci tensor from its exact values at rational points "
+            "(implies --no-riemann)"
+        ),
+    )
+    parser.add_argument(
+        "--store",
+        action="store_true",
+        help="Write the elements to ricci.json, the results used by solve.py",
+    )
+    args = parser.parse_args()
+
+    parallel.configure(args.workers, args.chunksize)
+
+    # Choose the dimenions of the Group SU(n)
+    n = args.n
+
+    i_00, i_11, i_22 = representative_indices(n)
+
+    directory = None if args.no_checkpoint else args.checkpoint_dir
+    cp = Checkpoint(n, directory, args.resume)
+
+    if args.representative:
+        components = create_representative_R_dd(n, not args.sympy, cp)
+
+        e_00, e_11, e_22 = components[i_00], components[i_11], components[i_22]
+
+    elif args.structure:
+        R_dd = create_structure_R_dd(n, not args.sympy, cp)
+
+        e_00, e_11, e_22 = R_dd[i_00, i_00], R_dd[i_11, i_11], R_dd[i_22, i_22]
+
+    elif args.reconstruct:
+        e_00, e_11, e_22 = reconstruct_ricci(n)
+
+    elif args.sums:
+        sums = create_bracket_sums_stage(n, category_labels(n), cp)
+        R = create_R_dd_sums(sums, (x1, x2, x3))
+
+        e_00, e_11, e_22 = R[i_00, i_00], R[i_11, i_11], R[i_22, i_22]
+
+    else:
+        theta_ud = create_theta(n, laurent=not args.sympy, checkpoint=cp)
+
+        # The Ricci tensor is accumulated straight from theta_ud
+        R_dd = cp.stage(
+            "R_dd",
+            lambda: create_R_dd_direct(n, theta_ud),
+            inputs=("theta_ud",),
+            modules=(ricci,),
+        )
+
+        e_00, e_11, e_22 = R_dd[i_00, i_00], R_dd[i_11, i_11], R_dd[i_22, i_22]
+
+    # Check the elements, and that the Ricci tensor is diagonal with one value per
+    # category, exactly at a random point
+    assert has_block_structure(n, {i_00: e_00, i_11: e_11, i_22: e_22})
+
+    # Only write to the (tracked) results used by solve.py when asked to
+    if args.store:
+        RicciStore().put(n, [e_00, e_11, e_22])
+
+    print(f"Calculation for n = {n}\n")
+    print("Unique elements of Ricci tensor:\n")
+    print(e_00)
+    print(e_11)
+    print(e_22)
+
+    modes = (args.representative, args.structure, args.sums, args.reconstruct)
+
+    if not (args.no_riemann or any(modes)):
+        # Stream the non-zero entries of R_uddd to its sparse file
+        with RiemannWriter(riemann_path(n), n) as writer:
+            writer.write_all(iter_R_uddd(theta_ud))
+
+
+if __name__ == "__main__":
+    main()
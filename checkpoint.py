@@ -0,0 +1,179 @@
+"""
+On-disk cache of the artifacts of the pipeline stages.
+
+Every stage artifact is stored (with dill) under a key hashing together the name of
+the stage, n, its parameters, the source of the modules implementing it (and of every
+module of the repository they use, transitively) and the keys of the stages it takes
+as inputs. Changing the code of a stage therefore changes its
+key and the keys of every stage downstream of it, while the stages upstream are
+reused.
+"""
+
+import dill
+import hashlib
+import inspect
+import os
+import sys
+
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+
+T = TypeVar("T")
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def _is_local(module: ModuleType) -> bool:
+    """Whether the module is one of the repository (rather than a dependency)."""
+    path = getattr(module, "__file__", None)
+
+    return path is not None and os.path.dirname(os.path.abspath(path)) == _ROOT
+
+
+def _local_imports(module: ModuleType) -> List[ModuleType]:
+    """The modules of the repository a module imports, or imports names from."""
+    imports = []
+
+    for value in vars(module).values():
+        if isinstance(value, ModuleType):
+            imported: Optional[ModuleType] = value
+        else:
+            imported = sys.modules.get(str(getattr(value, "__module__", None)))
+
+        if imported is not None and imported is not module and _is_local(imported):
+            imports.append(imported)
+
+    return imports
+
+
+def dependencies(modules: Sequence[ModuleType]) -> List[ModuleType]:
+    """The modules and every module of the repository they use, sorted by name."""
+    found: Dict[str, ModuleType] = {}
+    stack = list(modules)
+
+    while stack:
+        module = stack.pop()
+
+        if module.__name__ not in found:
+            found[module.__name__] = module
+            stack.extend(_local_imports(module))
+
+    return [found[name] for name in sorted(found)]
+
+
+def fingerprint(modules: Sequence[ModuleType]) -> str:
+    """
+    Hash the source code of the modules and of their dependencies in the repository.
+
+    A stage therefore only needs to list the modules implementing it: editing any
+    module they use (e.g. forms or laurent) also invalidates its artifacts.
+    """
+    digest = hashlib.sha256()
+
+    for module in dependencies(modules):
+        digest.update(module.__name__.encode())
+
+        with open(inspect.getsourcefile(module), "rb") as fin:  # type: ignore
+            digest.update(fin.read())
+
+    return digest.hexdigest()
+
+
+class Checkpoint:
+    """
+    The stage cache of a single run (for a given n).
+
+    With no directory nothing is stored and every stage is simply calculated.
+    """
+
+    def __init__(self, n: int, directory: Optional[str] = None, resume: bool = True):
+        """
+        Create the cache.
+
+        :param n: Calculation for SU(n)
+        :param directory: The directory to store the artifacts in (None to disable)
+        :param resume: Whether to reuse stored artifacts (otherwise overwrite them)
+        """
+        self.n = n
+        self.directory = directory
+        self.resume = resume
+        self.keys: Dict[str, str] = {}
+
+    def key(
+        self,
+        name: str,
+        inputs: Sequence[str] = (),
+        modules: Sequence[ModuleType] = (),
+        params: Any = None,
+    ) -> str:
+        """Calculate the key of a stage (its upstream stages must already have run)."""
+        parts = [
+            name,
+            str(self.n),
+            repr(params),
+            fingerprint(modules),
+            *(self.keys[stage] for stage in inputs),
+        ]
+
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def path(self, name: str, key: str) -> str:
+        """The path of the artifact of a stage."""
+        return os.path.join(str(self.directory), f"n_{self.n}", f"{name}-{key[:16]}.dill")
+
+    def load(
+        self, name: str, modules: Sequence[ModuleType] = (), params: Any = None
+    ) -> Optional[Any]:
+        """Load the stored artifact of a stage without inputs (None if not stored)."""
+        if self.directory is None:
+            return None
+
+        path = self.path(name, self.key(name, modules=modules, params=params))
+
+        if not os.path.exists(path):
+            return None
+
+        with open(path, "rb") as fin:
+            return dill.load(fin)
+
+    def stage(
+        self,
+        name: str,
+        compute: Callable[[], T],
+        inputs: Sequence[str] = (),
+        modules: Sequence[ModuleType] = (),
+        params: Any = None,
+    ) -> T:
+        """
+        Return the artifact of a stage, loading it if stored or else calculating it.
+
+        :param name: The name of the stage, unique within a run
+        :param compute: Calculates the artifact
+        :param inputs: The names of the stages whose artifacts compute uses
+        :param modules: The modules implementing the stage
+        :param params: Any other (repr-able) parameters the artifact depends on
+        """
+        key = self.keys[name] = self.key(name, inputs, modules, params)
+
+        if self.directory is None:
+            return compute()
+
+        path = self.path(name, key)
+
+        if self.resume and os.path.exists(path):
+            with open(path, "rb") as fin:
+                return dill.load(fin)  # type: ignore
+
+        artifact = compute()
+
+        # Write to a temporary file first so a crash never leaves a partial artifact
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+
+        with open(tmp_path, "wb") as fout:
+            dill.dump(artifact, fout)
+
+        os.replace(tmp_path, path)
+
+        return artifact
@@ -0,0 +1,144 @@
+"""
+Closed forms in n of the 3 unique elements of the Ricci tensor.
+
+Each element is a polynomial in x1, x2 and x3 over a monomial denominator, whose
+coefficients are fitted as polynomials in n by interpolating the results calculated
+for a few values of n. The fit is verified against every other stored n before it is
+used, and then gives the elements for any n without running the tensor pipeline.
+
+The n = 3 results do not follow the closed form since the K2L mapping uses a special
+P matrix for n = 3 (so its structure constants do not satisfy the Jacobi identity),
+so they are never used for the fit and always taken from the store.
+"""
+
+from functools import lru_cache
+from sympy import Expr, Poly, Symbol, cancel, fraction, interpolate, lcm
+from typing import List, Mapping, Sequence
+
+from metric import x1, x2, x3
+from ricci_store import RicciStore
+
+
+n_symbol = Symbol("n", integer=True, positive=True)
+
+# The n the fit is calculated from (one more than needed for a linear fit, so a
+# higher degree would show up in the verification rather than be missed)
+FIT_N = (4, 5, 6, 7)
+
+# The n always used (along with any others in the store) to verify the fit
+VERIFY_N = (2, 8)
+
+# The n whose results do not follow the closed form
+EXCEPTIONS = (3,)
+
+
+def _denominator(elements: Sequence[Expr]) -> Expr:
+    """The lcm of the monomial denominators of the elements (without constants)."""
+    monomials = []
+
+    for e in elements:
+        denominator = Poly(fraction(cancel(e))[1], x1, x2, x3)
+
+        if len(denominator.terms()) != 1:
+            raise ValueError(f"{e} does not have a monomial denominator")
+
+        monomials.append(Poly({denominator.monoms()[0]: 1}, x1, x2, x3).as_expr())
+
+    return lcm(monomials)
+
+
+def fit(samples: Mapping[int, Sequence[Expr]]) -> List[Expr]:
+    """
+    Fit the closed forms in n_symbol of the 3 elements from their values at some n.
+
+    With k values of n each coefficient is interpolated by a polynomial in n of
+    degree at most k - 1.
+    """
+    ns = sorted(samples)
+    closed_forms = []
+
+    for i in range(3):
+        denominator = _denominator([samples[n][i] for n in ns])
+
+        numerators = {
+            n: Poly(cancel(samples[n][i] * denominator), x1, x2, x3).as_dict()
+            for n in ns
+        }
+        monomials = sorted(set().union(*numerators.values()))
+
+        numerator = sum(
+            interpolate([(n, numerators[n].get(monomial, 0)) for n in ns], n_symbol)
+            * x1 ** monomial[0]
+            * x2 ** monomial[1]
+            * x3 ** monomial[2]
+            for monomial in monomials
+        )
+
+        closed_forms.append(cancel(numerator.expand() / denominator))
+
+    return closed_forms
+
+
+def evaluate(forms: Sequence[Expr], n: int) -> List[Expr]:
+    """Substitute n into the closed forms."""
+    return [cancel(e.subs(n_symbol, n)) for e in forms]
+
+
+def verify(forms: Sequence[Expr], samples: Mapping[int, Sequence[Expr]]) -> List[int]:
+    """Return the n of the samples which do not agree with the closed forms."""
+    return [
+        n
+        for n, elements in sorted(samples.items())
+        if any(
+            cancel(e - f) != 0 for e, f in zip(evaluate(forms, n), elements)
+        )
+    ]
+
+
+def _stored(store: RicciStore, n: int) -> List[Expr]:
+    """
+    Look up the calculated results for n, which must be in the store.
+
+    Raises LookupError naming the n to calculate first, rather than running the
+    tensor pipeline (or the closed forms themselves) on a miss.
+    """
+    if n not in store:
+        raise LookupError(
+            f"The results for n = {n} are not stored, calculate them first with "
+            f"calculate.py {n} --store"
+        )
+
+    return store[n]
+
+
+def fit_and_verify(store: RicciStore) -> List[Expr]:
+    """
+    Fit the closed forms from the results for FIT_N and verify them.
+
+    The results must be in the store (see _stored). The fit is verified against
+    VERIFY_N and every other n in the store except EXCEPTIONS, raising ValueError if
+    it does not agree.
+    """
+    forms = fit({n: _stored(store, n) for n in FIT_N})
+
+    others = set(VERIFY_N) | {n for n in store if n not in FIT_N + EXCEPTIONS}
+    failures = verify(forms, {n: _stored(store, n) for n in others})
+
+    if failures:
+        raise ValueError(f"The closed forms disagree with the results for {failures}")
+
+    return forms
+
+
+@lru_cache(maxsize=None)
+def closed_forms() -> List[Expr]:
+    """The closed forms fitted and verified with the default store (once)."""
+    return fit_and_verify(RicciStore(calculate=None))
+
+
+def ricci(n: int) -> List[Expr]:
+    """The 3 unique elements of the Ricci tensor for SU(n) from the closed forms."""
+    if n in EXCEPTIONS:
+        return _stored(RicciStore(calculate=None), n)
+
+    return evaluate(closed_forms(), n)
@@ -1,11 +1,13 @@
 """Calculate the differential (d<.>) of the L and K 1-forms."""
 
-from sympy import I, Expr, expand
-from typing import List
+from sympy import Add, I, Expr, expand
+from typing import Dict, List, Tuple
 
+from forms import OneForm, TwoForm, sum_two_forms
 from K_L_mappings import create_K2L
 from L_K_mappings import create_L2K
 from L_1_forms import L
+from structure_constants import CTable
 from wedge import Wedge, antisymm, expand_K, extract_factor_K
 
 
@@ -87,3 +89,61 @@ def create_dK(n: int) -> List[Expr]:
     dK = [expand(e) for e in dK]  # Expand the expression to get sum over products
 
     return dK
+
+
+def _L_coeffs(expr: Expr) -> Dict[Tuple[int, int], Expr]:
+    """Decompose a linear combination of L 1-forms into {(a, b): coeff of L_a^b}."""
+    terms: Dict[Tuple[int, int], List[Expr]] = {}
+
+    for term in Add.make_args(expand(expr)):
+        coeff, l = term.as_independent(L, as_Add=False)
+
+        if not isinstance(l, L):
+            raise ValueError(f"{term} is not a multiple of an L 1-form")
+
+        terms.setdefault((l.index_1, l.index_2), []).append(coeff)
+
+    return {key: Add(*coeffs) for key, coeffs in terms.items()}
+
+
+def create_dK_forms(n: int) -> List[TwoForm]:
+    """
+    Calculate the differential for all the K 1-forms in SU(n) as TwoForms.
+
+    Same calculation as create_dK but carried out on sparse forms:
+    dK^k = M_k^(ab) dL_a^b with dL_a^b = I * L_a^c ∧ L_c^b, where L_a^b is replaced
+    by its (OneForm) mapping to the K 1-forms. The wedges are canonical by
+    construction so no tree-rewrite passes are needed.
+    """
+    L2K = [[OneForm.from_expr(e) for e in row] for row in create_L2K(n)]
+
+    # Only create the dL_a^b that are actually needed by the K2L mappings
+    dL_forms: Dict[Tuple[int, int], TwoForm] = {}
+
+    def _dL_form(a: int, b: int) -> TwoForm:
+        if (a, b) not in dL_forms:
+            dL_forms[(a, b)] = I * sum_two_forms(L2K[a][i] ^ L2K[i][b] for i in range(n))
+
+        return dL_forms[(a, b)]
+
+    return [
+        sum_two_forms(
+            coeff * _dL_form(a, b) for (a, b), coeff in _L_coeffs(e).items()
+        ).applyfunc(expand)
+        for e in create_K2L(n)
+    ]
+
+
+def create_dK_from_table(c_table: CTable, n: int) -> List[TwoForm]:
+    """
+    Create the differentials of the K 1-forms from the table of structure constants.
+
+    dK^a = -1/2 c_bc^a K^b ∧ K^c = - Σ_{b < c} c_bc^a K^b ∧ K^c
+    """
+    coeffs: List[Dict[Tuple[int, int], Expr]] = [{} for _ in range(n ** 2)]
+
+    for (b, c, a), value in c_table.items():
+        if b < c:
+            coeffs[a][(b, c)] = -value
+
+    return [TwoForm(e) for e in coeffs]
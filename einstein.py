@@ -0,0 +1,62 @@
+"""
+Check exactly whether a metric of SU(n) is Einstein, without any symbolic pipeline.
+
+The Ricci tensor of the diagonal metric (x1, x2, x3) is calculated with exact
+rational arithmetic from the sparse structure constants (see
+reconstruct.create_R_dd_at), so candidate solutions can be verified for any n
+without a Ricci store entry.
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Tuple
+
+from reconstruct import Structure, create_R_dd_at, create_structure
+
+
+class EinsteinCheck(NamedTuple):
+    """The exact Ricci tensor of a metric and its difference from lambda g."""
+
+    ricci: Dict[Tuple[int, int], Fraction]  # The non-zero R_ab
+    residual: Dict[Tuple[int, int], Fraction]  # The non-zero R_ab - lambda g_ab
+
+    @property
+    def is_einstein(self) -> bool:
+        """Whether R_ab = lambda g_ab exactly."""
+        return not self.residual
+
+
+def _fraction(value: Any) -> Fraction:
+    """Convert an int, Fraction, sympy Rational or string such as "3/4" exactly."""
+    return Fraction(str(value))
+
+
+@lru_cache(maxsize=None)
+def _structure(n: int) -> Structure:
+    """The structure constants of SU(n) as Surds (cached)."""
+    return create_structure(n)
+
+
+def ricci_tensor(n: int, x1: Any, x2: Any, x3: Any) -> Dict[Tuple[int, int], Fraction]:
+    """The non-zero R_ab of SU(n) for the metric (x1, x2, x3), exactly."""
+    return create_R_dd_at(_structure(n), tuple(_fraction(x) for x in (x1, x2, x3)))
+
+
+def check(n: int, x1: Any, x2: Any, x3: Any, lmbda: Any) -> EinsteinCheck:
+    """
+    Calculate the Ricci tensor and the residual R_ab - lambda g_ab exactly.
+
+    The values may be ints, Fractions, sympy Rationals or strings such as "3/4".
+    """
+    point = tuple(_fraction(x) for x in (x1, x2, x3))
+    lmbda = _fraction(lmbda)
+
+    structure = _structure(n)
+    ricci = create_R_dd_at(structure, point)
+
+    residual = dict(ricci)
+
+    for a, label in enumerate(structure.labels):
+        residual[a, a] = residual.get((a, a), Fraction(0)) - lmbda * point[label]
+
+    return EinsteinCheck(ricci, {key: r for key, r in residual.items() if r != 0})
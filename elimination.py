@@ -0,0 +1,132 @@
+"""
+Solve the Einstein equations exactly by elimination, keeping only positive real roots.
+
+With x3 normalized to 1, lambda is eliminated by equating lambda_i = R_ii / x_i with
+lambda_3 and the monomial denominators are cleared, leaving two polynomials in x1 and
+x2. Their resultant with respect to x2 is a univariate eliminant in x1 whose positive
+real roots are isolated exactly (so the complex branches are never calculated) and
+back-substituted to recover x2 and lambda.
+"""
+
+from sympy import (
+    Expr,
+    Poly,
+    Rational,
+    factor_list,
+    factor_terms,
+    fraction,
+    gcd,
+    resultant,
+    subresultants,
+    together,
+)
+from typing import List, NamedTuple, Sequence, Tuple
+
+from metric import x1, x2, x3
+
+
+class Solution(NamedTuple):
+    """An exact Einstein metric (with x3 = 1) and its lambda."""
+
+    x1: Expr
+    x2: Expr
+    lmbda: Expr
+
+
+def _numerator(expr: Expr) -> Expr:
+    """The numerator of expr without its monomial (and constant) content."""
+    numerator, _ = fraction(together(expr))
+    _, polynomial = factor_terms(numerator.expand()).as_coeff_Mul()
+
+    return polynomial.as_independent(x1, x2, as_Add=False)[1]
+
+
+def einstein_polynomials(elements: Sequence[Expr]) -> Tuple[Expr, Expr, Expr]:
+    """
+    Create the polynomials of the Einstein condition from the 3 Ricci elements.
+
+    Returns the numerators of lambda_1 - lambda_3 and lambda_2 - lambda_3 and the
+    lambda_3 the solutions have (all with x3 = 1).
+    """
+    lambdas = [(e / x).subs({x3: 1}) for e, x in zip(elements, (x1, x2, x3))]
+
+    return (
+        _numerator(lambdas[0] - lambdas[2]),
+        _numerator(lambdas[1] - lambdas[2]),
+        lambdas[2],
+    )
+
+
+def positive_roots(polynomial: Expr, x: Expr) -> List[Expr]:
+    """The distinct positive real roots of a univariate polynomial, exactly."""
+    roots: List[Expr] = []
+
+    for factor, _ in factor_list(polynomial, x)[1]:
+        if factor.has(x):
+            roots.extend(r for r in Poly(factor, x).real_roots() if r.is_positive)
+
+    return sorted(set(roots), key=lambda r: r.evalf())
+
+
+def _back_substitute(
+    p1: Expr, p2: Expr, factor: Expr, root: Expr, precision: int
+) -> List[Expr]:
+    """Find the positive x2 solving p1 = p2 = 0 at x1 = root (a root of factor)."""
+    if Poly(factor, x1).degree() == 1:
+        # Rational root, so the common roots in x2 are those of the exact gcd
+        common = gcd(p1.subs(x1, root), p2.subs(x1, root))
+
+        return positive_roots(common, x2) if common.has(x2) else []
+
+    # Otherwise use the subresultant of degree 1 in x2, a x2 + b, if a does not vanish
+    # at any root of factor (which then determines x2 uniquely)
+    chain = subresultants(Poly(p1, x2), Poly(p2, x2))
+    linear = [s for s in chain if s.degree() == 1]
+
+    if linear:
+        a, b = (c.as_expr() for c in linear[0].all_coeffs())
+
+        if not gcd(Poly(a, x1), Poly(factor, x1)).degree() > 0:
+            value = -b.subs(x1, root) / a.subs(x1, root)
+
+            return [value] if value.evalf(precision) > 0 else []
+
+    # Fall back to solving p1 numerically and checking p2 at the candidates
+    root_n = root.evalf(precision)
+    tolerance = Rational(1, 10 ** (precision // 2))
+
+    return [
+        value
+        for value in Poly(p1.subs(x1, root_n), x2).nroots(n=precision)
+        if value.is_real
+        and value > 0
+        and abs(p2.subs({x1: root_n, x2: value})) < tolerance
+    ]
+
+
+def solve(elements: Sequence[Expr], precision: int = 50) -> List[Solution]:
+    """
+    Find the positive real Einstein metrics exactly.
+
+    Rational solutions are returned as Rationals, the others as algebraic numbers
+    (CRootOf expressions), except in the rare degenerate case that the back
+    substitution falls back to numerical roots of the given precision.
+    """
+    p1, p2, lmbda = einstein_polynomials(elements)
+
+    eliminant = resultant(p1, p2, x2)
+    solutions = []
+
+    for factor, _ in factor_list(eliminant, x1)[1]:
+        if not factor.has(x1):
+            continue
+
+        for root in Poly(factor, x1).real_roots():
+            if not root.is_positive:
+                continue
+
+            for value in _back_substitute(p1, p2, factor, root, precision):
+                point = {x1: root, x2: value}
+                solutions.append(Solution(root, value, lmbda.subs(point)))
+
+    return sorted(set(solutions), key=lambda s: (s.x1.evalf(), s.x2.evalf()))
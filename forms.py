@@ -0,0 +1,282 @@
+"""
+Sparse 1-forms and 2-forms over the K 1-forms.
+
+The forms are stored as maps from K indices to coefficients so that they are in
+canonical form by construction: a OneForm maps i -> coeff of K^i and a TwoForm maps
+(i, j) with i < j -> coeff of K^i ∧ K^j. This removes the need for the expand_K,
+extract_factor_K and antisymm passes over sympy Wedge trees.
+"""
+
+from functools import reduce
+from operator import add
+from sympy import Add, Basic, Expr, Integer, expand
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from K_1_forms import K
+from laurent import LaurentPolynomial
+from wedge import Wedge, wedge_coeffs
+
+
+def sum_coeffs(terms: List[Any]) -> Any:
+    """
+    Sum coefficients, using a single Add for sympy expressions (much faster).
+
+    LaurentPolynomials are similarly accumulated into a single term map.
+    """
+    if not terms:
+        return Integer(0)
+
+    if all(isinstance(term, Basic) for term in terms):
+        return Add(*terms)
+
+    if all(isinstance(term, LaurentPolynomial) for term in terms):
+        return LaurentPolynomial.sum(terms)
+
+    return reduce(add, terms)
+
+
+class OneForm:
+    """
+    Linear combination of K 1-forms stored as a sparse {index: coeff} map.
+
+    Zero coefficients are never stored. The coefficients can be sympy expressions or
+    any other type supporting +, - and * (and comparison with 0).
+    """
+
+    __slots__ = ("coeffs",)
+
+    def __init__(self, coeffs: Optional[Mapping[int, Any]] = None):
+        """Create a OneForm from an {index: coeff} map, dropping zero coefficients."""
+        self.coeffs: Dict[int, Any] = {
+            i: c for i, c in (coeffs or {}).items() if c != 0
+        }
+
+    @classmethod
+    def from_expr(cls, expr: Expr) -> "OneForm":
+        """Create a OneForm from a sympy linear combination of K 1-forms."""
+        terms: Dict[int, List[Expr]] = {}
+
+        for term in Add.make_args(expr):
+            coeff, k = term.as_independent(K, as_Add=False)
+
+            if isinstance(k, K):
+                terms.setdefault(k.index, []).append(coeff)
+
+            elif k.has(K):  # Not expanded e.g. x * (K₁ + K₂)
+                for i, c in cls.from_expr(expand(term)).coeffs.items():
+                    terms.setdefault(i, []).append(c)
+
+            elif term != 0:
+                raise ValueError(f"{term} is not a linear combination of K 1-forms")
+
+        return cls({i: sum_coeffs(cs) for i, cs in terms.items()})
+
+    def to_expr(self) -> Expr:
+        """Convert to a sympy linear combination of K 1-forms."""
+        return Add(*(c * K(i) for i, c in sorted(self.coeffs.items())))
+
+    def applyfunc(self, f: Callable[[Any], Any]) -> "OneForm":
+        """Apply a function (e.g. expand) to every coefficient."""
+        return OneForm({i: f(c) for i, c in self.coeffs.items()})
+
+    def wedge(self, other: "OneForm") -> "TwoForm":
+        """
+        Calculate the wedge product with another OneForm.
+
+        (a_i K^i) ∧ (b_j K^j) = (a_i b_j - a_j b_i) K^i ∧ K^j summed over i < j.
+        """
+        terms: Dict[Tuple[int, int], List[Any]] = {}
+
+        for i, a in self.coeffs.items():
+            for j, b in other.coeffs.items():
+                if i < j:
+                    terms.setdefault((i, j), []).append(a * b)
+                elif i > j:
+                    terms.setdefault((j, i), []).append(-(a * b))
+
+        return TwoForm({key: sum_coeffs(cs) for key, cs in terms.items()})
+
+    def __xor__(self, other: "OneForm") -> "TwoForm":
+        """Use ^ as the wedge product."""
+        return self.wedge(other)
+
+    def __add__(self, other: "OneForm") -> "OneForm":
+        if not isinstance(other, OneForm):
+            return NotImplemented
+
+        coeffs = dict(self.coeffs)
+
+        for i, c in other.coeffs.items():
+            coeffs[i] = coeffs[i] + c if i in coeffs else c
+
+        return OneForm(coeffs)
+
+    def __neg__(self) -> "OneForm":
+        return OneForm({i: -c for i, c in self.coeffs.items()})
+
+    def __sub__(self, other: "OneForm") -> "OneForm":
+        if not isinstance(other, OneForm):
+            return NotImplemented
+
+        return self + (-other)
+
+    def __mul__(self, scalar: Any) -> "OneForm":
+        """Multiply all coefficients by a scalar (0-form)."""
+        if isinstance(scalar, (OneForm, TwoForm)):
+            return NotImplemented
+
+        return OneForm({i: c * scalar for i, c in self.coeffs.items()})
+
+    def __rmul__(self, scalar: Any) -> "OneForm":
+        if isinstance(scalar, (OneForm, TwoForm)):
+            return NotImplemented
+
+        return OneForm({i: scalar * c for i, c in self.coeffs.items()})
+
+    def __eq__(self, other: object) -> bool:
+        """Equal when the coefficient maps are equal. A zero form equals 0."""
+        if isinstance(other, OneForm):
+            return self.coeffs == other.coeffs
+
+        if other == 0:
+            return not self.coeffs
+
+        return NotImplemented
+
+    def __bool__(self) -> bool:
+        return bool(self.coeffs)
+
+    def __str__(self) -> str:
+        return str(self.to_expr())
+
+    def __repr__(self) -> str:
+        return f"OneForm({self})"
+
+
+class TwoForm:
+    """
+    Linear combination of K^i ∧ K^j stored as a sparse {(i, j): coeff} map.
+
+    Only i < j is stored: entries with i > j are folded in with a flipped sign and
+    entries with i = j vanish. Zero coefficients are never stored.
+    """
+
+    __slots__ = ("coeffs",)
+
+    def __init__(self, coeffs: Optional[Mapping[Tuple[int, int], Any]] = None):
+        """Create a TwoForm from a {(i, j): coeff} map, putting it in canonical form."""
+        terms: Dict[Tuple[int, int], List[Any]] = {}
+
+        for (i, j), c in (coeffs or {}).items():
+            if i < j:
+                terms.setdefault((i, j), []).append(c)
+            elif i > j:
+                terms.setdefault((j, i), []).append(-c)
+
+        self.coeffs: Dict[Tuple[int, int], Any] = {}
+
+        for key, cs in terms.items():
+            c = cs[0] if len(cs) == 1 else sum_coeffs(cs)
+
+            if c != 0:
+                self.coeffs[key] = c
+
+    @classmethod
+    def from_expr(cls, expr: Expr) -> "TwoForm":
+        """Create a TwoForm from a sympy linear combination of Wedges of K 1-forms."""
+        return cls(wedge_coeffs(expr))
+
+    def to_expr(self) -> Expr:
+        """Convert to a sympy linear combination of Wedges of K 1-forms."""
+        return Add(*(c * Wedge(K(i), K(j)) for (i, j), c in sorted(self.coeffs.items())))
+
+    def coeff(self, c: int, d: int) -> Any:
+        """Coefficient of K^c ∧ K^d (antisymmetric in c and d)."""
+        if c < d:
+            return self.coeffs.get((c, d), Integer(0))
+
+        if c > d:
+            return -self.coeffs.get((d, c), Integer(0))
+
+        return Integer(0)
+
+    def applyfunc(self, f: Callable[[Any], Any]) -> "TwoForm":
+        """Apply a function (e.g. expand) to every coefficient."""
+        return TwoForm({key: f(c) for key, c in self.coeffs.items()})
+
+    def __add__(self, other: "TwoForm") -> "TwoForm":
+        if not isinstance(other, TwoForm):
+            return NotImplemented
+
+        coeffs = dict(self.coeffs)
+
+        for key, c in other.coeffs.items():
+            coeffs[key] = coeffs[key] + c if key in coeffs else c
+
+        return TwoForm(coeffs)
+
+    def __neg__(self) -> "TwoForm":
+        return TwoForm({key: -c for key, c in self.coeffs.items()})
+
+    def __sub__(self, other: "TwoForm") -> "TwoForm":
+        if not isinstance(other, TwoForm):
+            return NotImplemented
+
+        return self + (-other)
+
+    def __mul__(self, scalar: Any) -> "TwoForm":
+        """Multiply all coefficients by a scalar (0-form)."""
+        if isinstance(scalar, (OneForm, TwoForm)):
+            return NotImplemented
+
+        return TwoForm({key: c * scalar for key, c in self.coeffs.items()})
+
+    def __rmul__(self, scalar: Any) -> "TwoForm":
+        if isinstance(scalar, (OneForm, TwoForm)):
+            return NotImplemented
+
+        return TwoForm({key: scalar * c for key, c in self.coeffs.items()})
+
+    def __eq__(self, other: object) -> bool:
+        """Equal when the coefficient maps are equal. A zero form equals 0."""
+        if isinstance(other, TwoForm):
+            return self.coeffs == other.coeffs
+
+        if other == 0:
+            return not self.coeffs
+
+        return NotImplemented
+
+    def __bool__(self) -> bool:
+        return bool(self.coeffs)
+
+    def __str__(self) -> str:
+        return str(self.to_expr())
+
+    def __repr__(self) -> str:
+        return f"TwoForm({self})"
+
+
+# Matrices of forms (e.g. w^a_b, theta^a_b) are stored as nested lists since sympy
+# Arrays only hold sympy objects
+OneFormMatrix = List[List[OneForm]]
+TwoFormMatrix = List[List[TwoForm]]
+
+
+def sum_two_forms(forms: Iterable[TwoForm]) -> TwoForm:
+    """Sum TwoForms collecting all the coefficients of a wedge before adding them."""
+    terms: Dict[Tuple[int, int], List[Any]] = {}
+
+    for form in forms:
+        for key, c in form.coeffs.items():
+            terms.setdefault(key, []).append(c)
+
+    return TwoForm({key: sum_coeffs(cs) for key, cs in terms.items()})
+
+
+def as_two_form(entry: Union[Expr, TwoForm]) -> TwoForm:
+    """Return the entry as a TwoForm, converting from a sympy expression if needed."""
+    if isinstance(entry, TwoForm):
+        return entry
+
+    return TwoForm.from_expr(entry)
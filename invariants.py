@@ -0,0 +1,142 @@
+"""
+Evaluate the invariant Riem_2 / lambda² numerically for batches of Einstein metrics.
+
+The sparse R^a_bcd file of an n is read once and compiled into a list of terms, after
+which Riem_2 = g_aa g^bb g^cc g^dd (R^a_bcd)² is evaluated at any point with mpmath at
+the requested precision. This works equally for rational and irrational solutions
+and never builds a sympy expression.
+"""
+
+import mpmath
+
+from fractions import Fraction
+from sympy import sympify
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from laurent import LaurentPolynomial
+from metric import create_diagonal_metric
+from riemann_io import Index, iter_riemann, riemann_path
+
+
+Exponents = Tuple[int, int, int]
+
+# The terms (x1^e1 x2^e2 x3^e3, q, s) of a single R^a_bcd and the exponents of its
+# weight g_aa g^bb g^cc g^dd
+_Entry = Tuple[List[Tuple[Exponents, Fraction, int]], Exponents]
+
+
+def _weight(categories: Sequence[int], index: Index) -> Exponents:
+    """The exponents of g_aa g^bb g^cc g^dd (every g is one of x1, x2 and x3)."""
+    exponents = [0, 0, 0]
+    a, b, c, d = index
+
+    exponents[categories[a]] += 1
+
+    for i in (b, c, d):
+        exponents[categories[i]] -= 1
+
+    return exponents[0], exponents[1], exponents[2]
+
+
+def _to_mpf(value: Any, dps: int) -> mpmath.mpf:
+    """Convert a number (e.g. a sympy algebraic number) to an mpf of dps digits."""
+    if isinstance(value, mpmath.mpf):
+        return value
+
+    return mpmath.mpf(str(sympify(value).evalf(dps + 5)))
+
+
+class InvariantEvaluator:
+    """The curvature data of SU(n), compiled for numerical evaluation."""
+
+    def __init__(self, n: int, entries: Iterable[Tuple[Index, LaurentPolynomial]]):
+        """
+        Compile the non-zero entries of R^a_bcd.
+
+        Only the entries with c < d are kept, those with c > d are accounted for by
+        doubling since they have the same square.
+        """
+        self.n = n
+
+        # The category (0, 1 or 2) of every index, i.e. which of x1, x2, x3 is its g
+        categories = [c - 1 for c in create_diagonal_metric(n, (1, 2, 3)).entries]
+        self.entries: List[_Entry] = []
+
+        for index, value in entries:
+            if index[2] < index[3]:
+                terms = [
+                    ((e1, e2, e3), q, s) for (e1, e2, e3, s), q in value.terms.items()
+                ]
+                self.entries.append((terms, _weight(categories, index)))
+
+        self._coefficients: Dict[int, List[List[mpmath.mpf]]] = {}
+
+    def coefficients(self, dps: int) -> List[List[mpmath.mpf]]:
+        """The coefficients q sqrt(s) of the terms of every entry (cached per dps)."""
+        if dps not in self._coefficients:
+            with mpmath.workdps(dps):
+                roots: Dict[int, mpmath.mpf] = {}
+
+                self._coefficients[dps] = [
+                    [
+                        mpmath.mpf(q.numerator) / q.denominator
+                        * roots.setdefault(s, mpmath.sqrt(s))
+                        for _, q, s in terms
+                    ]
+                    for terms, _ in self.entries
+                ]
+
+        return self._coefficients[dps]
+
+    @classmethod
+    def from_file(cls, n: int, path: Optional[str] = None) -> "InvariantEvaluator":
+        """Read the entries from the R^a_bcd file (by default riemann_path(n))."""
+        return cls(n, iter_riemann(path if path is not None else riemann_path(n)))
+
+    def riem_2(self, point: Sequence[Any], dps: int = 30) -> mpmath.mpf:
+        """Evaluate Riem_2 at the point (x1, x2, x3) with dps decimal digits."""
+        coefficients = self.coefficients(dps)
+
+        with mpmath.workdps(dps):
+            x = [_to_mpf(value, dps) for value in point]
+
+            powers: Dict[Exponents, mpmath.mpf] = {}
+
+            def monomial(exponents: Exponents) -> mpmath.mpf:
+                if exponents not in powers:
+                    powers[exponents] = mpmath.fprod(
+                        v ** e for v, e in zip(x, exponents)
+                    )
+
+                return powers[exponents]
+
+            total = mpmath.mpf(0)
+
+            for (terms, weight), coefficient in zip(self.entries, coefficients):
+                value = mpmath.fsum(
+                    k * monomial(exponents)
+                    for k, (exponents, _, _) in zip(coefficient, terms)
+                )
+                total += 2 * monomial(weight) * value ** 2
+
+            return +total
+
+    def invariant(
+        self, x1: Any, x2: Any, x3: Any, lmbda: Any, dps: int = 30
+    ) -> mpmath.mpf:
+        """Evaluate Riem_2 / lambda² for a single metric."""
+        with mpmath.workdps(dps):
+            return self.riem_2((x1, x2, x3), dps) / _to_mpf(lmbda, dps) ** 2
+
+    def evaluate(
+        self, solutions: Iterable[Sequence[Any]], dps: int = 30
+    ) -> List[mpmath.mpf]:
+        """Evaluate Riem_2 / lambda² for every (x1, x2, x3, lambda) in solutions."""
+        values = []
+
+        for solution in solutions:
+            x1_v, x2_v, x3_v, lmbda = solution
+            values.append(self.invariant(x1_v, x2_v, x3_v, lmbda, dps))
+
+        return values
+
@@ -0,0 +1,295 @@
+"""
+Laurent polynomials in the metric constants x1, x2 and x3.
+
+Every coefficient in the pipeline is a Laurent polynomial in x1, x2 and x3 (the
+inverse metric only adds 1/x_i factors) whose coefficients are rational multiples of
+square roots (from the structure constants). Storing them as a sparse map
+    (e1, e2, e3, s) -> q   for the term q * sqrt(s) * x1**e1 * x2**e2 * x3**e3
+with s squarefree and q a Fraction keeps them in canonical form at all times, so the
+arithmetic is direct and no expand (or other tree simplification) is needed.
+"""
+
+from fractions import Fraction
+from math import gcd
+from sympy import Add, Basic, Expr, Mul, Rational, Symbol, expand, sqrt, sympify
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from metric import x1, x2, x3
+from surd import Surd, from_surd, to_surd
+
+
+# (e1, e2, e3, s): exponents of x1, x2 and x3 and the squarefree s of sqrt(s)
+Term = Tuple[int, int, int, int]
+
+GENERATORS = (x1, x2, x3)
+
+
+class LaurentPolynomial:
+    """A sparse Laurent polynomial in x1, x2 and x3 with surd coefficients."""
+
+    __slots__ = ("terms",)
+
+    def __init__(self, terms: Optional[Dict[Term, Fraction]] = None):
+        """Create the polynomial from its {term: coefficient} map, dropping zeros."""
+        self.terms: Dict[Term, Fraction] = {
+            term: q for term, q in (terms or {}).items() if q
+        }
+
+    @classmethod
+    def constant(cls, value: Any) -> "LaurentPolynomial":
+        """Create a constant polynomial from an int, Fraction or sympy number."""
+        if isinstance(value, (int, Fraction)):
+            return cls({(0, 0, 0, 1): Fraction(value)})
+
+        return cls({(0, 0, 0, s): q for s, q in to_surd(value).items()})
+
+    @classmethod
+    def generator(cls, i: int) -> "LaurentPolynomial":
+        """Create x1, x2 or x3 (i = 0, 1 or 2)."""
+        e = [0, 0, 0]
+        e[i] = 1
+
+        return cls({(e[0], e[1], e[2], 1): Fraction(1)})
+
+    @classmethod
+    def from_expr(cls, expr: Expr) -> "LaurentPolynomial":
+        """Create the polynomial from a sympy expression."""
+        terms: Dict[Term, Fraction] = {}
+
+        for term in Add.make_args(expand(expr)):
+            coeff, monomial = term.as_independent(*GENERATORS, as_Add=False)
+            powers = monomial.as_powers_dict()
+
+            if set(powers) - set(GENERATORS) - {1}:
+                raise ValueError(f"{term} is not a Laurent monomial in x1, x2 and x3")
+
+            e1, e2, e3 = (int(powers.get(x, 0)) for x in GENERATORS)
+
+            for s, q in to_surd(coeff).items():
+                key = (e1, e2, e3, s)
+                terms[key] = terms.get(key, Fraction(0)) + q
+
+        return cls(terms)
+
+    @classmethod
+    def sum(cls, polynomials: Iterable["LaurentPolynomial"]) -> "LaurentPolynomial":
+        """Sum several polynomials accumulating into a single map."""
+        terms: Dict[Term, Fraction] = {}
+
+        for polynomial in polynomials:
+            for term, q in polynomial.terms.items():
+                terms[term] = terms.get(term, Fraction(0)) + q
+
+        return cls(terms)
+
+    def to_expr(self) -> Expr:
+        """Convert to a sympy expression."""
+        return Add(
+            *(
+                Mul(
+                    Rational(q.numerator, q.denominator),
+                    sqrt(s),
+                    *(x ** e for x, e in zip(GENERATORS, term)),
+                )
+                for (*term, s), q in sorted(self.terms.items())
+            )
+        )
+
+    def evaluate(self, point: Mapping[Symbol, Any]) -> Expr:
+        """
+        Evaluate at a point {x1: value, x2: value, x3: value}.
+
+        Rational values are evaluated exactly with Fractions.
+        """
+        values = [sympify(point[x]) for x in GENERATORS]
+
+        if not all(value.is_Rational for value in values):
+            return Add(
+                *(self._evaluate_term(term, q, values) for term, q in self.terms.items())
+            )
+
+        f1, f2, f3 = (Fraction(int(v.p), int(v.q)) for v in values)
+        surd: Surd = {}
+
+        for (e1, e2, e3, s), q in self.terms.items():
+            surd[s] = surd.get(s, Fraction(0)) + q * f1 ** e1 * f2 ** e2 * f3 ** e3
+
+        return from_surd(surd)
+
+    @staticmethod
+    def _evaluate_term(term: Term, q: Fraction, values: List[Expr]) -> Expr:
+        """Evaluate a single term q sqrt(s) x1^e1 x2^e2 x3^e3 with sympy."""
+        *exponents, s = term
+
+        return Mul(
+            Rational(q.numerator, q.denominator),
+            sqrt(s),
+            *(v ** e for v, e in zip(values, exponents)),
+        )
+
+    def is_monomial(self) -> bool:
+        """True for a single term."""
+        return len(self.terms) == 1
+
+    def inverse(self) -> "LaurentPolynomial":
+        """Calculate 1 / self, which is only a Laurent polynomial for monomials."""
+        if not self.is_monomial():
+            raise ValueError(f"{self} is not a monomial so it has no Laurent inverse")
+
+        [((e1, e2, e3, s), q)] = self.terms.items()
+
+        # 1 / (q sqrt(s)) = sqrt(s) / (q s)
+        return LaurentPolynomial({(-e1, -e2, -e3, s): 1 / (q * s)})
+
+    def __add__(self, other: Any) -> "LaurentPolynomial":
+        coerced = _coerce(other)
+
+        if coerced is None:
+            return NotImplemented
+
+        terms = dict(self.terms)
+
+        for term, q in coerced.terms.items():
+            terms[term] = terms.get(term, Fraction(0)) + q
+
+        return LaurentPolynomial(terms)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> "LaurentPolynomial":
+        return LaurentPolynomial({term: -q for term, q in self.terms.items()})
+
+    def __sub__(self, other: Any) -> "LaurentPolynomial":
+        coerced = _coerce(other)
+
+        if coerced is None:
+            return NotImplemented
+
+        return self + (-coerced)
+
+    def __rsub__(self, other: Any) -> "LaurentPolynomial":
+        coerced = _coerce(other)
+
+        if coerced is None:
+            return NotImplemented
+
+        return coerced + (-self)
+
+    def __mul__(self, other: Any) -> "LaurentPolynomial":
+        """Multiply term by term, sqrt(a) sqrt(b) = g sqrt(ab / g²) for g = gcd(a, b)."""
+        coerced = _coerce(other)
+
+        if coerced is None:
+            return NotImplemented
+
+        terms: Dict[Term, Fraction] = {}
+
+        for (a1, a2, a3, s), p in self.terms.items():
+            for (b1, b2, b3, t), q in coerced.terms.items():
+                g = gcd(s, t)
+                key = (a1 + b1, a2 + b2, a3 + b3, (s // g) * (t // g))
+                terms[key] = terms.get(key, Fraction(0)) + p * q * g
+
+        return LaurentPolynomial(terms)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Any) -> "LaurentPolynomial":
+        """Divide by a number or a monomial."""
+        coerced = _coerce(other)
+
+        if coerced is None:
+            return NotImplemented
+
+        return self * coerced.inverse()
+
+    def __rtruediv__(self, other: Any) -> "LaurentPolynomial":
+        coerced = _coerce(other)
+
+        if coerced is None:
+            return NotImplemented
+
+        return coerced * self.inverse()
+
+    def __pow__(self, exponent: int) -> "LaurentPolynomial":
+        if exponent < 0:
+            return self.inverse() ** -exponent
+
+        result = LaurentPolynomial.constant(1)
+
+        for _ in range(exponent):
+            result = result * self
+
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        """Equal when the term maps are equal (also against numbers and sympy)."""
+        if isinstance(other, int) and other == 0:  # The common case: a zero check
+            return not self.terms
+
+        try:
+            coerced = _coerce(other)
+        except ValueError:  # Not a Laurent polynomial so can't be equal
+            return False
+
+        if coerced is None:
+            return NotImplemented
+
+        return self.terms == coerced.terms
+
+    def __hash__(self) -> int:
+        """Rational constants hash like the numbers they are equal to (see __eq__)."""
+        if not self.terms:
+            return hash(0)
+
+        if len(self.terms) == 1 and (0, 0, 0, 1) in self.terms:
+            return hash(self.terms[0, 0, 0, 1])
+
+        return hash(frozenset(self.terms.items()))
+
+    def __bool__(self) -> bool:
+        return bool(self.terms)
+
+    def __str__(self) -> str:
+        return str(self.to_expr())
+
+    def __repr__(self) -> str:
+        return f"LaurentPolynomial({self})"
+
+
+def _coerce(value: Any) -> Optional[LaurentPolynomial]:
+    """Convert numbers and sympy expressions to LaurentPolynomials (None otherwise)."""
+    if isinstance(value, LaurentPolynomial):
+        return value
+
+    if isinstance(value, (int, Fraction)):
+        return LaurentPolynomial.constant(value)
+
+    if isinstance(value, Basic):
+        if value.is_Rational:  # Avoid expanding plain numbers (e.g. zeros)
+            return LaurentPolynomial.constant(Fraction(int(value.p), int(value.q)))
+
+        return LaurentPolynomial.from_expr(value)
+
+    return None
+
+
+def laurent_generators() -> Tuple[LaurentPolynomial, ...]:
+    """The metric constants x1, x2 and x3 as LaurentPolynomials."""
+    return tuple(LaurentPolynomial.generator(i) for i in range(3))
+
+
+def expand_coeff(coeff: Any) -> Any:
+    """Expand a coefficient: a no-op for LaurentPolynomials which are always expanded."""
+    if isinstance(coeff, LaurentPolynomial):
+        return coeff
+
+    return expand(coeff)
+
+
+def as_expr(coeff: Any) -> Expr:
+    """Return the coefficient as a sympy expression."""
+    if isinstance(coeff, LaurentPolynomial):
+        return coeff.to_expr()
+
+    return coeff
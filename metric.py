@@ -1,8 +1,11 @@
 """Create the metric tensor and its inverse in the K 1-form space."""
 
-from sympy import Array, Symbol
-from sympy.matrices import eye
-from typing import Tuple
+from itertools import product
+from sympy import Array, Expr, Symbol
+from sympy.matrices import diag
+from typing import Any, Optional, Sequence, Tuple, Union
+
+from symmetric import SymmetricTensor
 
 
 # Create the metric constants (one for each category for the K 1-forms)
@@ -11,25 +14,146 @@ x2 = Symbol("x₂")
 x3 = Symbol("x₃")
 
 
-def create_metric(n: int) -> Tuple[Array, Array]:
-    """Create the metric tensor and its inverse in the K 1-form space for SU(n)."""
-    dim = n ** 2 - 1  # Dimension of the space
-    m = int(n * (n - 1) / 2)  # Size of categories 1 and 2
+class DiagonalMetric:
+    """
+    A diagonal metric stored as its diagonal entries (and their inverses).
+
+    Raising or lowering an index is then a per-index scaling of the tensor along that
+    axis rather than a tensor product followed by a contraction, which is O(dim^r)
+    instead of O(dim^(r + 2)) for a rank r tensor.
+    """
+
+    __slots__ = ("entries", "inverse_entries")
+
+    def __init__(
+        self, entries: Sequence[Any], inverse_entries: Optional[Sequence[Any]] = None
+    ):
+        """
+        Create the metric from its diagonal entries.
+
+        :param entries: The diagonal entries g_aa
+        :param inverse_entries: The diagonal entries g^aa (calculated if not given)
+        """
+        self.entries = tuple(entries)
+        self.inverse_entries = (
+            tuple(inverse_entries)
+            if inverse_entries is not None
+            else tuple(1 / e for e in self.entries)
+        )
+
+    @property
+    def dim(self) -> int:
+        """Dimension of the space."""
+        return len(self.entries)
+
+    @property
+    def g_dd(self) -> Array:
+        """The dense metric tensor."""
+        return Array(diag(*self.entries))
+
+    @property
+    def g_uu(self) -> Array:
+        """The dense inverse metric tensor."""
+        return Array(diag(*self.inverse_entries))
+
+    def subs(self, *args: Any) -> "DiagonalMetric":
+        """Substitute into the entries (same arguments as sympy's subs)."""
+        return DiagonalMetric(
+            [e.subs(*args) for e in self.entries],
+            [e.subs(*args) for e in self.inverse_entries],
+        )
+
+    def lower_index(
+        self, tensor: Union[Array, SymmetricTensor], axis: int
+    ) -> Union[Array, SymmetricTensor]:
+        """Lower the index of the tensor at the specified axis (in place of the axis)."""
+        return scale_index(tensor, axis, self.entries)
+
+    def raise_index(
+        self, tensor: Union[Array, SymmetricTensor], axis: int
+    ) -> Union[Array, SymmetricTensor]:
+        """Raise the index of the tensor at the specified axis (in place of the axis)."""
+        return scale_index(tensor, axis, self.inverse_entries)
+
+
+def scale_index(
+    tensor: Union[Array, SymmetricTensor], axis: int, weights: Sequence[Any]
+) -> Union[Array, SymmetricTensor]:
+    """
+    Multiply every entry of the tensor by the weight of its index along the axis.
+
+    This is the contraction of the axis with a diagonal matrix of the weights.
+    """
+    if isinstance(tensor, SymmetricTensor):
+        return tensor.scale_index(axis, weights)
+
+    shape = tensor.shape
+    entries = [
+        tensor[index] * weights[index[axis]] if tensor[index] != 0 else tensor[index]
+        for index in product(*(range(s) for s in shape))
+    ]
 
-    # Start with a diagonal matrix
-    e = eye(dim)
-    ei = eye(dim)
+    return Array(entries, shape)
 
-    for i in range(m):
-        e[i, i] = x1
-        ei[i, i] = 1 / x1
 
-        e[m + i, m + i] = x2
-        ei[m + i, m + i] = 1 / x2
+def _diagonal_entries(g: Array) -> Tuple[Expr, ...]:
+    """Extract the diagonal entries of a metric, verifying that it is diagonal."""
+    dim = g.shape[0]
 
-    for i in range(n - 1):  # Category 3 K 1-forms are (n - 1) in number after you
-        # ignore the K_{n**2} 1-form which is NOT a part of SU(n)
-        e[2 * m + i, 2 * m + i] = x3
-        ei[2 * m + i, 2 * m + i] = 1 / x3
+    if any(g[i, j] != 0 for i, j in product(range(dim), repeat=2) if i != j):
+        raise ValueError("The metric is not diagonal")
+
+    return tuple(g[i, i] for i in range(dim))
+
+
+def as_diagonal_metric(
+    g_dd: Union[Array, DiagonalMetric, None] = None,
+    g_uu: Union[Array, DiagonalMetric, None] = None,
+) -> DiagonalMetric:
+    """
+    Convert the dense metric tensor and/or its inverse to a DiagonalMetric.
+
+    A DiagonalMetric passed as either argument is returned as is.
+    """
+    if isinstance(g_dd, DiagonalMetric):
+        return g_dd
+
+    if isinstance(g_uu, DiagonalMetric):
+        return g_uu
+
+    entries = _diagonal_entries(g_dd) if g_dd is not None else None
+    inverse_entries = _diagonal_entries(g_uu) if g_uu is not None else None
+
+    if entries is None:
+        if inverse_entries is None:
+            raise ValueError("At least one of g_dd and g_uu must be specified")
+
+        entries = tuple(1 / e for e in inverse_entries)
+
+    return DiagonalMetric(entries, inverse_entries)
+
+
+def create_diagonal_metric(
+    n: int, constants: Sequence[Any] = (x1, x2, x3)
+) -> DiagonalMetric:
+    """
+    Create the diagonal metric in the K 1-form space for SU(n).
+
+    :param constants: The metric constants of the three categories of K 1-forms
+                      (e.g. x1, x2, x3 as LaurentPolynomials)
+    """
+    m = int(n * (n - 1) / 2)  # Size of categories 1 and 2
+    g1, g2, g3 = constants
+
+    # Category 3 K 1-forms are (n - 1) in number after you ignore the K_{n**2} 1-form
+    # which is NOT a part of SU(n)
+    return DiagonalMetric(
+        [*(g1 for _ in range(m)), *(g2 for _ in range(m)), *(g3 for _ in range(n - 1))]
+    )
+
+
+def create_metric(n: int) -> Tuple[Array, Array]:
+    """Create the metric tensor and its inverse in the K 1-form space for SU(n)."""
+    metric = create_diagonal_metric(n)
 
-    return Array(e), Array(ei)
+    return metric.g_dd, metric.g_uu
@@ -0,0 +1,173 @@
+"""
+Solve the Einstein equations numerically with batched multi-start Newton iterations.
+
+With x3 normalized to 1 the Einstein condition R_ii = lambda x_i reduces to the two
+equations lambda_1 = lambda_3 and lambda_2 = lambda_3 in x1 and x2, where
+lambda_i = R_ii / x_i. Newton's method is run from many starting points at once with
+NumPy, using the Jacobian derived symbolically from the Ricci elements. The converged
+positive solutions are deduplicated and can then be confirmed exactly by rational
+reconstruction.
+"""
+
+import numpy as np
+
+from fractions import Fraction
+from sympy import Expr, Matrix, Rational, lambdify
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from elimination import einstein_polynomials
+from metric import x1, x2
+
+
+class Solution(NamedTuple):
+    """An Einstein metric (with x3 = 1) and its lambda."""
+
+    x1: float
+    x2: float
+    lmbda: float
+    exact: Optional[Tuple[Rational, Rational, Rational]]  # (x1, x2, lambda) if rational
+
+
+class Equations(NamedTuple):
+    """The compiled residuals, their Jacobian and lambda as functions of x1 and x2."""
+
+    residuals: Callable[[np.ndarray, np.ndarray], List[np.ndarray]]
+    jacobian: Callable[[np.ndarray, np.ndarray], List[List[np.ndarray]]]
+    lmbda: Callable[[np.ndarray, np.ndarray], np.ndarray]
+    exprs: Tuple[Expr, Expr, Expr]  # The residuals and lambda as expressions
+
+
+def create_equations(elements: Sequence[Expr]) -> Equations:
+    """Compile the equations from the 3 unique elements of the Ricci tensor."""
+    # Use the numerators of lambda_i - lambda_3 (without any monomial factor) since the
+    # rational residuals vanish as x1 and x2 go to infinity, attracting Newton there
+    p1, p2, lmbda = einstein_polynomials(elements)
+
+    residuals = Matrix([p1, p2])
+    jacobian = residuals.jacobian([x1, x2])
+
+    return Equations(
+        lambdify((x1, x2), list(residuals), modules="numpy", cse=True),
+        lambdify((x1, x2), jacobian.tolist(), modules="numpy", cse=True),
+        lambdify((x1, x2), lmbda, modules="numpy"),
+        (p1, p2, lmbda),
+    )
+
+
+def newton(
+    equations: Equations,
+    x1_s: np.ndarray,
+    x2_s: np.ndarray,
+    iterations: int = 50,
+    tol: float = 1e-12,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run Newton's method from all the starting points (x1_s[i], x2_s[i]) at once.
+
+    Returns the final x1 and x2 and a mask of the points which converged to a
+    solution with positive metric constants.
+    """
+    X = np.array([x1_s, x2_s], dtype=float)
+
+    with np.errstate(all="ignore"):
+        for _ in range(iterations):
+            # Broadcast against X so constant entries are evaluated at every point
+            F = np.array(np.broadcast_arrays(*equations.residuals(*X), X[0])[:2])
+            J = np.array(
+                [np.broadcast_arrays(*row, X[0])[:2] for row in equations.jacobian(*X)]
+            )
+
+            # Solve the 2x2 systems J dX = F explicitly for every point
+            det = J[0, 0] * J[1, 1] - J[0, 1] * J[1, 0]
+            dX = np.array(
+                [
+                    (J[1, 1] * F[0] - J[0, 1] * F[1]) / det,
+                    (J[0, 0] * F[1] - J[1, 0] * F[0]) / det,
+                ]
+            )
+            X = X - dX
+
+            # Newton converges quadratically so a tiny step means a (simple) root
+            small = (np.abs(dX) <= tol * (1 + np.abs(X))).all(axis=0)
+
+            if np.all(small | ~np.isfinite(X).all(axis=0)):
+                break
+
+    converged = small & np.isfinite(X).all(axis=0)
+
+    # Roots on the boundary x1 = 0 or x2 = 0 are degenerate, not metrics
+    positive = X.min(axis=0) > np.sqrt(tol)
+
+    return X[0], X[1], converged & positive
+
+
+def deduplicate(
+    x1_s: np.ndarray, x2_s: np.ndarray, tol: float = 1e-8
+) -> List[Tuple[float, float]]:
+    """Merge the points closer than tol (relative) to one another, sorted."""
+    unique: List[Tuple[float, float]] = []
+
+    for point in sorted(zip(x1_s.tolist(), x2_s.tolist())):
+        if not any(
+            all(abs(p - q) <= tol * (1 + abs(q)) for p, q in zip(point, other))
+            for other in unique
+        ):
+            unique.append(point)
+
+    return unique
+
+
+def confirm(
+    equations: Equations, x1_s: float, x2_s: float, max_denominator: int = 10 ** 6
+) -> Optional[Tuple[Rational, Rational, Rational]]:
+    """
+    Reconstruct a rational solution near (x1_s, x2_s) and check it exactly.
+
+    Returns (x1, x2, lambda) if the reconstructed point solves the equations exactly,
+    otherwise None (e.g. for solutions which are irrational).
+    """
+    point = {
+        x: Rational(Fraction(value).limit_denominator(max_denominator))
+        for x, value in ((x1, x1_s), (x2, x2_s))
+    }
+    residual_1, residual_2, lmbda = equations.exprs
+
+    if residual_1.subs(point) != 0 or residual_2.subs(point) != 0:
+        return None
+
+    return point[x1], point[x2], lmbda.subs(point)
+
+
+def solve(
+    elements: Sequence[Expr],
+    starts: int = 4096,
+    bounds: Tuple[float, float] = (1e-2, 1e1),
+    seed: int = 0,
+    exact: bool = True,
+) -> List[Solution]:
+    """
+    Find the Einstein metrics from starting points sampled log-uniformly in bounds.
+
+    :param elements: The 3 unique elements of the Ricci tensor
+    :param starts: The number of starting points
+    :param bounds: The range of x1 and x2 of the starting points
+    :param seed: Seed of the random starting points
+    :param exact: Whether to confirm the solutions exactly by rational reconstruction
+    """
+    equations = create_equations(elements)
+
+    rng = np.random.default_rng(seed)
+    low, high = np.log(bounds)
+    x1_0, x2_0 = np.exp(rng.uniform(low, high, (2, starts)))
+
+    x1_s, x2_s, converged = newton(equations, x1_0, x2_0)
+
+    solutions = []
+
+    for x1_v, x2_v in deduplicate(x1_s[converged], x2_s[converged]):
+        lmbda = float(equations.lmbda(np.array(x1_v), np.array(x2_v)))
+        rational = confirm(equations, x1_v, x2_v) if exact else None
+
+        solutions.append(Solution(x1_v, x2_v, lmbda, rational))
+
+    return solutions
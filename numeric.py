@@ -0,0 +1,197 @@
+"""
+Purely numerical curvature of SU(n) for large n, batched over many metrics.
+
+The same sequence as the symbolic pipeline (c_ddd, w_ud, theta_ud and R^a_bcd) is
+carried out on sparse COO tensors with NumPy, with every value a row of S floats,
+one per metric sample. The structure constants are the only symbolic input. The
+Riemann tensor is never stored in full: it is built for a chunk of its first index
+at a time and reduced straight to the Ricci tensor and the curvature invariants, so
+memory stays bounded for n up to around 20.
+"""
+
+import numpy as np
+
+from functools import lru_cache
+from typing import NamedTuple, Sequence, Tuple
+
+from metric import create_diagonal_metric
+from ricci import representative_indices
+from structure_constants import create_c_table
+
+
+class Sparse(NamedTuple):
+    """A sparse tensor: the indices (nnz, rank) of the entries and their values."""
+
+    indices: np.ndarray
+    values: np.ndarray  # (nnz,) or (nnz, S) for a batch of S samples
+
+
+class Curvature(NamedTuple):
+    """The curvature of a batch of S metrics."""
+
+    ricci: np.ndarray  # R_ab, shape (S, dim, dim)
+    Riem_2: np.ndarray  # R_abcd R^abcd, shape (S,)
+    Ric_2: np.ndarray  # R_ab R^ab, shape (S,)
+    scalar: np.ndarray  # g^ab R_ab, shape (S,)
+
+
+@lru_cache(maxsize=None)
+def structure_constants(n: int) -> Sparse:
+    """The non-zero c_ab^c of SU(n) as a sparse tensor indexed (a, b, c) (cached)."""
+    table = create_c_table(n)
+
+    return Sparse(
+        np.array(list(table.keys()), dtype=np.int64).reshape(-1, 3),
+        np.array([float(value) for value in table.values()]),
+    )
+
+
+def categories(n: int) -> np.ndarray:
+    """The category (0, 1 or 2) of each index, i.e. which of x1, x2 and x3 is g_aa."""
+    return np.array(create_diagonal_metric(n, (1, 2, 3)).entries, dtype=np.int64) - 1
+
+
+def metric_entries(n: int, samples: np.ndarray) -> np.ndarray:
+    """The diagonal g_aa of every sample (x1, x2, x3), shape (dim, S)."""
+    return np.asarray(samples, dtype=float)[:, categories(n)].T
+
+
+def coalesce(indices: np.ndarray, values: np.ndarray, shape: Sequence[int]) -> Sparse:
+    """Sum the values of repeated indices, dropping the entries which are all zero."""
+    if not len(indices):
+        return Sparse(indices, values)
+
+    linear = np.ravel_multi_index(tuple(indices.T), tuple(shape))
+    order = np.argsort(linear, kind="stable")
+    linear = linear[order]
+
+    starts = np.flatnonzero(np.r_[True, linear[1:] != linear[:-1]])
+    summed = np.add.reduceat(values[order], starts, axis=0)
+
+    nonzero = summed != 0
+    keep = nonzero.any(axis=1) if summed.ndim > 1 else nonzero
+
+    return Sparse(indices[order][starts][keep], summed[keep])
+
+
+def join(a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find all the pairs (i, j) with a[i] == b[j].
+
+    This is the sparse analogue of contracting two tensors on an index.
+    """
+    order = np.argsort(b, kind="stable")
+    keys = b[order]
+
+    low = np.searchsorted(keys, a, side="left")
+    counts = np.searchsorted(keys, a, side="right") - low
+
+    i = np.repeat(np.arange(len(a)), counts)
+    offsets = np.arange(len(i)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    return i, order[np.repeat(low, counts) + offsets]
+
+
+def create_w_ud(c: Sparse, g: np.ndarray) -> Sparse:
+    """
+    Create w^a_b,e, the components of the connection 1-forms w^a_b = w^a_b,e K^e.
+
+    With c_abc = g_cc c_ab^c, w_ab,e = 1/2 (c_abe + c_aeb + c_eba) and then the first
+    index is raised.
+    """
+    dim = g.shape[0]
+    i, j, k = c.indices.T
+
+    c_ddd = c.values[:, None] * g[k]
+
+    # Each c_ijk appears in w_ab,e as (a, b, e) = (i, j, k), (i, k, j) and (k, j, i)
+    indices = np.concatenate(
+        [np.stack(p, axis=1) for p in ((i, j, k), (i, k, j), (k, j, i))]
+    )
+    w_dd = coalesce(indices, np.concatenate([c_ddd] * 3) / 2, (dim,) * 3)
+
+    return Sparse(w_dd.indices, w_dd.values / g[w_dd.indices[:, 0]])
+
+
+def create_R_uddd(c: Sparse, w_ud: Sparse, rows: np.ndarray, dim: int) -> Sparse:
+    """
+    Create the non-zero R^a_bcd with a in rows.
+
+    theta^a_b = dw^a_b + w^a_e ∧ w^e_b has components
+        theta^a_b,cd = -c_cd^e w^a_b,e + w^a_e,c w^e_b,d - w^a_e,d w^e_b,c
+    and R^a_bcd = theta^a_b,cd / 2 as in ricci.create_R_uddd.
+    """
+    selected = np.isin(w_ud.indices[:, 0], rows)
+    w = Sparse(w_ud.indices[selected], w_ud.values[selected])
+
+    # dw^a_b = w^a_b,e dK^e with dK^e = -1/2 c_cd^e K^c ∧ K^d, joined on e
+    i, j = join(w.indices[:, 2], c.indices[:, 2])
+    a, b = w.indices[i, :2].T
+    cc, d = c.indices[j, :2].T
+    dw_indices = np.stack([a, b, cc, d], axis=1)
+    dw_values = -w.values[i] * c.values[j, None]
+
+    # w^a_e ∧ w^e_b, joined on e, with both orders of the 1-form indices
+    i, j = join(w.indices[:, 1], w_ud.indices[:, 0])
+    a, cc = w.indices[i, 0], w.indices[i, 2]
+    b, d = w_ud.indices[j, 1], w_ud.indices[j, 2]
+    products = w.values[i] * w_ud.values[j]
+
+    wedge_indices = np.concatenate(
+        [np.stack([a, b, cc, d], axis=1), np.stack([a, b, d, cc], axis=1)]
+    )
+    wedge_values = np.concatenate([products, -products])
+
+    theta = coalesce(
+        np.concatenate([dw_indices, wedge_indices]),
+        np.concatenate([dw_values, wedge_values]),
+        (dim,) * 4,
+    )
+
+    return Sparse(theta.indices, theta.values / 2)
+
+
+def curvature(n: int, samples: np.ndarray, chunk: int = 8) -> Curvature:
+    """
+    Calculate the Ricci tensor and the curvature invariants of a batch of metrics.
+
+    :param n: Calculate for SU(n)
+    :param samples: The metric constants (x1, x2, x3) of every sample, shape (S, 3)
+    :param chunk: The number of values of the first index of R^a_bcd built at a time
+    """
+    samples = np.atleast_2d(np.asarray(samples, dtype=float))
+    dim = n ** 2 - 1
+    S = samples.shape[0]
+
+    g = metric_entries(n, samples)
+    g_inv = 1 / g
+
+    c = structure_constants(n)
+    w_ud = create_w_ud(c, g)
+
+    ricci = np.zeros((dim, dim, S))
+    Riem_2 = np.zeros(S)
+
+    for start in range(0, dim, chunk):
+        R = create_R_uddd(c, w_ud, np.arange(start, min(start + chunk, dim)), dim)
+        a, b, cc, d = R.indices.T
+
+        # R_abcd R^abcd = g_aa g^bb g^cc g^dd (R^a_bcd)²
+        Riem_2 += np.sum(g[a] * g_inv[b] * g_inv[cc] * g_inv[d] * R.values ** 2, axis=0)
+
+        # R_bd = R^a_bad
+        trace = a == cc
+        np.add.at(ricci, (b[trace], d[trace]), R.values[trace])
+
+    Ric_2 = np.einsum("bds,bs,ds->s", ricci ** 2, g_inv, g_inv)
+    scalar = np.einsum("bbs,bs->s", ricci, g_inv)
+
+    return Curvature(np.moveaxis(ricci, -1, 0), Riem_2, Ric_2, scalar)
+
+
+def representative_ricci(n: int, samples: np.ndarray, chunk: int = 8) -> np.ndarray:
+    """The 3 unique elements of the Ricci tensor of every sample, shape (S, 3)."""
+    indices = list(representative_indices(n))
+    ricci = curvature(n, samples, chunk).ricci
+
+    return ricci[:, indices, indices]
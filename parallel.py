@@ -0,0 +1,111 @@
+"""
+Parallel map over the entries of the tensor stages.
+
+The stages are embarrassingly parallel maps over tensor entries so they are spread
+over a pool of processes. The mapped function must be defined at module level (so
+it pickles by reference) and takes the shared state of the stage (e.g. the w_ud
+matrix) and one item. The shared state is sent to each worker once, when the pool
+starts, rather than with every chunk of items.
+
+The number of workers (and the chunk size) can be set with configure, or with the
+SUN_WORKERS (and SUN_CHUNKSIZE) environment variables, and default to a single
+worker which runs the map serially in the current process.
+"""
+
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from sympy import Array
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_workers: Optional[int] = None
+_chunksize: Optional[int] = None
+
+# The shared state of the stage being mapped, set in each worker by _initialize
+_shared: Any = None
+
+
+def configure(workers: Optional[int] = None, chunksize: Optional[int] = None) -> None:
+    """
+    Set the default number of workers and chunk size used by pmap.
+
+    None falls back on the environment variables (and then on the defaults).
+    """
+    global _workers, _chunksize
+
+    _workers = workers
+    _chunksize = chunksize
+
+
+def worker_count(workers: Optional[int] = None) -> int:
+    """Resolve the number of workers: argument, configure, SUN_WORKERS then 1."""
+    for value in (workers, _workers, os.environ.get("SUN_WORKERS")):
+        if value is not None:
+            return max(1, int(value))
+
+    return 1
+
+
+def _resolve_chunksize(chunksize: Optional[int], items: int, workers: int) -> int:
+    """Resolve the chunk size, by default splitting the items into 4 chunks a worker."""
+    for value in (chunksize, _chunksize, os.environ.get("SUN_CHUNKSIZE")):
+        if value is not None:
+            return max(1, int(value))
+
+    return max(1, -(-items // (4 * workers)))
+
+
+def _initialize(shared: Any) -> None:
+    """Store the shared state of the stage in the worker."""
+    global _shared
+
+    _shared = shared
+
+
+def _call(func: Callable[[Any, T], R], item: T) -> R:
+    """Call the mapped function in the worker with the shared state."""
+    return func(_shared, item)
+
+
+def pmap(
+    func: Callable[[Any, T], R],
+    items: Iterable[T],
+    shared: Any = None,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> List[R]:
+    """
+    Calculate [func(shared, item) for item in items] over a pool of processes.
+
+    :param func: A module level function of (shared, item)
+    :param items: The items to map over
+    :param shared: The state shared by all items, sent once to every worker
+    :param workers: The number of processes (see worker_count)
+    :param chunksize: The number of items sent to a worker at a time
+    """
+    items = list(items)
+    workers = min(worker_count(workers), len(items))
+
+    if workers <= 1:
+        return [func(shared, item) for item in items]
+
+    chunksize = _resolve_chunksize(chunksize, len(items), workers)
+
+    with ProcessPoolExecutor(
+        workers, initializer=_initialize, initargs=(shared,)
+    ) as pool:
+        return list(pool.map(_call, [func] * len(items), items, chunksize=chunksize))
+
+
+def _apply(func: Callable[[Any], Any], entry: Any) -> Any:
+    """Call the function shared by the stage on the entry."""
+    return func(entry)
+
+
+def papplyfunc(array: Array, func: Callable[[Any], Any]) -> Array:
+    """Apply a (module level) function to every entry of an Array using pmap."""
+    return Array(pmap(_apply, Array(array).reshape(len(array)), func), array.shape)
@@ -0,0 +1,377 @@
+"""
+Reconstruct the Ricci tensor from its exact values at rational points.
+
+Building the Ricci tensor symbolically suffers from expression swell, while at a
+rational point (x1, x2, x3) every quantity of the pipeline is a plain rational (or a
+sum of rational multiples of square roots for the structure constants). So the three
+unique elements are evaluated exactly at many points, which is embarrassingly
+parallel (see parallel.pmap), and then reconstructed as rational functions with a
+monomial denominator:
+
+1. The elements are homogeneous of degree 0 (the Ricci tensor does not change when
+   the metric is scaled) so x3 = 1 and the last variable is restored at the end.
+2. The exponents of every variable, and the total degrees, are found by
+   interpolating along lines through generic points, which gives the denominator and
+   a small set of candidate monomials of the numerator.
+3. The coefficients of those monomials solve an exact linear system.
+4. The result is verified at fresh random points, with x3 != 1.
+"""
+
+import random
+
+from fractions import Fraction
+from itertools import product
+from sympy import Expr, Rational, Symbol, factor
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from metric import create_diagonal_metric, x1, x2, x3
+from parallel import pmap
+from ricci import representative_indices
+from structure_constants import create_c_table
+from surd import Surd, surd_mul, surd_scale, surd_sum, to_surd
+
+
+Point = Tuple[Fraction, ...]
+
+# Evaluates the components at every point: [[f_1(p), ..., f_k(p)] for p in points]
+Evaluate = Callable[[Sequence[Point]], List[List[Fraction]]]
+
+# The exponents (e_1, ..., e_v) of a monomial keyed to its coefficient
+Polynomial = Dict[Tuple[int, ...], Fraction]
+
+
+class Structure(NamedTuple):
+    """The data of SU(n) shared by the evaluations at every point."""
+
+    c: Dict[Tuple[int, int, int], Surd]  # The non-zero c_ab^c
+    labels: Tuple[int, ...]  # The metric constant of every index (0, 1 or 2)
+    rows: Tuple[int, ...]  # The b of the R_bb to evaluate
+
+
+def create_structure(n: int) -> Structure:
+    """Create the shared data for the representative elements of SU(n)."""
+    return Structure(
+        {key: to_surd(value) for key, value in create_c_table(n).items()},
+        tuple(e - 1 for e in create_diagonal_metric(n, (1, 2, 3)).entries),
+        representative_indices(n),
+    )
+
+
+def create_R_dd_at(
+    structure: Structure, point: Point, rows: Optional[Sequence[int]] = None
+) -> Dict[Tuple[int, int], Fraction]:
+    """
+    Calculate the non-zero R_bd (b in rows, all by default) exactly at (x1, x2, x3).
+
+    The same contractions as ricci.create_R_dd_structure:
+        2 R_bd = - c_ad^e w^a_b,e + w^a_e,a w^e_b,d - w^a_e,d w^e_b,a
+    but with exact arithmetic instead of sympy.
+    """
+    g = [Fraction(point[label]) for label in structure.labels]
+    selected = None if rows is None else set(rows)
+
+    # w^a_b,e = g^aa 1/2 (c_abe + c_aeb + c_eba) with c_abc = g_cc c_ab^c
+    w_terms: Dict[Tuple[int, int, int], List[Surd]] = {}
+
+    for (i, j, k), value in structure.c.items():
+        for a, b, e in ((i, j, k), (i, k, j), (k, j, i)):
+            term = surd_scale(value, g[k] / (2 * g[a]))
+            w_terms.setdefault((a, b, e), []).append(term)
+
+    w = {index: surd_sum(terms) for index, terms in w_terms.items()}
+    w = {index: value for index, value in w.items() if value}
+
+    # Index the entries of w by (a, e) for the contractions, keeping only b in rows
+    w_by_ae: Dict[Tuple[int, int], List[Tuple[int, Surd]]] = {}
+    trace: Dict[int, List[Surd]] = {}
+
+    for (a, b, e), value in w.items():
+        if selected is None or b in selected:
+            w_by_ae.setdefault((a, e), []).append((b, value))
+
+        if e == a:
+            trace.setdefault(b, []).append(value)
+
+    terms: Dict[Tuple[int, int], List[Surd]] = {}
+
+    # - c_ad^e w^a_b,e
+    for (a, d, e), value in structure.c.items():
+        for b, w_value in w_by_ae.get((a, e), []):
+            term = surd_scale(surd_mul(value, w_value), Fraction(-1))
+            terms.setdefault((b, d), []).append(term)
+
+    # w^a_e,a w^e_b,d (the trace of w, which vanishes for a unimodular algebra)
+    for e, values in trace.items():
+        u = surd_sum(values)
+
+        if u:
+            for (f, b, d), value in w.items():
+                if f == e and (selected is None or b in selected):
+                    terms.setdefault((b, d), []).append(surd_mul(u, value))
+
+    # - w^a_e,d w^e_b,a
+    for (a, e, d), value in w.items():
+        for b, w_value in w_by_ae.get((e, a), []):
+            term = surd_scale(surd_mul(value, w_value), Fraction(-1))
+            terms.setdefault((b, d), []).append(term)
+
+    R_dd = {}
+
+    for (b, d), values in terms.items():
+        total = surd_sum(values)
+
+        if set(total) - {1}:
+            raise ValueError(f"R_{b}{d} = {total} is not rational")
+
+        if total:
+            R_dd[b, d] = total[1] / 2
+
+    return R_dd
+
+
+def ricci_at(structure: Structure, point: Point) -> List[Fraction]:
+    """Evaluate R_bb for the rows of the structure exactly at a point (x1, x2, x3)."""
+    R_dd = create_R_dd_at(structure, point, structure.rows)
+
+    return [R_dd.get((b, b), Fraction(0)) for b in structure.rows]
+
+
+def point_evaluator(n: int) -> Evaluate:
+    """The exact evaluation of the representative elements of SU(n) (see pmap)."""
+    structure = create_structure(n)
+
+    def evaluate(points: Sequence[Point]) -> List[List[Fraction]]:
+        return pmap(ricci_at, points, shared=structure)
+
+    return evaluate
+
+
+def _solve(
+    matrix: List[List[Fraction]], rhs: List[List[Fraction]]
+) -> List[List[Fraction]]:
+    """
+    Solve matrix X = rhs exactly (for several right hand sides) by Gauss elimination.
+
+    Raises ValueError if the matrix is singular.
+    """
+    size = len(matrix)
+    rows = [list(row) + list(values) for row, values in zip(matrix, rhs)]
+
+    for column in range(size):
+        pivot = next((r for r in range(column, size) if rows[r][column]), None)
+
+        if pivot is None:
+            raise ValueError("The interpolation points are degenerate")
+
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        pivot_row = rows[column]
+
+        for r in range(size):
+            if r != column and rows[r][column]:
+                factor = rows[r][column] / pivot_row[column]
+                rows[r] = [u - factor * v for u, v in zip(rows[r], pivot_row)]
+
+    return [[value / rows[r][r] for value in rows[r][size:]] for r in range(size)]
+
+
+def _exponent_ranges(
+    values: List[List[Fraction]], ts: Sequence[Fraction], max_degree: int
+) -> List[Tuple[int, int]]:
+    """
+    The lowest and highest exponents of t of every component along a line.
+
+    Every component is a Laurent polynomial in t, so t^max_degree times it is a
+    polynomial of degree at most 2 max_degree, interpolated from all but the last
+    two values and checked against those.
+    """
+    degree = 2 * max_degree
+    fit, check = slice(0, degree + 1), slice(degree + 1, None)
+
+    matrix = [[t ** i for i in range(degree + 1)] for t in ts[fit]]
+    scaled = [[v * t ** max_degree for v in row] for row, t in zip(values, ts)]
+    coefficients = _solve(matrix, scaled[fit])
+
+    ranges = []
+
+    for k in range(len(values[0])):
+        for t, row in zip(ts[check], scaled[check]):
+            if sum(c[k] * t ** i for i, c in enumerate(coefficients)) != row[k]:
+                raise ValueError(f"The degree is more than max_degree = {max_degree}")
+
+        exponents = [i - max_degree for i, c in enumerate(coefficients) if c[k]]
+        ranges.append((min(exponents), max(exponents)) if exponents else (0, 0))
+
+    return ranges
+
+
+def _random_point(rng: random.Random, size: int) -> Point:
+    """A point with random positive rational coordinates."""
+    return tuple(
+        Fraction(rng.randint(1, 10 ** 6), rng.randint(1, 10 ** 6)) for _ in range(size)
+    )
+
+
+def _support(
+    variable_ranges: Sequence[Tuple[int, int]], total_range: Tuple[int, int]
+) -> List[Tuple[int, ...]]:
+    """The monomials within the ranges of exponents of every variable and in total."""
+    low, high = total_range
+
+    return [
+        exponents
+        for exponents in product(*(range(lo, hi + 1) for lo, hi in variable_ranges))
+        if low <= sum(exponents) <= high
+    ]
+
+
+def reconstruct(
+    evaluate: Evaluate,
+    symbols: Sequence[Symbol] = (x1, x2, x3),
+    max_degree: int = 8,
+    seed: int = 0,
+) -> List[Expr]:
+    """
+    Reconstruct components homogeneous of degree 0 with monomial denominators.
+
+    :param evaluate: Evaluates the components at a batch of points
+    :param symbols: The variables, the last of which is set to 1 for the interpolation
+    :param max_degree: The largest exponent of any variable (or in total) expected
+    :param seed: The seed of the random points
+    """
+    rng = random.Random(seed)
+    size = len(symbols) - 1
+    ts = [Fraction(t) for t in range(1, 2 * max_degree + 4)]
+
+    # Probe along the line of every variable, and the diagonal, through a point
+    one = (Fraction(1),)
+    lines = []
+
+    for v in range(size):
+        base = _random_point(rng, size)
+        lines.append([base[:v] + (t,) + base[v + 1 :] + one for t in ts])
+
+    base = _random_point(rng, size)
+    lines.append([tuple(b * t for b in base) + one for t in ts])
+
+    values = evaluate([point for line in lines for point in line])
+    ranges = [
+        _exponent_ranges(values[i * len(ts) : (i + 1) * len(ts)], ts, max_degree)
+        for i in range(len(lines))
+    ]
+    count = len(values[0])
+
+    # The denominator exponents and the ranges of the numerator exponents
+    denominators = [
+        tuple(max(0, -ranges[v][k][0]) for v in range(size)) for k in range(count)
+    ]
+    supports = []
+
+    for k, shift in enumerate(denominators):
+        variable_ranges = [
+            (low + shift[v], high + shift[v])
+            for v, (low, high) in enumerate(r[k] for r in ranges[:size])
+        ]
+        low, high = ranges[size][k]
+        total_range = (low + sum(shift), high + sum(shift))
+        supports.append(_support(variable_ranges, total_range))
+
+    # Solve for the coefficients of the numerators, all components at once
+    unknowns = max(len(support) for support in supports)
+    points = [_random_point(rng, size) + one for _ in range(unknowns)]
+    values = evaluate(points)
+
+    forms = []
+
+    for k, support in enumerate(supports):
+        chosen = list(zip(points, values))[: len(support)]
+        matrix = [[_monomial(p, e) for e in support] for p, _ in chosen]
+        rhs = [[v[k] * _monomial(p, denominators[k])] for p, v in chosen]
+        coefficients = [c[0] for c in _solve(matrix, rhs)] if support else []
+
+        forms.append(
+            _homogenize(dict(zip(support, coefficients)), denominators[k], symbols)
+        )
+
+    return forms
+
+
+def _monomial(point: Point, exponents: Sequence[int]) -> Fraction:
+    """Evaluate the monomial with the exponents at the point."""
+    result = Fraction(1)
+
+    for x, e in zip(point, exponents):
+        result *= x ** e
+
+    return result
+
+
+def _homogenize(
+    numerator: Polynomial, denominator: Tuple[int, ...], symbols: Sequence[Symbol]
+) -> Expr:
+    """Restore the last variable so every term has degree 0."""
+    if not numerator:
+        return Rational(0)
+
+    degree = max(sum(exponents) for exponents in numerator)
+    last = max(0, degree - sum(denominator))
+    total = sum(denominator) + last
+
+    expr = sum(
+        Rational(c.numerator, c.denominator)
+        * _symbolic_monomial(symbols, (*exponents, total - sum(exponents)))
+        for exponents, c in numerator.items()
+    )
+
+    return factor(expr / _symbolic_monomial(symbols, (*denominator, last)))
+
+
+def _symbolic_monomial(symbols: Sequence[Symbol], exponents: Sequence[int]) -> Expr:
+    """The monomial with the exponents in the symbols."""
+    result = Rational(1)
+
+    for x, e in zip(symbols, exponents):
+        result *= x ** e
+
+    return result
+
+
+def verify(
+    forms: Sequence[Expr],
+    evaluate: Evaluate,
+    symbols: Sequence[Symbol] = (x1, x2, x3),
+    samples: int = 4,
+    seed: int = 1,
+) -> List[Point]:
+    """Return the random points at which the forms disagree with the evaluation."""
+    rng = random.Random(seed)
+    points = [_random_point(rng, len(symbols)) for _ in range(samples)]
+
+    def _rational(q: Fraction) -> Rational:
+        return Rational(q.numerator, q.denominator)
+
+    return [
+        point
+        for point, values in zip(points, evaluate(points))
+        if any(
+            form.subs({x: _rational(p) for x, p in zip(symbols, point)}) != _rational(v)
+            for form, v in zip(forms, values)
+        )
+    ]
+
+
+def reconstruct_ricci(
+    n: int, max_degree: int = 8, samples: int = 4, seed: int = 0
+) -> List[Expr]:
+    """
+    Reconstruct the 3 unique elements of the Ricci tensor for SU(n) from points.
+
+    Raises ValueError if they do not agree with the evaluation at fresh points.
+    """
+    evaluate = point_evaluator(n)
+    forms = reconstruct(evaluate, max_degree=max_degree, seed=seed)
+    failures = verify(forms, evaluate, samples=samples, seed=seed + 1)
+
+    if failures:
+        raise ValueError(f"The reconstruction disagrees at {failures}")
+
+    return forms
@@ -1,15 +1,38 @@
 """Calculate the Riemann Curvature and Ricci tensors."""
 
-from itertools import product
-from sympy import Array, Expr, expand, factor
-from sympy.tensor import tensorcontraction as tc, tensorproduct as tp
+from itertools import combinations, product
+from sympy import Add, Array, Expr, Integer, expand, factor
+from sympy.tensor import tensorcontraction as tc
+from sympy.tensor.array import NDimArray
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from wedge import extract_wedge_coeff
+from forms import TwoFormMatrix, sum_coeffs, as_two_form
+from laurent import as_expr
+from metric import DiagonalMetric, as_diagonal_metric
+from parallel import papplyfunc, pmap
+from symmetric import RIEMANN_SYMMETRIES, SymmetricTensor
+from zero_test import is_zero
 
 
-def _coeff(expr: Expr, c: int, d: int) -> Expr:
+# Non-zero entries of R^a_bcd keyed by (a, b, c, d)
+SparseR = Dict[Tuple[int, int, int, int], Expr]
+
+
+def _coeff(coeffs: Dict[Tuple[int, int], Expr], c: int, d: int) -> Expr:
     """
-    Extract the coeff of K^c ^ K^d in the specified expression.
+    Extract the coeff of K^c ^ K^d from the wedge coefficients of an expression.
 
     We divide by 1/2 to separate the coefficient into two antisymmetric parts.
     """
@@ -17,25 +40,96 @@ def _coeff(expr: Expr, c: int, d: int) -> Expr:
         return 0
 
     if c < d:
-        return extract_wedge_coeff(expr, c, d) / 2
+        return as_expr(coeffs.get((c, d), Integer(0))) / 2
 
     else:
-        return -1 * extract_wedge_coeff(expr, d, c) / 2
+        return -1 * as_expr(coeffs.get((d, c), Integer(0))) / 2
+
+
+def _rows(theta_ud: Union[Array, TwoFormMatrix]) -> TwoFormMatrix:
+    """Return theta_ud as a nested list of TwoForms."""
+    rows = theta_ud.tolist() if isinstance(theta_ud, NDimArray) else theta_ud
+
+    return [[as_two_form(entry) for entry in row] for row in rows]
+
+
+def _simplify(terms: List[Any]) -> Expr:
+    """Sum the coefficients then expand and factorize to get a compact expression."""
+    return _expand_factor(as_expr(sum_coeffs(terms)))
+
+
+def _simplify_entry(_: Any, terms: List[Any]) -> Expr:
+    """_simplify for pmap."""
+    return _simplify(terms)
+
+
+def _expand_factor(expr: Expr) -> Expr:
+    """
+    Expand and then factorize to get a compact expression.
+
+    The (many) entries which vanish are pruned by is_zero first, which is much
+    cheaper than expanding them.
+    """
+    if is_zero(expr):
+        return Integer(0)
 
+    return factor(expand(expr))
 
-def create_R_uddd(n: int, theta_ud: Array) -> Array:
-    """Create the Riemann Curvature Tensor."""
+
+def _R_uddd_row(coeffs: List[List[Dict[Tuple[int, int], Any]]], a: int) -> List[Any]:
+    """Calculate the R^a_bcd for a single a as a nested list."""
+    dim = len(coeffs)
+
+    return [
+        [[_coeff(coeffs[a][b], c, d) for d in range(dim)] for c in range(dim)]
+        for b in range(dim)
+    ]
+
+
+def create_R_uddd(n: int, theta_ud: Union[Array, TwoFormMatrix]) -> Array:
+    """
+    Create the Riemann Curvature Tensor.
+
+    theta_ud can be an Array of 2-form expressions or a nested list of TwoForms.
+    """
     dim = n ** 2 - 1
 
-    return Array(
-        [
-            [
-                [[_coeff(theta_ud[a, b], c, d) for d in range(dim)] for c in range(dim)]
-                for b in range(dim)
-            ]
-            for a in range(dim)
-        ]
-    )
+    # Decompose each theta^a_b once rather than once per (c, d) pair
+    coeffs = [[entry.coeffs for entry in row] for row in _rows(theta_ud)]
+
+    return Array(pmap(_R_uddd_row, range(dim), coeffs))
+
+
+def create_R_dddd(
+    n: int,
+    theta_ud: Union[Array, TwoFormMatrix],
+    metric: DiagonalMetric,
+    pair_symmetric: Optional[bool] = None,
+) -> SymmetricTensor:
+    """
+    Create the Riemann Curvature Tensor with the first index lowered.
+
+    R_abcd = g_aa R^a_bcd is antisymmetric in (a, b) and in (c, d) so only a quarter of
+    the components are calculated and stored.
+
+    The symmetry under swapping the pairs follows from the Jacobi identity, which the
+    structure constants for n = 3 do not satisfy (the K2L mapping uses a special P
+    matrix), so by default it is only used to store an eighth of the components for
+    n != 3.
+    """
+    dim = n ** 2 - 1
+    pair_symmetric = n != 3 if pair_symmetric is None else pair_symmetric
+
+    symmetries = RIEMANN_SYMMETRIES if pair_symmetric else RIEMANN_SYMMETRIES[:2]
+    R = SymmetricTensor((dim, dim, dim, dim), symmetries)
+    rows = _rows(theta_ud)
+
+    for a, b in combinations(range(dim), 2):
+        for (c, d), value in rows[a][b].coeffs.items():
+            if not pair_symmetric or (a, b) <= (c, d):
+                R[a, b, c, d] = expand(as_expr(metric.entries[a] * value / 2))
+
+    return R
 
 
 def create_R_dd(R_uddd: Array) -> Array:
@@ -46,23 +140,246 @@ def create_R_dd(R_uddd: Array) -> Array:
 
     Expand and then factorize the elements to get compact expressions.
     """
-    return tc(R_uddd, (0, 2)).applyfunc(expand).applyfunc(factor)
+    return papplyfunc(tc(R_uddd, (0, 2)), _expand_factor)
 
 
-def calculate_Riem_2(n: int, R_uddd: Array, g_dd: Array, g_uu: Array) -> Expr:
+def create_R_dd_direct(n: int, theta_ud: Union[Array, TwoFormMatrix]) -> Array:
     """
-    Calculate Riem_2 = R_abcd R^abcd (contraction on all indices).
+    Create the Ricci tensor directly from theta_ud without building R_uddd.
 
-    Several indices will have to be raised and lowered accordingly.
+    R_ab = R^c_acb where R^c_acb is the (antisymmetrized) coefficient of K^c ∧ K^b in
+    theta^c_a, so each wedge coefficient of theta^c_a is accumulated straight into
+    the row a of the Ricci tensor.
+
+    Expand and then factorize the elements to get compact expressions.
     """
     dim = n ** 2 - 1
+    terms: Dict[Tuple[int, int], List[Expr]] = {}
+
+    for c, row in enumerate(_rows(theta_ud)):
+        for a, entry in enumerate(row):
+            for (i, j), value in entry.coeffs.items():
+                if i == c:  # K^c ∧ K^j contributes to R_aj
+                    terms.setdefault((a, j), []).append(value / 2)
+                if j == c:  # K^i ∧ K^c = - K^c ∧ K^i contributes to R_ai
+                    terms.setdefault((a, i), []).append(-value / 2)
+
+    indices = list(product(range(dim), range(dim)))
+    entries = pmap(_simplify_entry, (terms.get(index, []) for index in indices))
+
+    return Array(entries, (dim, dim))
+
+
+def _nonzero_c_ddd(
+    c_ddd: Union[Array, SymmetricTensor]
+) -> Iterator[Tuple[Tuple[int, int, int], Any]]:
+    """Iterate over all the non-zero ((a, b, c), c_abc) (with both a, b orders)."""
+    if isinstance(c_ddd, SymmetricTensor):
+        # Only a < b are stored, the rest follow from the antisymmetry in a and b
+        for (a, b, c), value in c_ddd.items():
+            if value != 0:
+                yield (a, b, c), value
+                yield (b, a, c), -value
+
+    else:
+        for (a, b, c), value in nonzero_entries(c_ddd):
+            yield (a, b, c), value
+
+
+def create_R_dd_structure(
+    c_ddd: Union[Array, SymmetricTensor], g_dd: Union[Array, DiagonalMetric]
+) -> Array:
+    """
+    Create the Ricci tensor straight from c_ddd and the metric, with no forms at all.
+
+    With w^a_b,e = g^aa 1/2 (c_abe + c_aeb + c_eba) the components of the connection
+    1-forms, theta^a_b = dw^a_b + w^a_e ∧ w^e_b and R_bd = R^a_bad give
+        2 R_bd = - c_ad^e w^a_b,e + w^a_e,a w^e_b,d - w^a_e,d w^e_b,a
+    summed over a and e. Every term is a product of two sparse factors so the cost is
+    O(nnz(c) dim) rather than the O(dim^5) of building theta_ud. The formula does not
+    assume the Jacobi identity so it agrees with create_R_dd for every n.
+    """
+    metric = as_diagonal_metric(g_dd)
+    gi = metric.inverse_entries
+    dim = metric.dim
+
+    c_entries = list(_nonzero_c_ddd(c_ddd))
+
+    # w^a_b,e, where c_ijk contributes to w_ab,e at (i, j, k), (i, k, j) and (k, j, i)
+    w_terms: Dict[Tuple[int, int, int], List[Any]] = {}
+
+    for (i, j, k), value in c_entries:
+        for a, b, e in ((i, j, k), (i, k, j), (k, j, i)):
+            w_terms.setdefault((a, b, e), []).append(value * gi[a] / 2)
+
+    w = {index: sum_coeffs(terms) for index, terms in w_terms.items()}
+    w = {index: value for index, value in w.items() if value != 0}
+
+    # Index the entries of w by a and by (a, e) for the contractions
+    w_by_a: Dict[int, List[Tuple[int, int, Any]]] = {}
+    w_by_ae: Dict[Tuple[int, int], List[Tuple[int, Any]]] = {}
 
-    R_dddd = tc(tp(g_dd, R_uddd), (1, 2))
+    for (a, b, e), value in w.items():
+        w_by_a.setdefault(a, []).append((b, e, value))
+        w_by_ae.setdefault((a, e), []).append((b, value))
 
-    R_uudd = tc(tp(g_uu, R_uddd), (1, 3))
-    R_uuud = tc(tp(g_uu, R_uudd), (1, 4))
-    R_uuuu = tc(tp(g_uu, R_uuud), (1, 5))
+    terms: Dict[Tuple[int, int], List[Any]] = {}
 
-    # return factor(expand(tc(tp(R_uuuu, R_dddd), (0,4), (1,5), (2,6), (3,7))))
-    return factor(expand(sum(R_uuuu[i,j,k,l] * R_dddd[i,j,k,l] for i, j, k, l in product(range(dim), repeat=4))))
+    # - c_ad^e w^a_b,e with c_ad^e = g^ee c_ade
+    for (a, d, e), value in c_entries:
+        for b, w_value in w_by_ae.get((a, e), []):
+            terms.setdefault((b, d), []).append(-value * gi[e] * w_value / 2)
 
+    # w^a_e,a w^e_b,d (the trace of w, which vanishes for a unimodular algebra)
+    trace: Dict[int, List[Any]] = {}
+
+    for (a, e, f), value in w.items():
+        if f == a:
+            trace.setdefault(e, []).append(value)
+
+    for e, values in trace.items():
+        u = sum_coeffs(values)
+
+        for b, d, w_value in w_by_a.get(e, []):
+            terms.setdefault((b, d), []).append(u * w_value / 2)
+
+    # - w^a_e,d w^e_b,a
+    for (a, e, d), value in w.items():
+        for b, w_value in w_by_ae.get((e, a), []):
+            terms.setdefault((b, d), []).append(-value * w_value / 2)
+
+    indices = list(product(range(dim), range(dim)))
+    entries = pmap(_simplify_entry, (terms.get(index, []) for index in indices))
+
+    return Array(entries, (dim, dim))
+
+
+def representative_indices(n: int) -> Tuple[int, int, int]:
+    """The first index of each of the three categories of K 1-forms: (0, m, 2m)."""
+    m = n * (n - 1) // 2
+
+    return 0, m, 2 * m
+
+
+def create_R_dd_diagonal(
+    theta_columns: TwoFormMatrix, columns: Sequence[int]
+) -> Dict[int, Expr]:
+    """
+    Create the diagonal Ricci components R_bb for the specified b only.
+
+    theta_columns holds theta^c_b for every c but only the b in columns (one column per
+    entry, in the same order) so R_bb = R^c_bcb needs nothing else.
+    """
+    terms = [
+        [row[j].coeff(c, b) / 2 for c, row in enumerate(theta_columns)]
+        for j, b in enumerate(columns)
+    ]
+
+    return dict(zip(columns, pmap(_simplify_entry, terms)))
+
+
+class Invariants(NamedTuple):
+    """Curvature invariants calculated together by calculate_invariants."""
+
+    Riem_2: Expr  # R_abcd R^abcd
+    Ric_2: Expr  # R_ab R^ab
+    scalar: Expr  # R = g^ab R_ab
+
+
+def nonzero_entries(
+    tensor: Union[Array, Mapping[Any, Expr]]
+) -> Iterator[Tuple[Tuple[int, ...], Expr]]:
+    """
+    Iterate over the (index, value) pairs of a tensor with non-zero values.
+
+    The tensor is an Array or a sparse map keyed by index tuples of any rank, e.g.
+    ((a, b, c, d), R^a_bcd) for R_uddd or ((a, b, c), c_abc) for c_ddd.
+    """
+    entries: Iterable[Tuple[Tuple[int, ...], Expr]]
+
+    if isinstance(tensor, NDimArray):
+        indices = product(*(range(s) for s in tensor.shape))
+        entries = ((index, tensor[index]) for index in indices)
+    else:
+        entries = tensor.items()
+
+    return ((index, value) for index, value in entries if value != 0)
+
+
+def iter_R_uddd(
+    theta_ud: Union[Array, TwoFormMatrix]
+) -> Iterator[Tuple[Tuple[int, int, int, int], Any]]:
+    """
+    Iterate over the non-zero R^a_bcd with c < d, in order of a.
+
+    The values are read straight off theta_ud so they keep the type of its
+    coefficients (e.g. LaurentPolynomials).
+    """
+    for a, row in enumerate(_rows(theta_ud)):
+        for b, entry in enumerate(row):
+            for (c, d), value in entry.coeffs.items():
+                yield (a, b, c, d), value / 2
+
+
+def create_R_uddd_sparse(n: int, theta_ud: Union[Array, TwoFormMatrix]) -> SparseR:
+    """Create the non-zero entries of the Riemann Curvature Tensor as a sparse map."""
+    R: SparseR = {}
+
+    for (a, b, c, d), value in iter_R_uddd(theta_ud):
+        R[(a, b, c, d)] = as_expr(value)
+        R[(a, b, d, c)] = -as_expr(value)
+
+    return R
+
+
+def calculate_invariants(
+    R_uddd: Union[Array, SparseR],
+    g_dd: Union[Array, DiagonalMetric],
+    g_uu: Optional[Array] = None,
+) -> Invariants:
+    """
+    Calculate Riem_2, |Ric|² and the scalar curvature in a single pass.
+
+    Only the non-zero entries of R^a_bcd are visited and, since the metric is
+    diagonal, raising and lowering is applied inline as a weight:
+        R_abcd R^abcd = g_aa g^bb g^cc g^dd (R^a_bcd)²
+    The Ricci tensor R_bd = R^a_bad is accumulated in the same pass.
+    """
+    metric = as_diagonal_metric(g_dd, g_uu)
+    g = metric.entries
+    gi = metric.inverse_entries
+
+    riem_terms: List[Expr] = []
+    ricci_terms: Dict[Tuple[int, int], List[Expr]] = {}
+
+    for (a, b, c, d), value in nonzero_entries(R_uddd):
+        riem_terms.append(g[a] * gi[b] * gi[c] * gi[d] * value ** 2)
+
+        if a == c:
+            ricci_terms.setdefault((b, d), []).append(value)
+
+    ricci = {key: Add(*terms) for key, terms in ricci_terms.items()}
+
+    Ric_2 = Add(*(gi[b] * gi[d] * value ** 2 for (b, d), value in ricci.items()))
+    scalar = Add(*(gi[b] * value for (b, d), value in ricci.items() if b == d))
+
+    return Invariants(
+        Riem_2=factor(expand(Add(*riem_terms))),
+        Ric_2=factor(expand(Ric_2)),
+        scalar=factor(expand(scalar)),
+    )
+
+
+def calculate_Riem_2(
+    n: int,
+    R_uddd: Union[Array, SparseR],
+    g_dd: Union[Array, DiagonalMetric],
+    g_uu: Optional[Array] = None,
+) -> Expr:
+    """
+    Calculate Riem_2 = R_abcd R^abcd (contraction on all indices).
+
+    Several indices will have to be raised and lowered accordingly. The metric is
+    diagonal so this is done inline by calculate_invariants over the non-zero entries.
+    """
+    return calculate_invariants(R_uddd, g_dd, g_uu).Riem_2
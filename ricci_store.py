@@ -0,0 +1,126 @@
+"""
+Persistent store of the 3 unique elements of the Ricci tensor for each n.
+
+The results live in a JSON data file mapping n to the 3 elements as strings (written
+with x1, x2 and x3 as plain ascii names). The file is only read on first access and
+the strings for an n are only parsed into sympy expressions when that n is looked
+up. A miss calculates the elements (with the representative Ricci pipeline) but
+never writes them to the file: only put does, e.g. from calculate.py --store, so the
+file only ever holds results explicitly stored from the pipeline.
+"""
+
+import json
+import os
+
+from sympy import Expr, Symbol
+from sympy.parsing.sympy_parser import parse_expr
+from typing import Callable, Dict, Iterator, List, Mapping, Optional
+
+from metric import x1, x2, x3
+
+
+STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ricci.json")
+
+# The metric constants are written with ascii names since x₁ etc. do not parse
+_NAMES = {"x1": x1, "x2": x2, "x3": x3}
+
+
+def to_string(expr: Expr) -> str:
+    """Convert an expression in x1, x2 and x3 to a parsable string."""
+    return str(expr.xreplace({x: Symbol(name) for name, x in _NAMES.items()}))
+
+
+def from_string(string: str) -> Expr:
+    """Parse a string written by to_string."""
+    return parse_expr(string, local_dict=dict(_NAMES))
+
+
+def calculate_ricci(n: int) -> List[Expr]:
+    """Calculate the 3 unique elements of the Ricci tensor for SU(n)."""
+    # Imported here so that looking up stored results never imports the pipeline
+    from calculate import create_representative_R_dd
+    from ricci import representative_indices
+
+    components = create_representative_R_dd(n)
+
+    return [components[i] for i in representative_indices(n)]
+
+
+class RicciStore(Mapping[int, List[Expr]]):
+    """Lazily loaded mapping from n to the 3 unique elements of the Ricci tensor."""
+
+    def __init__(
+        self,
+        path: str = STORE_PATH,
+        calculate: Optional[Callable[[int], List[Expr]]] = calculate_ricci,
+    ):
+        """
+        Create the store (nothing is read until the first access).
+
+        :param path: The JSON data file
+        :param calculate: Calculates the elements on a miss, which are not stored (None
+            to raise KeyError)
+        """
+        self.path = path
+        self.calculate = calculate
+        self._raw: Optional[Dict[int, List[str]]] = None
+        self._parsed: Dict[int, List[Expr]] = {}
+        self._calculated: Dict[int, List[Expr]] = {}
+
+    def _read(self) -> Dict[int, List[str]]:
+        if not os.path.exists(self.path):
+            return {}
+
+        with open(self.path) as fin:
+            return {int(n): elements for n, elements in json.load(fin).items()}
+
+    @property
+    def raw(self) -> Dict[int, List[str]]:
+        """The unparsed contents of the data file."""
+        if self._raw is None:
+            self._raw = self._read()
+
+        return self._raw
+
+    def __getitem__(self, n: int) -> List[Expr]:
+        if n not in self._parsed:
+            if n in self.raw:
+                self._parsed[n] = [from_string(e) for e in self.raw[n]]
+
+            elif self.calculate is not None:
+                # Kept for this store only: neither written nor counted as stored
+                if n not in self._calculated:
+                    self._calculated[n] = self.calculate(n)
+
+                return self._calculated[n]
+
+            else:
+                raise KeyError(n)
+
+        return self._parsed[n]
+
+    def put(self, n: int, elements: List[Expr]) -> None:
+        """Store the elements for n and write them back to the data file."""
+        self._parsed[n] = list(elements)
+
+        # Merge with the file as it is now in case another run has written to it
+        raw = self._read()
+        raw[n] = [to_string(e) for e in elements]
+        self._raw = raw
+
+        tmp_path = f"{self.path}.tmp"
+
+        with open(tmp_path, "w") as fout:
+            json.dump({str(k): raw[k] for k in sorted(raw)}, fout, indent=4)
+            fout.write("\n")
+
+        os.replace(tmp_path, self.path)
+
+    def __contains__(self, n: object) -> bool:
+        return n in self._parsed or n in self.raw
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(sorted(set(self.raw) | set(self._parsed)))
+
+    def __len__(self) -> int:
+        return len(set(self.raw) | set(self._parsed))
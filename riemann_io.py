@@ -0,0 +1,200 @@
+"""
+Sparse, versioned on-disk format for the Riemann Curvature Tensor R^a_bcd.
+
+The file is JSON lines. The first line is a header:
+
+    {"format": "sun-riemann", "version": 1, "n": n, "dim": dim}
+
+and every other line is a non-zero entry with c < d (the entries with c > d follow from
+the antisymmetry in c and d):
+
+    [a, b, c, d, [[e1, e2, e3, s, p, q], ...]]
+
+where the terms encode the Laurent polynomial Σ (p / q) sqrt(s) x1^e1 x2^e2 x3^e3.
+
+Entries are streamed to a temporary file as they are calculated, which only replaces
+the file once all of them are written. A sidecar index file (the same path with .idx
+appended) maps each a to the byte ranges of its entries so that the entries for some a
+can be read without parsing the rest of the file.
+"""
+
+import json
+import os
+
+from fractions import Fraction
+from types import TracebackType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from laurent import LaurentPolynomial
+
+
+FORMAT = "sun-riemann"
+VERSION = 1
+
+Index = Tuple[int, int, int, int]
+
+
+def riemann_path(n: int) -> str:
+    """The default path of the R_uddd file for SU(n)."""
+    return f"R_uddd_n_{n}.jsonl"
+
+
+def _index_path(path: str) -> str:
+    return f"{path}.idx"
+
+
+def encode(value: Any) -> List[List[int]]:
+    """Encode a coefficient (LaurentPolynomial or sympy expression) as term lists."""
+    polynomial = value if isinstance(value, LaurentPolynomial) else None
+
+    if polynomial is None:
+        polynomial = LaurentPolynomial.from_expr(value)
+
+    return [
+        [*term, q.numerator, q.denominator]
+        for term, q in sorted(polynomial.terms.items())
+    ]
+
+
+def decode(terms: List[List[int]]) -> LaurentPolynomial:
+    """Decode the term lists back to a LaurentPolynomial."""
+    return LaurentPolynomial(
+        {(e1, e2, e3, s): Fraction(p, q) for e1, e2, e3, s, p, q in terms}
+    )
+
+
+class RiemannWriter:
+    """
+    Stream the non-zero entries of R^a_bcd to a file.
+
+    Use as a context manager so the file and its index are only written when done: if
+    the block raises, the partial file is discarded and any previous file is kept.
+    """
+
+    def __init__(self, path: str, n: int):
+        """Open the temporary file and write the header."""
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self.file = open(self.tmp_path, "wb")
+        self.runs: Dict[int, List[List[int]]] = {}
+        self._last_a: Optional[int] = None
+
+        header = {"format": FORMAT, "version": VERSION, "n": n, "dim": n ** 2 - 1}
+        self.file.write(json.dumps(header).encode() + b"\n")
+
+    def write(self, index: Index, value: Any) -> None:
+        """Write a single entry, which is skipped if zero or c >= d."""
+        a, b, c, d = index
+
+        if c >= d or value == 0:
+            return
+
+        start = self.file.tell()
+        line = json.dumps([a, b, c, d, encode(value)], separators=(",", ":"))
+        self.file.write(line.encode() + b"\n")
+
+        # Extend the current byte range of this a or start a new one
+        runs = self.runs.setdefault(a, [])
+
+        if a == self._last_a and runs:
+            runs[-1][1] = self.file.tell()
+        else:
+            runs.append([start, self.file.tell()])
+
+        self._last_a = a
+
+    def write_all(self, entries: Iterable[Tuple[Index, Any]]) -> None:
+        """Write all the entries."""
+        for index, value in entries:
+            self.write(index, value)
+
+    def close(self) -> None:
+        """Close the file and move it into place together with its index."""
+        self.file.close()
+
+        index_path = _index_path(self.path)
+
+        with open(f"{index_path}.tmp", "w") as fout:
+            json.dump({str(a): runs for a, runs in self.runs.items()}, fout)
+
+        # Remove the previous index first so the new file is never read with it
+        if os.path.exists(index_path):
+            os.remove(index_path)
+
+        os.replace(self.tmp_path, self.path)
+        os.replace(f"{index_path}.tmp", index_path)
+
+    def discard(self) -> None:
+        """Close and remove the temporary file, keeping any previous file."""
+        self.file.close()
+        os.remove(self.tmp_path)
+
+    def __enter__(self) -> "RiemannWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def read_header(path: str) -> Dict[str, Any]:
+    """Read and validate the header of the file."""
+    with open(path, "rb") as fin:
+        header: Dict[str, Any] = json.loads(fin.readline())
+
+    if header.get("format") != FORMAT:
+        raise ValueError(f"{path} is not a {FORMAT} file")
+
+    if header.get("version") != VERSION:
+        raise ValueError(f"{path} has unsupported version {header.get('version')}")
+
+    return header
+
+
+def _entries(lines: Iterable[bytes]) -> Iterator[Tuple[Index, LaurentPolynomial]]:
+    """Decode the entry lines, adding back the c > d entries."""
+    for line in lines:
+        a, b, c, d, terms = json.loads(line)
+        value = decode(terms)
+
+        yield (a, b, c, d), value
+        yield (a, b, d, c), -value
+
+
+def iter_riemann(
+    path: str, rows: Optional[Iterable[int]] = None
+) -> Iterator[Tuple[Index, LaurentPolynomial]]:
+    """
+    Iterate over the non-zero ((a, b, c, d), R^a_bcd) entries stored in the file.
+
+    If rows is specified only the entries with a in rows are read, using the index.
+    """
+    read_header(path)
+
+    with open(path, "rb") as fin:
+        if rows is None:
+            fin.readline()  # Skip the header
+            yield from _entries(fin)
+            return
+
+        with open(_index_path(path)) as fidx:
+            index: Dict[str, List[List[int]]] = json.load(fidx)
+
+        for a in rows:
+            for start, end in index.get(str(a), []):
+                fin.seek(start)
+                yield from _entries(fin.read(end - start).splitlines())
+
+
+def read_riemann(
+    path: str, rows: Optional[Iterable[int]] = None
+) -> Dict[Index, LaurentPolynomial]:
+    """Read the non-zero entries of R^a_bcd (only a in rows, if specified)."""
+    return dict(iter_riemann(path, rows))
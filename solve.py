@@ -1,24 +1,64 @@
 """Solve the 3 non-linear equations to calculate the metric constants and lambda."""
 
-import dill
-import sys
-
-from sympy import Eq, Expr, Mul, N, Pow, Rational, Symbol, expand
+import argparse
+import elimination
+import mpmath
+import newton
+import numeric
+import numpy as np
+import os
+
+from functools import lru_cache
+from sympy import Eq, Expr, Mul, N, Pow, Rational, Symbol
 from sympy.solvers import solve_poly_system
+from typing import Any, Dict, Union
 
 from cache import ricci
-from metric import create_metric, x1, x2, x3
-from ricci import calculate_Riem_2
-
-
-if not len(sys.argv) > 1:
-    print("Need to specify a value of n.")
-    sys.exit(1)
+from invariants import InvariantEvaluator
+from laurent import LaurentPolynomial
+from metric import create_diagonal_metric, x1, x2, x3
+from ricci import calculate_invariants
+from riemann_io import Index, read_riemann, riemann_path
 
 
 def main() -> None:
     """Entrypoint."""
-    n = int(sys.argv[1])
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("n", type=int, help="Solve for the group SU(n)")
+    parser.add_argument(
+        "--numeric",
+        action="store_true",
+        help="Use multi-start Newton iterations instead of solve_poly_system",
+    )
+    parser.add_argument(
+        "--elimination",
+        action="store_true",
+        help="Eliminate lambda and x2 and find only the positive real solutions",
+    )
+    parser.add_argument(
+        "--starts",
+        type=int,
+        default=4096,
+        help="Number of Newton starting points (with --numeric, default: 4096)",
+    )
+    parser.add_argument(
+        "--dps",
+        type=int,
+        default=30,
+        help="Decimal digits of the invariants of irrational solutions (default: 30)",
+    )
+    args = parser.parse_args()
+
+    n = args.n
+
+    if args.numeric:
+        solve_numeric(n, args.starts, args.dps)
+        return
+
+    if args.elimination:
+        solve_elimination(n, args.dps)
+        return
+
     lmbda = Symbol("𝜆", real=True)
 
     # We normalize the results by setting x3=2
@@ -61,34 +101,144 @@ def main() -> None:
 
     print(f"\nNumber of solutions: {len(approx)}\n")
 
-    for solution in approx:
-        if all(isinstance(value, Rational) for value in solution):
-            lmbda_s, x1_s, x2_s = solution
-            x3_s = x3_val
+    for solution, exact in zip(approx, results):
+        lmbda_s, x1_s, x2_s = solution
+        x3_s = x3_val
 
+        if all(isinstance(value, Rational) for value in solution):
             invariant = calculate_invariant(n, x1_s, x2_s, x3_s, lmbda_s)
 
-            print(f"x₁: {x1_s}, x₂: {x2_s}, x₃: {x3_s}, 𝜆: {lmbda_s}, inv: {invariant}")
+            print(
+                f"x₁: {x1_s}, x₂: {x2_s}, x₃: {x3_s}, 𝜆: {lmbda_s}, "
+                f"inv: {format_invariant(n, invariant)}"
+            )
+
+        elif all(value.is_real and value > 0 for value in solution):
+            # Evaluate the invariant from the exact solution to the full precision
+            invariant = evaluate_invariant(
+                n, exact[1], exact[2], x3_s, exact[0], args.dps
+            )
+
+            print(
+                f"x₁: {x1_s}, x₂: {x2_s}, x₃: {x3_s}, 𝜆: {lmbda_s}, "
+                f"inv: {format_invariant(n, invariant)}"
+            )
+
+
+def solve_numeric(n: int, starts: int, dps: int = 30) -> None:
+    """Solve with batched Newton iterations, confirming rational solutions exactly."""
+    solutions = newton.solve(ricci[n], starts)
+
+    print(f"\nNumber of solutions: {len(solutions)}\n")
+
+    for solution in solutions:
+        if solution.exact is not None:
+            x1_s, x2_s, lmbda_s = solution.exact
+            invariant = calculate_invariant(n, x1_s, x2_s, 1, lmbda_s)
+
+            print(
+                f"x₁: {x1_s}, x₂: {x2_s}, x₃: 1, 𝜆: {lmbda_s}, "
+                f"inv: {format_invariant(n, invariant)}"
+            )
+
+        else:
+            invariant = evaluate_invariant(
+                n, solution.x1, solution.x2, 1, solution.lmbda, dps
+            )
+
+            print(
+                f"x₁: {solution.x1}, x₂: {solution.x2}, x₃: 1, 𝜆: {solution.lmbda}, "
+                f"inv: {format_invariant(n, invariant)} (not rational)"
+            )
+
+
+def solve_elimination(n: int, dps: int = 30) -> None:
+    """Solve by elimination, calculating the invariant of the rational solutions."""
+    solutions = elimination.solve(ricci[n])
+
+    print(f"\nNumber of positive real solutions: {len(solutions)}\n")
+
+    for x1_s, x2_s, lmbda_s in solutions:
+        if all(isinstance(value, Rational) for value in (x1_s, x2_s, lmbda_s)):
+            invariant = calculate_invariant(n, x1_s, x2_s, 1, lmbda_s)
+
+            print(
+                f"x₁: {x1_s}, x₂: {x2_s}, x₃: 1, 𝜆: {lmbda_s}, "
+                f"inv: {format_invariant(n, invariant)}"
+            )
+
+        else:
+            invariant = evaluate_invariant(n, x1_s, x2_s, 1, lmbda_s, dps)
+
+            print(
+                f"x₁: {N(x1_s)}, x₂: {N(x2_s)}, x₃: 1, 𝜆: {N(lmbda_s)}, "
+                f"inv: {format_invariant(n, invariant)}"
+            )
+
+
+@lru_cache(maxsize=None)
+def load_riemann(n: int) -> Dict[Index, LaurentPolynomial]:
+    """Read the non-zero entries of R_uddd from the sparse file (once per n)."""
+    return read_riemann(riemann_path(n))
+
+
+@lru_cache(maxsize=None)
+def invariant_evaluator(n: int) -> InvariantEvaluator:
+    """Compile the curvature data for evaluating invariants numerically (once per n)."""
+    return InvariantEvaluator(n, load_riemann(n).items())
+
+
+def has_riemann(n: int) -> bool:
+    """Whether there is an R_uddd file, otherwise the invariants are floating point."""
+    return os.path.exists(riemann_path(n))
+
+
+def format_invariant(n: int, invariant: Any) -> str:
+    """Format the invariant, labelling the values of the numeric curvature engine."""
+    if has_riemann(n):
+        return str(invariant)
+
+    return f"{float(invariant):.12g} (numeric)"
+
+
+def numeric_invariant(n: int, x1_s: Any, x2_s: Any, x3_s: Any, lmbda_s: Any) -> float:
+    """Calculate the invariant in floating point with the numeric curvature engine."""
+    sample = np.array([[float(x1_s), float(x2_s), float(x3_s)]])
+
+    return float(numeric.curvature(n, sample).Riem_2[0] / float(lmbda_s) ** 2)
+
+
+def evaluate_invariant(
+    n: int, x1_s: Any, x2_s: Any, x3_s: Any, lmbda_s: Any, dps: int = 30
+) -> Union[mpmath.mpf, float]:
+    """
+    Evaluate the invariant numerically to dps digits.
+
+    Without an R_uddd file (e.g. for an n only known from the closed forms) it falls
+    back to the (floating point) numeric curvature engine, see format_invariant.
+    """
+    if not has_riemann(n):
+        return numeric_invariant(n, x1_s, x2_s, x3_s, lmbda_s)
 
+    return invariant_evaluator(n).invariant(x1_s, x2_s, x3_s, lmbda_s, dps)
 
-def calculate_invariant(n, x1_s, x2_s, x3_s, lmbda_s):
-    """Calculate the invariant using Riem_2."""
-    # We start by loading the serialized R_uddd expression
-    with open(f"R_uddd_n_{n}.dat", "rb") as fin:
-        R_uddd = dill.load(fin)
 
-    g_dd, g_uu = create_metric(n)
+def calculate_invariant(
+    n: int, x1_s: Any, x2_s: Any, x3_s: Any, lmbda_s: Any
+) -> Union[Expr, float]:
+    """Calculate the invariant using Riem_2 (numerically if there is no R_uddd file)."""
+    if not has_riemann(n):
+        return numeric_invariant(n, x1_s, x2_s, x3_s, lmbda_s)
 
     # Create a substitution dict
     subs = {x1: x1_s, x2: x2_s, x3: x3_s}
 
-    # Substitute values in to R_uddd before we calculate Riem_2 (otherwise it takes
-    # too long)
-    R_uddd = R_uddd.applyfunc(lambda e : expand(e.subs(subs)))
-    g_dd = g_dd.applyfunc(lambda e: e.subs(subs))
-    g_uu = g_uu.applyfunc(lambda e: e.subs(subs))
+    # Evaluate the non-zero entries of R_uddd (read from its sparse file) and the
+    # metric at the solution before we calculate Riem_2
+    R = {index: e.evaluate(subs) for index, e in load_riemann(n).items()}
+    metric = create_diagonal_metric(n).subs(subs)
 
-    Riem_2 = calculate_Riem_2(n, R_uddd, g_dd, g_uu)
+    Riem_2 = calculate_invariants(R, metric).Riem_2
 
     return Riem_2 / (lmbda_s**2)
 
@@ -0,0 +1,333 @@
+"""
+Calculate the structure constants c_ab^c of SU(n) directly in the K basis.
+
+Writing the L 1-forms in terms of the K 1-forms, L = E_i K^i, defines the matrices
+E_i and writing K^k = M_k^(ab) L_a^b defines the dual matrices M_k. The Maurer-Cartan
+equation dL_a^b = I * L_a^c ∧ L_c^b then gives
+
+    c_ij^k = -I * M_k^(ab) [E_i, E_j]_ab
+
+which is the same quantity create_c_ddu extracts from dK, without building any
+2-form expressions. Every E_i and M_k is either real or purely imaginary so we track
+the powers of I separately and only do real arithmetic on the sparse entries.
+
+The real entries are sums of rational multiples of square roots (from the Q matrix
+normalization). Rather than letting sympy simplify those we keep them as Surds (see
+surd), which makes the whole table cheap to compute.
+
+The category 3 E_i and M_k mix the diagonal H_r = diag(Q[r, :]) with the P matrix of
+n, so the brackets are calculated with the H_r in their place (the Cartan table) and
+mixed afterwards. Nothing in the Cartan table depends on n, so the table of SU(n + 1)
+extends that of SU(n) with just the brackets of the new generators.
+"""
+
+from fractions import Fraction
+from itertools import combinations
+from sympy import Expr, I, Matrix
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from K_L_mappings import _category_3_P_matrix, _create_P_matrix, _create_Q_matrix
+from surd import Surd, from_surd, surd_mul, surd_scale, surd_sum, to_surd
+
+
+# Sparse table of the non-zero c_ab^c keyed by (a, b, c)
+CTable = Dict[Tuple[int, int, int], Expr]
+
+# The same with the category 3 K replaced by the H_r (see _generators)
+CartanTable = Dict[Tuple[int, int, int], Surd]
+
+# For each H_r the (index, coefficient) of the category 3 K it is mixed into
+_Mixing = List[List[Tuple[int, Fraction]]]
+
+# A matrix that is I**phase times a real sparse matrix: (phase, {(a, b): entry})
+_Generator = Tuple[int, Dict[Tuple[int, int], Surd]]
+
+
+def _pairs(n: int) -> List[Tuple[int, int]]:
+    """The (a, b) pairs (a < b) in the order used to index the category 1 and 2 K."""
+    return list(combinations(range(n), 2))
+
+
+def _generators(n: int) -> List[_Generator]:
+    """
+    Create the E_i matrices: the coefficient of K^i in the L 1-forms.
+
+    The category 1 and 2 E_i are read off the L2K mappings: L_a^b = 1/2 K^i ∓ I/2 K^j
+    for a ≶ b. In place of the category 3 E_i (the diagonal L_a^a = (Qᵀ P k)_a)
+    these are the H_r = diag(Q[r, :]) for r < n - 1, which unlike the E_i do not
+    depend on n (see create_c_table_from_cartan). The last row of Q is proportional
+    to the identity, so it commutes with everything and is left out.
+    """
+    pairs = _pairs(n)
+
+    half = {1: Fraction(1, 2)}
+    minus_half = {1: Fraction(-1, 2)}
+
+    cat_1 = [(0, {(a, b): half, (b, a): half}) for a, b in pairs]
+    cat_2 = [(1, {(a, b): minus_half, (b, a): half}) for a, b in pairs]
+
+    return [*cat_1, *cat_2, *_cartan(n)]
+
+
+def _duals(n: int) -> List[_Generator]:
+    """
+    Create the M_k matrices: the coefficient of L_a^b in K^k.
+
+    The category 1 and 2 M_k are read off the K2L mappings and, as for the
+    generators, the category 3 are replaced by the H_r.
+    """
+    pairs = _pairs(n)
+
+    one = {1: Fraction(1)}
+    minus_one = {1: Fraction(-1)}
+
+    cat_1 = [(0, {(a, b): one, (b, a): one}) for a, b in pairs]
+    cat_2 = [(1, {(a, b): one, (b, a): minus_one}) for a, b in pairs]
+
+    return [*cat_1, *cat_2, *_cartan(n)]
+
+
+def _cartan(n: int) -> List[_Generator]:
+    """The diagonal H_r = diag(Q[r, :]) for r < n - 1."""
+    Q = _create_Q_matrix(n)
+
+    return [(0, _diagonal(Q[r, :])) for r in range(n - 1)]
+
+
+def _diagonal(vector: List[Expr]) -> Dict[Tuple[int, int], Surd]:
+    """Sparse diagonal matrix from a vector, dropping zero entries."""
+    entries = ((a, to_surd(v)) for a, v in enumerate(vector))
+
+    return {(a, a): v for a, v in entries if v}
+
+
+def _commutator(
+    A: Dict[Tuple[int, int], Surd], B: Dict[Tuple[int, int], Surd]
+) -> Dict[Tuple[int, int], List[Surd]]:
+    """Sparse commutator [A, B] with the terms of each entry left unsummed."""
+    rows_B: Dict[int, List[Tuple[int, Surd]]] = {}
+    rows_A: Dict[int, List[Tuple[int, Surd]]] = {}
+
+    for (a, b), v in B.items():
+        rows_B.setdefault(a, []).append((b, v))
+
+    for (a, b), v in A.items():
+        rows_A.setdefault(a, []).append((b, v))
+
+    terms: Dict[Tuple[int, int], List[Surd]] = {}
+
+    for (a, c), u in A.items():
+        for b, v in rows_B.get(c, ()):
+            terms.setdefault((a, b), []).append(surd_mul(u, v))
+
+    for (a, c), u in B.items():
+        for b, v in rows_A.get(c, ()):
+            terms.setdefault((a, b), []).append(
+                {s: -q for s, q in surd_mul(u, v).items()}
+            )
+
+    return terms
+
+
+def _bracket_table(
+    E: List[_Generator], M: List[_Generator], pairs: Iterable[Tuple[int, int]]
+) -> CartanTable:
+    """Calculate the non-zero c_ij^k (and c_ji^k) for the (i, j) pairs (i < j)."""
+    # Index the duals by matrix entry so projecting a commutator is a lookup
+    duals_at: Dict[Tuple[int, int], List[Tuple[int, Surd]]] = {}
+
+    for k, (_, entries) in enumerate(M):
+        for ab, v in entries.items():
+            duals_at.setdefault(ab, []).append((k, v))
+
+    table: CartanTable = {}
+
+    for i, j in pairs:
+        p_i, E_i = E[i]
+        p_j, E_j = E[j]
+
+        projections: Dict[int, List[Surd]] = {}
+
+        for ab, terms in _commutator(E_i, E_j).items():
+            if not (ab in duals_at and (entry := surd_sum(terms))):
+                continue
+
+            for k, m in duals_at[ab]:
+                projections.setdefault(k, []).append(surd_mul(m, entry))
+
+        for k, terms in projections.items():
+            surd = surd_sum(terms)
+
+            if not surd:
+                continue
+
+            # -I = I**3 so the total phase of c_ij^k is I**(3 + p_i + p_j + p_k)
+            phase = (3 + p_i + p_j + M[k][0]) % 4
+
+            if phase % 2:
+                raise ValueError(f"c_{i}{j}^{k} = {I ** phase} * {surd} is not real")
+
+            value = surd if phase == 0 else surd_scale(surd, Fraction(-1))
+
+            table[(i, j, k)] = value
+            table[(j, i, k)] = surd_scale(value, Fraction(-1))
+
+    return table
+
+
+def _overlapping(E: List[_Generator], new: Iterable[int]) -> List[Tuple[int, int]]:
+    """
+    The (i, j) pairs (i < j) with i or j in new whose E_i and E_j share an index.
+
+    Only those can have a non-zero commutator, and most pairs of category 1 and 2
+    generators do not share one.
+    """
+    touching: Dict[int, Set[int]] = {}
+
+    for i, (_, entries) in enumerate(E):
+        for ab in entries:
+            for a in ab:
+                touching.setdefault(a, set()).add(i)
+
+    pairs = set()
+
+    for i in new:
+        for j in set().union(*(touching[a] for ab in E[i][1] for a in ab)):
+            if i != j:
+                pairs.add((min(i, j), max(i, j)))
+
+    return sorted(pairs)
+
+
+def create_cartan_table(n: int) -> CartanTable:
+    """Create the sparse table of the non-zero structure constants in the H_r basis."""
+    E = _generators(n)
+
+    return _bracket_table(E, _duals(n), _overlapping(E, range(len(E))))
+
+
+def _reindex(n: int) -> Dict[int, int]:
+    """
+    Map the indices of the Cartan table of SU(n) to those of SU(n + 1).
+
+    The pairs (a, b) keep their order but the new pairs (a, n) are interleaved, and
+    the H_r follow the (more numerous) pairs.
+    """
+    old_pairs = _pairs(n)
+    new_index = {pair: i for i, pair in enumerate(_pairs(n + 1))}
+
+    m_old = len(old_pairs)
+    m_new = len(new_index)
+
+    mapping = {}
+
+    for i, pair in enumerate(old_pairs):
+        mapping[i] = new_index[pair]
+        mapping[m_old + i] = m_new + new_index[pair]
+
+    for r in range(n - 1):
+        mapping[2 * m_old + r] = 2 * m_new + r
+
+    return mapping
+
+
+def extend_cartan_table(table: CartanTable, n: int) -> CartanTable:
+    """
+    Create the Cartan table of SU(n + 1) from that of SU(n).
+
+    None of the generators or duals of SU(n) depend on n (the H_r only gain a zero
+    entry) so every entry is reused (re-indexed). The brackets of the old generators
+    have no component along the new ones: they vanish on the new index n, where the
+    new duals (a, n) are supported, and are traceless, while H_(n - 1) is constant on
+    the old indices. So only the brackets involving a new pair (a, n) or H_(n - 1)
+    are calculated, which is O(n²) of the O(n³) non-zero entries.
+    """
+    mapping = _reindex(n)
+
+    reused: CartanTable = {
+        (mapping[i], mapping[j], mapping[k]): value
+        for (i, j, k), value in table.items()
+    }
+
+    E = _generators(n + 1)
+    new = set(range(len(E))) - set(mapping.values())
+
+    return {**reused, **_bracket_table(E, _duals(n + 1), _overlapping(E, new))}
+
+
+def _mixing(P: Matrix, n: int) -> _Mixing:
+    """Read the mixing of the H_r into the category 3 K off the rows of P."""
+    offset = n * (n - 1)
+
+    return [
+        [(offset + k, Fraction(int(c.p), int(c.q))) for k, c in enumerate(row) if c]
+        for row in (P[r, :] for r in range(n - 1))
+    ]
+
+
+def create_c_table_from_cartan(table: CartanTable, n: int) -> CTable:
+    """
+    Create the table of SU(n) in the K basis from the Cartan table.
+
+    The category 3 E_k = Σ_r P[r, k] H_r and M_k = Σ_r P'[k, r] H_r (P' being the
+    category 3 P matrix of the K2L mappings) so the c_ij^k are linear in those. This
+    is the only part of the table that depends on n through the P matrix.
+    """
+    offset = n * (n - 1)
+
+    lower = _mixing(_create_P_matrix(n), n)
+    upper = _mixing(_category_3_P_matrix(n).T, n)
+
+    def _expand(index: int, mixing: _Mixing) -> List[Tuple[int, Fraction]]:
+        return mixing[index - offset] if index >= offset else [(index, Fraction(1))]
+
+    terms: Dict[Tuple[int, int, int], List[Surd]] = {}
+
+    for (i, j, k), value in table.items():
+        for a, p in _expand(i, lower):
+            for b, q in _expand(j, lower):
+                for c, r in _expand(k, upper):
+                    term = value if p == q == r == 1 else surd_scale(value, p * q * r)
+                    terms.setdefault((a, b, c), []).append(term)
+
+    # Many entries share a value so convert each value to sympy once
+    values: Dict[Tuple[Tuple[int, Fraction], ...], Expr] = {}
+    c_table: CTable = {}
+
+    for key, surds in terms.items():
+        surd = surd_sum(surds) if len(surds) > 1 else surds[0]
+
+        if surd:
+            frozen = tuple(sorted(surd.items()))
+
+            if frozen not in values:
+                values[frozen] = from_surd(surd)
+
+            c_table[key] = values[frozen]
+
+    return c_table
+
+
+def create_c_table(n: int) -> CTable:
+    """
+    Create the sparse table of the non-zero structure constants c_ab^c of SU(n).
+
+    The table contains both (a, b, c) and (b, a, c) for every non-zero entry and
+    agrees with create_c_ddu(create_dK(n), n)[a, b, c].
+    """
+    return create_c_table_from_cartan(create_cartan_table(n), n)
+
+
+def iter_c_tables(n_max: int, n_min: int = 2) -> Iterator[Tuple[int, CTable]]:
+    """
+    Create the tables of SU(n) for n_min <= n <= n_max.
+
+    The Cartan tables are extended from each n to the next, so only the mixing by the
+    P matrix is repeated for every n.
+    """
+    table = create_cartan_table(n_min)
+    yield n_min, create_c_table_from_cartan(table, n_min)
+
+    for n in range(n_min, n_max):
+        table = extend_cartan_table(table, n)
+        yield n + 1, create_c_table_from_cartan(table, n + 1)
@@ -0,0 +1,81 @@
+"""
+Exact arithmetic on sums of rational multiples of square roots.
+
+The structure constants of SU(n) (and so every coefficient of the pipeline at a
+rational metric) are sums Σ q_s sqrt(s) over squarefree s, from the normalization of
+the Q matrix. Rather than letting sympy simplify those they are kept as
+{squarefree integer: Fraction} maps, on which sums and products are direct.
+"""
+
+from fractions import Fraction
+from math import gcd
+from sympy import Add, Expr, Rational, S, expand, sqrt
+from typing import Dict, Iterable
+
+
+# Real number of the form Σ q_s * sqrt(s) over squarefree s, stored as {s: q_s}
+Surd = Dict[int, Fraction]
+
+
+def to_surd(expr: Expr) -> Surd:
+    """Convert a sympy sum of rational multiples of square roots to a Surd."""
+    surd: Surd = {}
+
+    for term in Add.make_args(expand(expr)):
+        q, root = term.as_coeff_Mul()
+
+        if root == 1:
+            s = 1
+        elif root.is_Pow and root.exp == S.Half and root.base.is_Integer:
+            s = int(root.base)
+        else:
+            raise ValueError(f"{term} is not a rational multiple of a square root")
+
+        surd[s] = surd.get(s, Fraction(0)) + Fraction(int(q.p), int(q.q))
+
+    return {s: q for s, q in surd.items() if q}
+
+
+def from_surd(surd: Surd) -> Expr:
+    """Convert a Surd back to a sympy expression."""
+    return Add(
+        *(
+            Rational(q.numerator, q.denominator) * sqrt(s)
+            for s, q in sorted(surd.items())
+        )
+    )
+
+
+def surd_scale(surd: Surd, q: Fraction) -> Surd:
+    """Multiply a Surd by a rational."""
+    return {s: p * q for s, p in surd.items()}
+
+
+def surd_mul(u: Surd, v: Surd) -> Surd:
+    """Multiply two Surds using sqrt(a) sqrt(b) = g sqrt(ab / g²) with g = gcd(a, b)."""
+    if len(v) == 1 and 1 in v:  # Scaling by a rational (the common case)
+        return surd_scale(u, v[1])
+
+    if len(u) == 1 and 1 in u:
+        return surd_scale(v, u[1])
+
+    result: Surd = {}
+
+    for a, p in u.items():
+        for b, q in v.items():
+            g = gcd(a, b)
+            s = (a // g) * (b // g)
+            result[s] = result.get(s, Fraction(0)) + p * q * g
+
+    return result
+
+
+def surd_sum(surds: Iterable[Surd]) -> Surd:
+    """Sum several Surds dropping the terms that cancel."""
+    result: Surd = {}
+
+    for surd in surds:
+        for s, q in surd.items():
+            result[s] = result.get(s, Fraction(0)) + q
+
+    return {s: q for s, q in result.items() if q}
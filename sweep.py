@@ -0,0 +1,140 @@
+"""
+Evaluate the Einstein condition over grids of the metric constants with NumPy.
+
+The 3 unique elements of the Ricci tensor are compiled (with lambdify) into a single
+vectorized function of x1, x2 and x3. For a metric constant x_i the Einstein condition
+R_ii = lambda x_i implies lambda_i = R_ii / x_i, so the metric is Einstein exactly
+where the three implied values agree. This is used to map where the condition nearly
+holds before running the exact solver.
+"""
+
+import numpy as np
+
+from sympy import Expr, lambdify
+from typing import Callable, NamedTuple, Optional, Sequence, Tuple, Union
+
+from metric import x1, x2, x3
+
+
+# Evaluates the implied lambdas, shape (3, *broadcast shape of the arguments)
+LambdaFunction = Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+
+class Sweep(NamedTuple):
+    """The Einstein condition evaluated over a grid of (x1, x2) with x3 fixed."""
+
+    x1: np.ndarray  # The x1 value at every grid point
+    x2: np.ndarray  # The x2 value at every grid point
+    lmbda: np.ndarray  # The lambda implied by the x3 component, R_33 / x3
+    residuals: np.ndarray  # lambda_1 - lambda and lambda_2 - lambda, shape (2, ...)
+
+
+def compile_lambdas(
+    n: Optional[int] = None, elements: Optional[Sequence[Expr]] = None
+) -> LambdaFunction:
+    """
+    Compile the implied lambdas R_ii / x_i into a vectorized NumPy function.
+
+    :param n: Look the Ricci elements up in cache.ricci for SU(n) (calculated on a miss)
+    :param elements: Or use these 3 unique elements of the Ricci tensor directly
+    """
+    if elements is None:
+        if n is None:
+            raise ValueError("Either n or elements must be specified")
+
+        # Imported here so compiling given elements never touches the store
+        from cache import ricci
+
+        elements = ricci[n]
+
+    lambdas = [e / x for e, x in zip(elements, (x1, x2, x3))]
+    function = lambdify((x1, x2, x3), lambdas, modules="numpy", cse=True)
+
+    def evaluate(x1_s: np.ndarray, x2_s: np.ndarray, x3_s: np.ndarray) -> np.ndarray:
+        # Broadcast so that constant entries (e.g. 1/x3 at x3=1) still fill the grid
+        arrays = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (x1_s, x2_s, x3_s))
+        )
+        values = function(*arrays)
+        shape = np.broadcast_shapes(arrays[0].shape, *(np.shape(v) for v in values))
+
+        return np.stack([np.broadcast_to(v, shape) for v in values])
+
+    return evaluate
+
+
+def residuals(lambdas: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split the implied lambdas into lambda and the residuals of the Einstein condition.
+
+    The lambda is taken from the x3 component and the residuals are lambda_1 - lambda
+    and lambda_2 - lambda, which both vanish exactly at the Einstein metrics.
+    """
+    lmbda = lambdas[2]
+
+    return lmbda, lambdas[:2] - lmbda
+
+
+def sweep(
+    x1_values: Union[Sequence[float], np.ndarray],
+    x2_values: Union[Sequence[float], np.ndarray],
+    n: Optional[int] = None,
+    elements: Optional[Sequence[Expr]] = None,
+    x3_value: float = 1.0,
+    function: Optional[LambdaFunction] = None,
+) -> Sweep:
+    """
+    Evaluate lambda and the residuals over the grid x1_values x x2_values.
+
+    The grid arrays are indexed [i, j] for x1_values[i] and x2_values[j].
+
+    :param function: A function from compile_lambdas (compiled from n or elements if
+        not specified), to reuse across sweeps
+    """
+    if function is None:
+        function = compile_lambdas(n, elements)
+
+    X1, X2 = np.meshgrid(
+        np.asarray(x1_values, dtype=float),
+        np.asarray(x2_values, dtype=float),
+        indexing="ij",
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lmbda, res = residuals(function(X1, X2, np.full_like(X1, x3_value)))
+
+    return Sweep(X1, X2, lmbda, res)
+
+
+def sign_changes(values: np.ndarray) -> np.ndarray:
+    """
+    Find the cells of a 2D grid the zero set of values passes through.
+
+    The result has shape (rows - 1, columns - 1) and is True for every cell whose four
+    corners do not all have the same (strict) sign, or with a zero at a corner. Cells
+    with a non-finite corner are never marked.
+    """
+    corners = np.stack(
+        [values[:-1, :-1], values[1:, :-1], values[:-1, 1:], values[1:, 1:]]
+    )
+    signs = np.sign(corners)
+
+    finite = np.isfinite(corners).all(axis=0)
+    crosses = (signs.max(axis=0) >= 0) & (signs.min(axis=0) <= 0)
+
+    return np.asarray(finite & crosses, dtype=bool)
+
+
+def candidates(result: Sweep) -> np.ndarray:
+    """
+    Find the grid cells where both residuals change sign, i.e. near Einstein metrics.
+
+    Returns the (x1, x2) centres of those cells, shape (count, 2).
+    """
+    mask = sign_changes(result.residuals[0]) & sign_changes(result.residuals[1])
+    rows, columns = np.nonzero(mask)
+
+    x1_c = (result.x1[rows, columns] + result.x1[rows + 1, columns]) / 2
+    x2_c = (result.x2[rows, columns] + result.x2[rows, columns + 1]) / 2
+
+    return np.stack([x1_c, x2_c], axis=-1)
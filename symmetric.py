@@ -0,0 +1,175 @@
+"""
+Tensors that store only their independent components.
+
+A symmetry is a permutation of the axes together with a sign: the tensor is
+unchanged (sign 1) or negated (sign -1) when its indices are permuted. Every index
+is mapped to a canonical representative of its orbit under the symmetries (the
+smallest index tuple) so only one component per orbit is stored and the rest are
+derived by a sign flip on access. Indices mapped to themselves with a sign of -1
+(e.g. the diagonal of an antisymmetric pair) are identically zero.
+"""
+
+from itertools import product
+from sympy import Array, Integer
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+
+# (permutation of the axes, sign)
+Symmetry = Tuple[Tuple[int, ...], int]
+
+Index = Tuple[int, ...]
+
+
+def antisymmetric(i: int, j: int, rank: int) -> Symmetry:
+    """The tensor changes sign when the axes i and j are swapped."""
+    axes = list(range(rank))
+    axes[i], axes[j] = j, i
+
+    return tuple(axes), -1
+
+
+def pair_symmetric(rank: int = 4) -> Symmetry:
+    """The tensor is unchanged when the first and second pairs of axes are swapped."""
+    return (2, 3, 0, 1, *range(4, rank)), 1
+
+
+# The symmetries of R_abcd (with the first index lowered)
+RIEMANN_SYMMETRIES = (antisymmetric(0, 1, 4), antisymmetric(2, 3, 4), pair_symmetric())
+
+
+def _permute(index: Index, axes: Tuple[int, ...]) -> Index:
+    return tuple(index[axis] for axis in axes)
+
+
+class SymmetricTensor:
+    """
+    A tensor with index symmetries storing only its independent, non-zero components.
+
+    The components can be sympy expressions or anything else supporting negation
+    (e.g. forms), with zero used for the missing ones.
+    """
+
+    __slots__ = ("shape", "symmetries", "zero", "components")
+
+    def __init__(
+        self,
+        shape: Sequence[int],
+        symmetries: Sequence[Symmetry],
+        components: Optional[Dict[Index, Any]] = None,
+        zero: Any = Integer(0),
+    ):
+        """
+        Create the tensor.
+
+        :param shape: The shape of the (dense) tensor
+        :param symmetries: The symmetries generating the group acting on the indices
+        :param components: Initial {index: value} components (any index in an orbit)
+        :param zero: The value of the zero components
+        """
+        self.shape = tuple(shape)
+        self.symmetries = tuple(symmetries)
+        self.zero = zero
+        self.components: Dict[Index, Any] = {}
+
+        for index, value in (components or {}).items():
+            self[index] = value
+
+    def canonical(self, index: Index) -> Tuple[Optional[Index], int]:
+        """
+        Map the index to its canonical representative and the sign relating them.
+
+        Returns (None, 0) for indices whose component is identically zero.
+        """
+        signs = {tuple(index): 1}
+        pending = [tuple(index)]
+
+        while pending:
+            current = pending.pop()
+
+            for axes, sign in self.symmetries:
+                image = _permute(current, axes)
+                image_sign = signs[current] * sign
+
+                if image not in signs:
+                    signs[image] = image_sign
+                    pending.append(image)
+
+                elif signs[image] != image_sign:
+                    return None, 0
+
+        rep = min(signs)
+
+        return rep, signs[rep]
+
+    def __getitem__(self, index: Index) -> Any:
+        rep, sign = self.canonical(index)
+
+        if rep is None or rep not in self.components:
+            return self.zero
+
+        value = self.components[rep]
+
+        return value if sign == 1 else -value
+
+    def __setitem__(self, index: Index, value: Any) -> None:
+        """Set the component (and so all the components related to it by symmetry)."""
+        rep, sign = self.canonical(index)
+
+        if rep is None:
+            if value != 0:
+                raise ValueError(f"The component {index} is identically zero")
+            return
+
+        if value == 0:
+            self.components.pop(rep, None)
+        else:
+            self.components[rep] = value if sign == 1 else -value
+
+    def __len__(self) -> int:
+        """Number of stored (independent, non-zero) components."""
+        return len(self.components)
+
+    def items(self) -> Iterator[Tuple[Index, Any]]:
+        """Iterate over the stored (canonical index, value) pairs."""
+        return iter(self.components.items())
+
+    def independent_indices(self) -> Iterator[Index]:
+        """Iterate over the canonical indices (whether the component is zero or not)."""
+        for index in product(*(range(s) for s in self.shape)):
+            if self.canonical(index) == (index, 1):
+                yield index
+
+    def applyfunc(self, f: Callable[[Any], Any]) -> "SymmetricTensor":
+        """Apply a function (e.g. expand) to every stored component."""
+        return SymmetricTensor(
+            self.shape,
+            self.symmetries,
+            {index: f(value) for index, value in self.components.items()},
+            self.zero,
+        )
+
+    def scale_index(self, axis: int, weights: Sequence[Any]) -> "SymmetricTensor":
+        """
+        Multiply every component by the weight of its index along the axis.
+
+        Only valid when no symmetry moves the axis, so that the scaling commutes with
+        the symmetries.
+        """
+        if any(axes[axis] != axis for axes, _ in self.symmetries):
+            raise ValueError(f"Scaling axis {axis} does not respect the symmetries")
+
+        return SymmetricTensor(
+            self.shape,
+            self.symmetries,
+            {
+                index: value * weights[index[axis]]
+                for index, value in self.components.items()
+            },
+            self.zero,
+        )
+
+    def to_array(self) -> Array:
+        """Convert to a dense sympy Array."""
+        indices = product(*(range(s) for s in self.shape))
+
+        return Array([self[index] for index in indices], self.shape)
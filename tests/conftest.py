@@ -5,12 +5,22 @@ from sympy import Array, Expr
 from typing import List
 
 from c_tensor import create_c_ddd, create_c_ddu
-from differentials import create_dK
+from differentials import create_dK, create_dK_forms
+from forms import OneFormMatrix, TwoForm, TwoFormMatrix
 from K_1_forms import create_K_u
 from metric import create_metric
 from ricci import create_R_uddd
-from theta_tensor import create_theta_ud
-from w_tensor import create_w_dd, create_w_ud, create_w_wedge_ud, create_dw_ud
+from theta_tensor import create_theta_ud, create_theta_ud_forms
+from w_tensor import (
+    create_w_dd,
+    create_w_dd_forms,
+    create_w_ud,
+    create_w_ud_forms,
+    create_w_wedge_ud,
+    create_w_wedge_ud_forms,
+    create_dw_ud,
+    create_dw_ud_forms,
+)
 
 
 @pytest.fixture(name="dK")
@@ -25,7 +35,7 @@ def c_ddd_fixture(n: int, dK: List[Expr]) -> Array:
     g_dd, _ = create_metric(n)
     c_ddu = create_c_ddu(dK, n)
 
-    return create_c_ddd(c_ddu, g_dd)
+    return create_c_ddd(c_ddu, g_dd).to_array()
 
 
 @pytest.fixture(name="K_u")
@@ -84,3 +94,26 @@ def theta_ud_fixture(n: int, dw_ud: Array, w_wedge_ud: Array) -> Array:
 def R_uddd_fixture(n: int, theta_ud: Array) -> Array:
     """Create R_uddd for testing."""
     return create_R_uddd(n, theta_ud)
+
+
+@pytest.fixture(name="dK_forms")
+def dK_forms_fixture(n: int) -> List[TwoForm]:
+    """Create the dK as TwoForms."""
+    return create_dK_forms(n)
+
+
+@pytest.fixture(name="w_ud_forms")
+def w_ud_forms_fixture(c_ddd: Array, g_uu: Array) -> OneFormMatrix:
+    """Create w_ud as OneForms for testing."""
+    return create_w_ud_forms(create_w_dd_forms(c_ddd), g_uu)
+
+
+@pytest.fixture(name="theta_ud_forms")
+def theta_ud_forms_fixture(
+    n: int, w_ud_forms: OneFormMatrix, dK_forms: List[TwoForm]
+) -> TwoFormMatrix:
+    """Create theta_ud as TwoForms for testing."""
+    dw_ud = create_dw_ud_forms(w_ud_forms, dK_forms)
+    w_wedge_ud = create_w_wedge_ud_forms(n, w_ud_forms)
+
+    return create_theta_ud_forms(dw_ud, w_wedge_ud)
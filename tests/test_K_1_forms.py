@@ -1,5 +1,6 @@
 """Test the su(n) K 1-forms module."""
 
+import pickle
 import sympy as sp
 
 import K_1_forms as sut
@@ -95,3 +96,17 @@ def test_create_K_u_n_equals_2() -> None:
     assert K_u[0] == sut.K(0)
     assert K_u[1] == sut.K(1)
     assert K_u[2] == sut.K(2)
+
+
+def test_pickle_K_1_forms() -> None:
+    """K 1-forms are pickled as just their index."""
+    # GIVEN
+    k = sut.K(7)
+
+    # WHEN
+    data = pickle.dumps(k)
+
+    # THEN
+    assert pickle.loads(data) == k
+    assert pickle.loads(data).index == 7
+    assert len(data) < 64
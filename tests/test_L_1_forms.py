@@ -1,5 +1,6 @@
 """Test the su_n_one_forms module."""
 
+import pickle
 import sympy as sp
 import L_1_forms as sut
 
@@ -124,3 +125,16 @@ def test_create_L_1_forms() -> None:
     for i in range(3):
         for j in range(3):
             assert isinstance(L[i][j], sp.Expr)
+
+
+def test_pickle_L_1_forms() -> None:
+    """L 1-forms are pickled as just their indices."""
+    # GIVEN
+    l_12 = sut.L(1, 2)
+
+    # WHEN
+    data = pickle.dumps(l_12)
+
+    # THEN
+    assert pickle.loads(data) == l_12
+    assert len(data) < 64
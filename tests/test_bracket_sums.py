@@ -0,0 +1,88 @@
+"""Test the bracket_sums module."""
+
+import numpy as np
+import pytest
+
+from sympy import Symbol, cancel
+
+import bracket_sums as sut
+
+from metric import x1, x2, x3
+from numeric import curvature
+from ricci import representative_indices
+from ricci_store import RicciStore
+from structure_constants import create_c_table
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 5])
+def test_create_R_dd(n: int) -> None:
+    """The Ricci tensor is diagonal and agrees with the stored results."""
+    # GIVEN
+    sums = sut.create_bracket_sums(create_c_table(n), sut.category_labels(n))
+
+    # WHEN
+    R_dd = sut.create_R_dd(sums, (x1, x2, x3))
+
+    # THEN
+    assert all(b == d for b, d in R_dd) and len(R_dd) == n ** 2 - 1
+
+    for i, expected in zip(representative_indices(n), RicciStore(calculate=None)[n]):
+        assert cancel(R_dd[i, i] - expected) == 0
+
+
+def test_split_labels() -> None:
+    """Every diagonal generator gets its own metric constant."""
+    # GIVEN
+    n = 4
+    constants = sut.split_constants(n)
+    sums = sut.create_bracket_sums(create_c_table(n), sut.split_labels(n))
+
+    # WHEN
+    R_dd = sut.create_R_dd(sums, constants)
+
+    # THEN
+    assert sut.split_labels(n) == (0,) * 6 + (1,) * 6 + (2, 3, 4)
+    assert all(b == d for b, d in R_dd)
+
+    # Each diagonal element only depends on its own constant, which agrees with the
+    # numeric calculation when they are all equal
+    for i, x in zip(range(12, 15), constants[2:]):
+        assert R_dd[i, i].free_symbols == {x1, x2, x}
+
+    point = {x1: 0.7, x2: 1.3, **{x: 2.1 for x in constants[2:]}}
+    ricci = curvature(n, np.array([[0.7, 1.3, 2.1]])).ricci[0]
+
+    assert [float(R_dd[i, i].subs(point)) for i in range(15)] == pytest.approx(
+        np.diag(ricci)
+    )
+
+
+def test_regroup() -> None:
+    """Regrouping the finest sums is the same as calculating the coarser ones."""
+    # GIVEN
+    n = 4
+    c_table = create_c_table(n)
+    fine = sut.create_bracket_sums(c_table, sut.split_labels(n))
+    mapping = {0: 0, 1: 1, **{label: 2 for label in range(2, n + 1)}}
+
+    # WHEN
+    coarse = sut.regroup(fine, mapping)
+
+    # THEN
+    assert coarse == sut.create_bracket_sums(c_table, sut.category_labels(n))
+
+
+def test_recombination_with_other_constants() -> None:
+    """The same sums give the Ricci tensor for other values of the constants."""
+    # GIVEN
+    n = 3
+    y = Symbol("y")
+    sums = sut.create_bracket_sums(create_c_table(n), sut.category_labels(n))
+    R_dd = sut.create_R_dd(sums, (x1, x2, x3))
+
+    # WHEN
+    scaled = sut.create_R_dd(sums, (y * x1, y * x2, y * x3))
+
+    # THEN
+    # The Ricci tensor is invariant under scaling the metric
+    assert all(cancel(scaled[key] - value) == 0 for key, value in R_dd.items())
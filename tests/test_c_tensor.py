@@ -2,12 +2,14 @@
 
 from itertools import product
 import pytest
-from sympy import expand, sqrt
+from sympy import Array, expand, sqrt
 from sympy.tensor import permutedims as pd
 
 from differentials import create_dK
 from K_1_forms import K
 from metric import create_metric, x1, x2, x3
+from structure_constants import create_c_table
+from wedge import wedge_coeffs
 
 import c_tensor as sut
 
@@ -16,7 +18,7 @@ def test_coeff_n_equals_2() -> None:
     """Test _coeff against hand-calculations for n=2."""
     # GIVEN
     n = 2
-    dK = create_dK(n)
+    dK = [wedge_coeffs(e) for e in create_dK(n)]
 
     # THEN
     assert sut._coeff(dK, 0, 1, 2) == -1 * sqrt(2)
@@ -53,7 +55,8 @@ def test_create_c_ddu() -> None:
             assert len(set((i, j, k))) == 3  # Unique indices
 
     # Verify that c_ddu is antisymmetric in the first two indices
-    antisymm_sum = c_ddu + pd(c_ddu, (1, 0, 2))
+    dense = c_ddu.to_array()
+    antisymm_sum = dense + pd(dense, (1, 0, 2))
 
     for i, j, k in product(range(dim), repeat=3):
         assert antisymm_sum[i, j, k] == 0
@@ -69,6 +72,8 @@ def test_create_c_ddu_n_equals_2() -> None:
     c_ddu = sut.create_c_ddu(dK, n)
 
     # THEN
+    assert len(c_ddu) == 3  # Only the independent components are stored
+
     assert c_ddu[1, 2, 0] == sqrt(2)
     assert c_ddu[0, 2, 1] == -1 * sqrt(2)
     assert c_ddu[0, 1, 2] == 1 / sqrt(2)
@@ -127,7 +132,37 @@ def test_create_c_ddd(n: int) -> None:
             assert len(set((i, j, k))) == 3  # Unique indices
 
     # Verify that c_ddu is antisymmetric in the first two indices
-    antisymm_sum = (c_ddd + pd(c_ddd, (1, 0, 2))).applyfunc(expand)
+    dense = c_ddd.to_array()
+    antisymm_sum = (dense + pd(dense, (1, 0, 2))).applyfunc(expand)
 
     for i, j, k in product(range(dim), repeat=3):
         assert antisymm_sum[i, j, k] == 0
+
+
+@pytest.mark.parametrize("n", (2, 3))
+def test_create_c_ddu_from_table(n: int) -> None:
+    """The c_ddu created from the structure constant table matches the dK route."""
+    # GIVEN
+    c_table = create_c_table(n)
+
+    # WHEN
+    c_ddu = sut.create_c_ddu_from_table(c_table, n)
+
+    # THEN
+    assert len(c_ddu) == len(c_table) // 2
+    assert c_ddu.to_array() == sut.create_c_ddu(create_dK(n), n).to_array()
+
+
+@pytest.mark.parametrize("n", (3,))
+def test_create_c_ddd_symmetric(n: int, g_dd: Array) -> None:
+    """Lowering the index of the symmetric c_ddu matches lowering the dense one."""
+    # GIVEN
+    c_ddu = sut.create_c_ddu_from_table(create_c_table(n), n)
+
+    # WHEN
+    c_ddd = sut.create_c_ddd(c_ddu, g_dd)
+
+    # THEN
+    expected = sut.create_c_ddd(c_ddu.to_array(), g_dd)
+
+    assert c_ddd.to_array().applyfunc(expand) == expected.applyfunc(expand)
@@ -0,0 +1,119 @@
+"""Test the checkpoint module."""
+
+import os
+
+from typing import Callable, List
+
+import checkpoint as sut
+import forms
+import laurent
+import numpy as np
+import ricci
+import wedge
+
+
+def _counter(calls: List[str], name: str, value: int) -> Callable[[], int]:
+    """Create a compute function recording its calls."""
+
+    def compute() -> int:
+        calls.append(name)
+        return value
+
+    return compute
+
+
+def test_stage_is_reused(tmp_path: str) -> None:
+    """A stage is only calculated once and then loaded from the directory."""
+    # GIVEN
+    calls: List[str] = []
+    first = sut.Checkpoint(2, str(tmp_path))
+    second = sut.Checkpoint(2, str(tmp_path))
+
+    # WHEN
+    a = first.stage("a", _counter(calls, "a", 1), modules=(wedge,))
+    b = second.stage("a", _counter(calls, "a", 2), modules=(wedge,))
+
+    # THEN
+    assert a == b == 1
+    assert calls == ["a"]
+    assert os.path.exists(first.path("a", first.keys["a"]))
+
+
+def test_changed_inputs_are_recalculated(tmp_path: str) -> None:
+    """A change upstream changes the key of every stage downstream."""
+    # GIVEN
+    calls: List[str] = []
+
+    def run(params: int) -> None:
+        cp = sut.Checkpoint(2, str(tmp_path))
+        cp.stage("a", _counter(calls, "a", params), params=params)
+        cp.stage("b", _counter(calls, "b", 0), inputs=("a",))
+        cp.stage("c", _counter(calls, "c", 0))
+
+    # WHEN
+    run(1)
+    run(1)
+    run(2)
+
+    # THEN
+    assert calls == ["a", "b", "c", "a", "b"]
+
+
+def test_keys_depend_on_n_and_code() -> None:
+    """The key of a stage changes with n and with the modules implementing it."""
+    # GIVEN
+    cp_2 = sut.Checkpoint(2)
+    cp_3 = sut.Checkpoint(3)
+
+    # THEN
+    assert cp_2.key("a", modules=(wedge,)) == cp_2.key("a", modules=(wedge,))
+    assert cp_2.key("a", modules=(wedge,)) != cp_3.key("a", modules=(wedge,))
+    assert cp_2.key("a", modules=(wedge,)) != cp_2.key("a", modules=(forms,))
+
+
+def test_dependencies() -> None:
+    """The modules of the repository a stage uses are fingerprinted too, transitively."""
+    # WHEN
+    modules = sut.dependencies([ricci])
+
+    # THEN
+    assert {ricci, forms, laurent, wedge} <= set(modules)
+    assert np not in modules
+    assert modules == sorted(modules, key=lambda module: module.__name__)
+    assert sut.dependencies([wedge, ricci]) == modules
+
+
+def test_no_resume_and_no_directory(tmp_path: str) -> None:
+    """Without resume stages are recalculated, without a directory nothing is saved."""
+    # GIVEN
+    calls: List[str] = []
+    sut.Checkpoint(2, str(tmp_path)).stage("a", _counter(calls, "a", 1))
+
+    # WHEN
+    value = sut.Checkpoint(2, str(tmp_path), resume=False).stage(
+        "a", _counter(calls, "a", 2)
+    )
+    sut.Checkpoint(4).stage("a", _counter(calls, "a", 3))
+
+    # THEN
+    assert value == 2
+    assert calls == ["a", "a", "a"]
+    assert os.listdir(tmp_path) == ["n_2"]
+    assert sut.Checkpoint(2, str(tmp_path)).stage("a", _counter(calls, "a", 4)) == 2
+
+
+def test_load(tmp_path: str) -> None:
+    """The stored artifact of a stage is loaded without calculating it."""
+    # GIVEN
+    calls: List[str] = []
+    sut.Checkpoint(2, str(tmp_path)).stage("a", _counter(calls, "a", 1), params=5)
+
+    # WHEN
+    cp = sut.Checkpoint(2, str(tmp_path))
+
+    # THEN
+    assert cp.load("a", params=5) == 1
+    assert cp.load("a", params=6) is None
+    assert sut.Checkpoint(3, str(tmp_path)).load("a", params=5) is None
+    assert sut.Checkpoint(2).load("a", params=5) is None
+    assert calls == ["a"]
@@ -0,0 +1,109 @@
+"""Test the closed_form module."""
+
+import json
+import os
+import pytest
+
+from sympy import Expr, cancel
+from typing import Dict, List
+
+import closed_form as sut
+
+from metric import x1, x2, x3
+from ricci_store import RicciStore, to_string
+
+
+def _samples(ns: range) -> Dict[int, List[Expr]]:
+    """Elements with coefficients linear and quadratic in n."""
+    return {
+        n: [n * x1 / x2 + 1, (n ** 2 - 1) * x2 ** 2 / (x1 * x3), (n - 2) * x3 / x1]
+        for n in ns
+    }
+
+
+def test_fit() -> None:
+    """The closed forms reproduce the samples and extrapolate to other n."""
+    # GIVEN
+    samples = _samples(range(4, 8))
+
+    # WHEN
+    forms = sut.fit(samples)
+
+    # THEN
+    assert sut.verify(forms, samples) == []
+    assert sut.verify(forms, _samples(range(8, 12))) == []
+    assert cancel(sut.evaluate(forms, 10)[1] - 99 * x2 ** 2 / (x1 * x3)) == 0
+
+
+def test_verify_rejects_other_dependence_on_n() -> None:
+    """A coefficient which is not polynomial in n fails verification."""
+    # GIVEN
+    samples = {n: [x1 / n, x2, x3] for n in range(4, 8)}
+
+    # WHEN
+    forms = sut.fit(samples)
+
+    # THEN
+    assert sut.verify(forms, {n: [x1 / n, x2, x3] for n in range(8, 10)}) == [8, 9]
+
+
+@pytest.mark.parametrize("n", [2, 4, 5, 6, 7, 8])
+def test_ricci(n: int) -> None:
+    """The closed forms agree with the calculated results."""
+    # GIVEN
+    expected = RicciStore(calculate=None)[n]
+
+    # WHEN
+    elements = sut.ricci(n)
+
+    # THEN
+    assert all(cancel(e - f) == 0 for e, f in zip(elements, expected))
+
+
+def test_exceptions_come_from_the_store() -> None:
+    """The n = 3 results, which do not follow the closed forms, come from the store."""
+    # GIVEN
+    expected = RicciStore(calculate=None)[3]
+
+    # WHEN
+    elements = sut.ricci(3)
+
+    # THEN
+    assert elements == expected
+    assert sut.verify(sut.closed_forms(), {3: expected}) == [3]
+
+
+def test_missing_results_raise(tmp_path: str) -> None:
+    """Missing results for the fit raise rather than being calculated."""
+    # GIVEN
+    store = RicciStore(calculate=None)
+    path = os.path.join(str(tmp_path), "ricci.json")
+
+    data = {str(n): [to_string(e) for e in store[n]] for n in (2, 4, 5, 6, 7)}
+
+    with open(path, "w") as fout:
+        json.dump(data, fout)
+
+    # WHEN / THEN
+    with pytest.raises(LookupError, match="calculate.py 8 --store"):
+        sut.fit_and_verify(RicciStore(path, calculate=sut.ricci))
+
+    with open(path) as fin:
+        assert json.load(fin) == data
+
+
+def test_disagreement_raises(tmp_path: str) -> None:
+    """A fit which does not agree with the other stored results is rejected."""
+    # GIVEN
+    store = RicciStore(calculate=None)
+    path = os.path.join(str(tmp_path), "ricci.json")
+
+    data = {str(n): [to_string(e) for e in store[n]] for n in (2, 4, 5, 6, 7, 8)}
+    data["8"][0] = to_string(store[8][0] + x1)
+
+    with open(path, "w") as fout:
+        json.dump(data, fout)
+
+    # WHEN / THEN
+    with pytest.raises(ValueError, match=r"\[8\]"):
+        sut.fit_and_verify(RicciStore(path, calculate=None))
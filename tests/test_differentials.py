@@ -7,8 +7,10 @@ from sympy import I, expand, sqrt
 
 import differentials as sut
 
+from forms import TwoForm
 from K_1_forms import K
 from L_1_forms import L
+from structure_constants import create_c_table
 from wedge import Wedge
 
 
@@ -99,3 +101,26 @@ def test_create_dK_n_equals_2() -> None:
     assert dK[1] == sqrt(2) * Wedge(K(0), K(2))
     assert dK[2] == -1 * Wedge(K(0), K(1)) / sqrt(2)
     assert dK[3] == 0
+
+
+@pytest.mark.parametrize("n", (2, 3, 4))
+def test_create_dK_forms(n: int) -> None:
+    """The TwoForm differentials agree with the sympy Wedge calculation."""
+    # WHEN
+    dK = sut.create_dK_forms(n)
+
+    # THEN
+    assert len(dK) == n ** 2
+
+    for form, expr in zip(dK, sut.create_dK(n)):
+        assert form == TwoForm.from_expr(expr).applyfunc(expand)
+
+
+@pytest.mark.parametrize("n", (2, 3))
+def test_create_dK_from_table(n: int) -> None:
+    """The dK built from the structure constants agree with the L 1-form route."""
+    # WHEN
+    dK = sut.create_dK_from_table(create_c_table(n), n)
+
+    # THEN
+    assert dK == sut.create_dK_forms(n)
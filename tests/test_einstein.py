@@ -0,0 +1,66 @@
+"""Test the einstein module."""
+
+import numpy as np
+import pytest
+
+from fractions import Fraction
+from sympy import Rational
+
+import einstein as sut
+
+from numeric import curvature
+
+
+@pytest.mark.parametrize(
+    "n, x1, x2, lmbda",
+    [
+        (4, "1/2", "1/14", "13/7"),
+        (4, "1/2", "1/2", "1"),
+        (5, "1/2", "3/34", "155/68"),
+        (5, "1/2", "1/2", "5/4"),
+    ],
+)
+def test_solutions_are_einstein(n: int, x1: str, x2: str, lmbda: str) -> None:
+    """The known solutions (with x3 = 1) satisfy the Einstein condition exactly."""
+    # WHEN
+    result = sut.check(n, x1, x2, 1, lmbda)
+
+    # THEN
+    assert result.is_einstein
+    assert result.residual == {}
+    assert len(result.ricci) == n ** 2 - 1
+
+
+def test_residual() -> None:
+    """A wrong lambda or metric leaves the exact difference in the residual."""
+    # GIVEN
+    n = 4
+
+    # WHEN
+    wrong_lambda = sut.check(n, Rational(1, 2), Rational(1, 2), 1, Rational(3, 2))
+    wrong_metric = sut.check(n, Fraction(1, 2), Fraction(1, 3), 1, 1)
+
+    # THEN
+    assert not wrong_lambda.is_einstein
+    assert set(wrong_lambda.residual.values()) == {Fraction(-1, 4), Fraction(-1, 2)}
+    assert not wrong_metric.is_einstein
+    assert all(a == b for a, b in wrong_metric.residual)
+
+
+@pytest.mark.parametrize("n", [2, 3, 6])
+def test_ricci_tensor(n: int) -> None:
+    """The exact Ricci tensor agrees with the numeric engine."""
+    # GIVEN
+    dim = n ** 2 - 1
+
+    # WHEN
+    ricci = sut.ricci_tensor(n, "7/10", "13/10", "21/10")
+
+    # THEN
+    dense = np.zeros((dim, dim))
+
+    for (a, b), value in ricci.items():
+        dense[a, b] = float(value)
+
+    expected = curvature(n, np.array([[0.7, 1.3, 2.1]])).ricci[0]
+    assert dense == pytest.approx(expected, abs=1e-12)
@@ -0,0 +1,91 @@
+"""Test the elimination module."""
+
+import pytest
+
+from sympy import Expr, Rational, sqrt
+from typing import List, Tuple
+
+import elimination as sut
+
+from cache import ricci
+from metric import x1, x2, x3
+
+
+@pytest.mark.parametrize(
+    "n,expected",
+    [
+        (2, [(Rational(1, 2), Rational(1, 2), Rational(1, 2))]),
+        (3, [(1, 1, Rational(3, 8))]),
+        (
+            4,
+            [
+                (Rational(1, 2), Rational(1, 14), Rational(13, 7)),
+                (Rational(1, 2), Rational(1, 2), 1),
+            ],
+        ),
+        (
+            5,
+            [
+                (Rational(1, 2), Rational(3, 34), Rational(155, 68)),
+                (Rational(1, 2), Rational(1, 2), Rational(5, 4)),
+            ],
+        ),
+    ],
+)
+def test_solve(n: int, expected: List[Tuple[Expr, Expr, Expr]]) -> None:
+    """Only the positive real solutions are found, exactly."""
+    # GIVEN
+    elements = ricci[n]
+
+    # WHEN
+    solutions = sut.solve(elements)
+
+    # THEN
+    assert [tuple(s) for s in solutions] == expected
+
+    for solution in solutions:
+        subs = {x1: solution.x1, x2: solution.x2, x3: 1}
+        assert [e.subs(subs) for e in elements] == [
+            solution.lmbda * x.subs(subs) for x in (x1, x2, x3)
+        ]
+
+
+def test_solve_algebraic() -> None:
+    """Irrational solutions are returned as exact algebraic numbers."""
+    # GIVEN
+    # lambda_1 = lambda_2 = lambda_3 = 1 at x1 = sqrt(2), x2 = 1 (and x1 = -sqrt(2))
+    elements = [x1 ** 3 / 2, x2 ** 2, x3]
+
+    # WHEN
+    solutions = sut.solve(elements)
+
+    # THEN
+    assert len(solutions) == 1
+    assert (solutions[0].x1 - sqrt(2)).simplify() == 0
+    assert solutions[0].x2 == 1 and solutions[0].lmbda == 1
+
+
+def test_einstein_polynomials() -> None:
+    """The denominators and monomial factors are cleared."""
+    # GIVEN
+    elements = [x1 ** 2 / x2, x2 * x1, 2 * x3]
+
+    # WHEN
+    p1, p2, lmbda = sut.einstein_polynomials(elements)
+
+    # THEN
+    assert p1 == x1 - 2 * x2
+    assert p2 == x1 - 2
+    assert lmbda == 2
+
+
+def test_positive_roots() -> None:
+    """Only the positive real roots are isolated."""
+    # GIVEN
+    polynomial = (x1 - 2) ** 2 * (x1 + 3) * (x1 ** 2 + 1) * (2 * x1 - 1)
+
+    # WHEN
+    roots = sut.positive_roots(polynomial, x1)
+
+    # THEN
+    assert roots == [Rational(1, 2), 2]
@@ -0,0 +1,136 @@
+"""Test the forms module."""
+
+import pytest
+
+from sympy import expand
+from sympy.abc import a, b, x, y
+
+import forms as sut
+
+from K_1_forms import K
+from wedge import Wedge
+
+
+def test_one_form_drops_zero_coefficients() -> None:
+    """Zero coefficients are not stored."""
+    # WHEN
+    form = sut.OneForm({0: a, 1: 0, 2: b - b})
+
+    # THEN
+    assert form.coeffs == {0: a}
+
+
+def test_one_form_from_expr() -> None:
+    """Create a OneForm from a linear combination of K 1-forms."""
+    # GIVEN
+    expr = a * K(0) + 2 * K(3) - b * K(0)
+
+    # WHEN
+    form = sut.OneForm.from_expr(expr)
+
+    # THEN
+    assert form.coeffs == {0: a - b, 3: 2}
+    assert expand(form.to_expr()) == expand(expr)
+
+
+def test_one_form_from_unexpanded_expr() -> None:
+    """Create a OneForm from a product over a sum of K 1-forms."""
+    # WHEN
+    form = sut.OneForm.from_expr(x * (K(1) + K(2)))
+
+    # THEN
+    assert form.coeffs == {1: x, 2: x}
+
+
+def test_one_form_from_expr_not_linear() -> None:
+    """A term without a K 1-form is not a 1-form."""
+    with pytest.raises(ValueError):
+        sut.OneForm.from_expr(a * K(0) + b)
+
+
+def test_one_form_arithmetic() -> None:
+    """Addition, subtraction and scalar multiplication act on the coefficients."""
+    # GIVEN
+    u = sut.OneForm({0: a, 1: b})
+    v = sut.OneForm({1: -b, 2: x})
+
+    # THEN
+    assert (u + v).coeffs == {0: a, 2: x}
+    assert (u - u) == 0
+    assert (x * u).coeffs == {0: a * x, 1: b * x}
+    assert (u * x) == x * u
+    assert (-v).coeffs == {1: b, 2: -x}
+
+
+def test_one_form_wedge() -> None:
+    """The wedge of two OneForms is a canonical TwoForm."""
+    # GIVEN
+    u = sut.OneForm({0: a, 2: b})
+    v = sut.OneForm({0: x, 1: y})
+
+    # WHEN
+    result = u ^ v
+
+    # THEN
+    assert result.coeffs == {(0, 1): a * y, (0, 2): -b * x, (1, 2): -b * y}
+    assert (u ^ u) == 0
+
+
+def test_one_form_wedge_matches_wedge_simplification() -> None:
+    """Agrees with expanding and consolidating sympy Wedges."""
+    # GIVEN
+    u = sut.OneForm({0: a, 1: x, 2: b})
+    v = sut.OneForm({0: y, 2: x})
+
+    # WHEN
+    result = (u ^ v).applyfunc(expand)
+
+    # THEN
+    expected = sut.TwoForm.from_expr(
+        expand(
+            a * y * Wedge(K(0), K(0))
+            + a * x * Wedge(K(0), K(2))
+            - x * y * Wedge(K(0), K(1))
+            + x * x * Wedge(K(1), K(2))
+            - b * y * Wedge(K(0), K(2))
+        )
+    ).applyfunc(expand)
+    assert result == expected
+
+
+def test_two_form_canonical_ordering() -> None:
+    """Descending pairs are folded in with a sign flip, equal pairs vanish."""
+    # WHEN
+    form = sut.TwoForm({(1, 0): a, (0, 1): b, (2, 2): x})
+
+    # THEN
+    assert form.coeffs == {(0, 1): b - a}
+    assert form.coeff(0, 1) == b - a
+    assert form.coeff(1, 0) == a - b
+    assert form.coeff(2, 2) == 0
+
+
+def test_two_form_from_and_to_expr() -> None:
+    """Round-trip a TwoForm through a sympy expression."""
+    # GIVEN
+    expr = a * Wedge(K(0), K(1)) + b * Wedge(K(1), K(2))
+
+    # WHEN
+    form = sut.TwoForm.from_expr(expr)
+
+    # THEN
+    assert form.coeffs == {(0, 1): a, (1, 2): b}
+    assert form.to_expr() == expr
+
+
+def test_sum_two_forms() -> None:
+    """Sum several TwoForms collecting the coefficients."""
+    # GIVEN
+    forms = [sut.TwoForm({(0, 1): a}), sut.TwoForm({(0, 1): b, (1, 2): x})]
+
+    # WHEN
+    result = sut.sum_two_forms(forms)
+
+    # THEN
+    assert result.coeffs == {(0, 1): a + b, (1, 2): x}
+    assert sut.sum_two_forms([]) == 0
@@ -0,0 +1,57 @@
+"""Test the invariants module."""
+
+import mpmath
+import os
+import pytest
+
+from sympy import Rational, sqrt
+
+import invariants as sut
+
+from calculate import create_theta
+from metric import create_diagonal_metric, x1, x2, x3
+from ricci import calculate_invariants, create_R_uddd_sparse, iter_R_uddd
+from riemann_io import RiemannWriter
+
+
+@pytest.mark.parametrize("n", [2, 3])
+def test_riem_2(n: int) -> None:
+    """Riem_2 agrees with the exact calculation, also at irrational points."""
+    # GIVEN
+    theta_ud = create_theta(n)
+    evaluator = sut.InvariantEvaluator(n, iter_R_uddd(theta_ud))
+
+    point = (sqrt(2), Rational(3, 5), Rational(7, 4))
+    subs = dict(zip((x1, x2, x3), point))
+
+    R = {
+        index: value.subs(subs)
+        for index, value in create_R_uddd_sparse(n, theta_ud).items()
+    }
+    expected = calculate_invariants(R, create_diagonal_metric(n).subs(subs)).Riem_2
+
+    # WHEN
+    Riem_2 = evaluator.riem_2(point, dps=40)
+
+    # THEN
+    with mpmath.workdps(40):
+        assert mpmath.almosteq(Riem_2, mpmath.mpf(str(expected.evalf(45))), 1e-35)
+
+
+def test_evaluate_from_file(tmp_path: str) -> None:
+    """The invariants of a batch are evaluated from the file read once."""
+    # GIVEN
+    n = 3
+    path = os.path.join(str(tmp_path), "R.jsonl")
+
+    with RiemannWriter(path, n) as writer:
+        writer.write_all(iter_R_uddd(create_theta(n)))
+
+    evaluator = sut.InvariantEvaluator.from_file(n, path)
+
+    # WHEN
+    # The bi-invariant metric has Riem_2 / lambda² = 40, at any scale
+    values = evaluator.evaluate([(1, 1, 1, Rational(3, 8)), (2, 2, 2, Rational(3, 16))])
+
+    # THEN
+    assert [float(v) for v in values] == pytest.approx([40, 40])
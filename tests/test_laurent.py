@@ -0,0 +1,109 @@
+"""Test the laurent module."""
+
+import pytest
+
+from fractions import Fraction
+from sympy import Rational, expand, sqrt
+from sympy.abc import a
+
+import laurent as sut
+
+from calculate import create_theta
+from metric import x1, x2, x3
+from ricci import create_R_dd_direct
+
+
+def test_from_expr_and_to_expr() -> None:
+    """Sympy Laurent polynomials with surd coefficients round trip."""
+    # GIVEN
+    expr = (x1 + sqrt(2) * x2) ** 2 / x3 - Rational(1, 3) * sqrt(6) / x1
+
+    # WHEN
+    polynomial = sut.LaurentPolynomial.from_expr(expr)
+
+    # THEN
+    assert polynomial.terms == {
+        (2, 0, -1, 1): Fraction(1),
+        (1, 1, -1, 2): Fraction(2),
+        (0, 2, -1, 1): Fraction(2),
+        (-1, 0, 0, 6): Fraction(-1, 3),
+    }
+    assert expand(polynomial.to_expr() - expr) == 0
+
+    with pytest.raises(ValueError):
+        sut.LaurentPolynomial.from_expr(a * x1)
+
+    with pytest.raises(ValueError):
+        sut.LaurentPolynomial.from_expr(1 / (x1 + x2))
+
+
+def test_arithmetic() -> None:
+    """The arithmetic agrees with sympy's."""
+    # GIVEN
+    X1, X2, X3 = sut.laurent_generators()
+    p = X1 + sqrt(2) * X2 / X3
+    q = sqrt(3) * X3 - 2 / X1
+
+    expected_p = x1 + sqrt(2) * x2 / x3
+    expected_q = sqrt(3) * x3 - 2 / x1
+
+    # THEN
+    assert (p + q).to_expr() == expand(expected_p + expected_q)
+    assert (p - q).to_expr() == expand(expected_p - expected_q)
+    assert (p * q).to_expr() == expand(expected_p * expected_q)
+    assert (p ** 2 / X2).to_expr() == expand(expected_p ** 2 / x2)
+    assert (sqrt(6) / (sqrt(2) * X1)).to_expr() == sqrt(3) / x1
+
+    assert p - p == 0
+    assert not (p - p)
+    assert p * 0 == 0
+    assert Rational(1, 2) * p == p / 2 == expected_p / 2
+
+    with pytest.raises(ValueError):
+        p.inverse()
+
+
+def test_hash() -> None:
+    """Polynomials equal to numbers hash like them, so they can be used as keys."""
+    # GIVEN
+    X1, X2, _ = sut.laurent_generators()
+
+    # THEN
+    assert hash(sut.LaurentPolynomial.constant(1)) == hash(1)
+    assert hash(X1 / X1) == hash(1)
+    assert hash(X1 - X1) == hash(0)
+    assert hash(sut.LaurentPolynomial.constant(Fraction(3, 4))) == hash(Fraction(3, 4))
+    assert len({X1 / X1, 1, X1 + X2, X2 + X1}) == 2
+
+
+def test_expand_coeff_and_as_expr() -> None:
+    """Only sympy coefficients are expanded, LaurentPolynomials are converted."""
+    # GIVEN
+    X1, _, _ = sut.laurent_generators()
+
+    # THEN
+    assert sut.expand_coeff(X1 + 1) == X1 + 1
+    assert sut.expand_coeff(x1 * (x1 + 1)) == x1 ** 2 + x1
+
+    assert sut.as_expr(X1 + 1) == x1 + 1
+    assert sut.as_expr(x1) == x1
+
+
+@pytest.mark.parametrize("n", (2, 3))
+def test_laurent_pipeline(n: int) -> None:
+    """The Ricci tensor is the same calculated with Laurent or sympy coefficients."""
+    # WHEN
+    R_dd = create_R_dd_direct(n, create_theta(n, laurent=True))
+
+    # THEN
+    assert R_dd == create_R_dd_direct(n, create_theta(n, laurent=False))
+
+
+def test_evaluate() -> None:
+    """Rational points are evaluated exactly, others with sympy."""
+    # GIVEN
+    polynomial = sut.LaurentPolynomial.from_expr(sqrt(2) * x1 / x2 + x3 ** 2 - 3)
+
+    # THEN
+    assert polynomial.evaluate({x1: Rational(1, 2), x2: 3, x3: 2}) == sqrt(2) / 6 + 1
+    assert polynomial.evaluate({x1: a, x2: 1, x3: 2}) == sqrt(2) * a + 1
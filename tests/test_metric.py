@@ -1,6 +1,10 @@
 """Test the metric module."""
 
+import pytest
+
 from itertools import permutations
+from sympy import Array, Rational
+from sympy.abc import a, b
 from sympy.tensor import tensorcontraction as tc, tensorproduct as tp
 
 import metric as sut
@@ -70,3 +74,68 @@ def test_create_metric_n_equals_2() -> None:
     for i, j, _ in permutations(range(3)):
         assert g_dd[i, j] == 0
         assert g_uu[i, j] == 0
+
+
+def test_create_diagonal_metric() -> None:
+    """The diagonal metric matches the dense metric and its inverse."""
+    # GIVEN
+    n = 3
+
+    # WHEN
+    metric = sut.create_diagonal_metric(n)
+
+    # THEN
+    assert metric.dim == 8
+    assert metric.entries[0] == sut.x1
+    assert metric.entries[3] == sut.x2
+    assert metric.inverse_entries[7] == 1 / sut.x3
+
+    g_dd, g_uu = sut.create_metric(n)
+    assert metric.g_dd == g_dd
+    assert metric.g_uu == g_uu
+
+
+def test_raise_and_lower_index() -> None:
+    """Raising and lowering agree with contraction with the dense metric."""
+    # GIVEN
+    n = 2
+    metric = sut.create_diagonal_metric(n)
+    tensor = Array([[a, b, 0], [0, a, b], [b, 0, a]])
+
+    # WHEN
+    lowered = metric.lower_index(tensor, 1)
+    raised = metric.raise_index(tensor, 0)
+
+    # THEN
+    assert lowered == tc(tp(tensor, metric.g_dd), (1, 2))
+    assert raised == tc(tp(metric.g_uu, tensor), (1, 2))
+
+
+def test_as_diagonal_metric() -> None:
+    """Dense metrics are converted to diagonal ones, from either g_dd or g_uu."""
+    # GIVEN
+    g_dd, g_uu = sut.create_metric(2)
+
+    # WHEN
+    from_g_dd = sut.as_diagonal_metric(g_dd=g_dd)
+    from_g_uu = sut.as_diagonal_metric(g_uu=g_uu)
+
+    # THEN
+    assert from_g_dd.entries == from_g_uu.entries == (sut.x1, sut.x2, sut.x3)
+    assert sut.as_diagonal_metric(from_g_dd) is from_g_dd
+
+    with pytest.raises(ValueError):
+        sut.as_diagonal_metric(Array([[a, b], [b, a]]))
+
+
+def test_diagonal_metric_subs() -> None:
+    """Substituting into a DiagonalMetric substitutes into the inverse as well."""
+    # GIVEN
+    metric = sut.create_diagonal_metric(2)
+
+    # WHEN
+    substituted = metric.subs({sut.x1: 2, sut.x2: 3, sut.x3: 5})
+
+    # THEN
+    assert substituted.entries == (2, 3, 5)
+    assert substituted.inverse_entries == (Rational(1, 2), Rational(1, 3), Rational(1, 5))
@@ -0,0 +1,75 @@
+"""Test the newton module."""
+
+import numpy as np
+import pytest
+
+from sympy import Rational
+from typing import List, Tuple
+
+import newton as sut
+
+from cache import ricci
+from metric import x1, x2, x3
+
+
+@pytest.mark.parametrize(
+    "n,expected",
+    [
+        (2, [(Rational(1, 2), Rational(1, 2), Rational(1, 2))]),
+        (3, [(1, 1, Rational(3, 8))]),
+        (
+            4,
+            [
+                (Rational(1, 2), Rational(1, 14), Rational(13, 7)),
+                (Rational(1, 2), Rational(1, 2), 1),
+            ],
+        ),
+    ],
+)
+def test_solve(n: int, expected: List[Tuple[Rational, ...]]) -> None:
+    """All the positive Einstein metrics are found and confirmed exactly."""
+    # GIVEN
+    elements = ricci[n]
+
+    # WHEN
+    solutions = sut.solve(elements, starts=512)
+
+    # THEN
+    assert all(s.exact is not None for s in solutions)
+    assert sorted(s.exact for s in solutions if s.exact is not None) == expected
+
+    for solution in solutions:
+        lmbdas = [
+            float((e / x).subs({x1: solution.x1, x2: solution.x2, x3: 1}))
+            for e, x in zip(elements, (x1, x2, x3))
+        ]
+        assert np.allclose(lmbdas, solution.lmbda)
+
+
+def test_irrational_solutions_are_not_confirmed() -> None:
+    """A solution which is not rational is found but has no exact value."""
+    # GIVEN
+    # lambda_1 = lambda_2 = lambda_3 = 1 at x1 = sqrt(2), x2 = 1
+    elements = [x1 ** 3 / 2, x2 ** 2, x3]
+
+    # WHEN
+    solutions = sut.solve(elements, starts=64)
+
+    # THEN
+    assert len(solutions) == 1
+    assert np.allclose((solutions[0].x1, solutions[0].x2), (np.sqrt(2), 1))
+    assert solutions[0].exact is None
+
+
+def test_deduplicate() -> None:
+    """Points within the tolerance are merged."""
+    # GIVEN
+    x1_s = np.array([1.0, 2.0, 1.0 + 1e-12, 2.0])
+    x2_s = np.array([1.0, 3.0, 1.0, 3.0 - 1e-12])
+
+    # WHEN
+    unique = sut.deduplicate(x1_s, x2_s)
+
+    # THEN
+    assert np.allclose(unique, [(1.0, 1.0), (2.0, 3.0)])
+    assert len(unique) == 2
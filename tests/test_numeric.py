@@ -0,0 +1,89 @@
+"""Test the numeric module."""
+
+import numpy as np
+import pytest
+
+from sympy import Rational
+
+import numeric as sut
+
+from cache import ricci
+from calculate import create_theta
+from metric import create_diagonal_metric, x1, x2, x3
+from ricci import calculate_invariants, create_R_dd_direct, create_R_uddd_sparse
+
+
+POINTS = [
+    (Rational(3, 7), Rational(5, 4), Rational(2, 3)),
+    (Rational(1), Rational(2), Rational(5, 3)),
+]
+
+
+@pytest.mark.parametrize("n", [2, 3, 4])
+def test_curvature(n: int) -> None:
+    """The batched numerical curvature agrees with the symbolic pipeline."""
+    # GIVEN
+    samples = np.array(POINTS, dtype=float)
+    R_uddd = create_R_uddd_sparse(n, create_theta(n))
+
+    # WHEN
+    curvature = sut.curvature(n, samples, chunk=3)
+
+    # THEN
+    for s, point in enumerate(POINTS):
+        subs = dict(zip((x1, x2, x3), point))
+        metric = create_diagonal_metric(n).subs(subs)
+
+        R_dd = create_R_dd_direct(n, create_theta(n, metric))
+        invariants = calculate_invariants(
+            {index: value.subs(subs) for index, value in R_uddd.items()}, metric
+        )
+
+        assert np.allclose(curvature.ricci[s], np.array(R_dd.tolist(), dtype=float))
+        assert np.isclose(curvature.Riem_2[s], float(invariants.Riem_2))
+        assert np.isclose(curvature.Ric_2[s], float(invariants.Ric_2))
+        assert np.isclose(curvature.scalar[s], float(invariants.scalar))
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 5])
+def test_representative_ricci(n: int) -> None:
+    """The representative elements agree with the stored symbolic results."""
+    # GIVEN
+    samples = np.array(POINTS, dtype=float)
+
+    # WHEN
+    values = sut.representative_ricci(n, samples)
+
+    # THEN
+    expected = [
+        [float(e.subs(dict(zip((x1, x2, x3), point)))) for e in ricci[n]]
+        for point in POINTS
+    ]
+    assert np.allclose(values, expected)
+
+
+def test_coalesce() -> None:
+    """Repeated indices are summed and the entries which cancel are dropped."""
+    # GIVEN
+    indices = np.array([[1, 0], [0, 1], [1, 0], [0, 0], [0, 0]])
+    values = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0], [1.0, 1.0], [-1.0, -1.0]])
+
+    # WHEN
+    result = sut.coalesce(indices, values, (2, 2))
+
+    # THEN
+    assert result.indices.tolist() == [[0, 1], [1, 0]]
+    assert result.values.tolist() == [[3.0, 4.0], [6.0, 8.0]]
+
+
+def test_join() -> None:
+    """All the pairs of equal keys are found."""
+    # GIVEN
+    a = np.array([2, 0, 1])
+    b = np.array([1, 2, 2, 3])
+
+    # WHEN
+    i, j = sut.join(a, b)
+
+    # THEN
+    assert sorted(zip(i.tolist(), j.tolist())) == [(0, 1), (0, 2), (2, 0)]
@@ -0,0 +1,65 @@
+"""Test the parallel module."""
+
+import pytest
+
+from sympy import Array, expand
+from sympy.abc import x
+from typing import Iterator
+
+import parallel as sut
+
+from K_1_forms import K
+from wedge import Wedge
+
+
+def _scale(factor: int, item: int) -> int:
+    """Multiply the item by the shared factor."""
+    return factor * item
+
+
+@pytest.fixture(autouse=True)
+def reset_configuration(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Start every test with the default configuration and no environment."""
+    monkeypatch.delenv("SUN_WORKERS", raising=False)
+    monkeypatch.delenv("SUN_CHUNKSIZE", raising=False)
+
+    sut.configure()
+    yield
+    sut.configure()
+
+
+def test_worker_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The worker count comes from the argument, configure, the environment or 1."""
+    # THEN
+    assert sut.worker_count() == 1
+
+    monkeypatch.setenv("SUN_WORKERS", "3")
+    assert sut.worker_count() == 3
+
+    sut.configure(workers=2)
+    assert sut.worker_count() == 2
+    assert sut.worker_count(5) == 5
+    assert sut.worker_count(0) == 1
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_pmap(workers: int) -> None:
+    """The map agrees with the serial one and keeps the order of the items."""
+    # WHEN
+    result = sut.pmap(_scale, range(10), 3, workers=workers, chunksize=3)
+
+    # THEN
+    assert result == [3 * i for i in range(10)]
+
+
+def test_papplyfunc() -> None:
+    """Expressions of K 1-forms and Wedges are mapped over in worker processes."""
+    # GIVEN
+    array = Array([[(x + 1) * K(0), x * (Wedge(K(0), K(1)) + K(2))], [0, x]])
+    sut.configure(workers=2)
+
+    # WHEN
+    result = sut.papplyfunc(array, expand)
+
+    # THEN
+    assert result == array.applyfunc(expand)
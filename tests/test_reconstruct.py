@@ -0,0 +1,118 @@
+"""Test the reconstruct module."""
+
+import pytest
+
+from fractions import Fraction
+from sympy import Expr, Rational, cancel
+from typing import Dict, List, Sequence
+
+import reconstruct as sut
+
+from metric import x1, x2, x3
+from parallel import pmap
+from ricci import representative_indices
+from ricci_store import RicciStore
+
+
+def _rationals(point: sut.Point) -> Dict[Expr, Expr]:
+    """Substitutions of the point for x1, x2 and x3."""
+    return {
+        x: Rational(p.numerator, p.denominator) for x, p in zip((x1, x2, x3), point)
+    }
+
+
+def _evaluator(forms: List[Expr]) -> sut.Evaluate:
+    """Evaluate known rational functions exactly."""
+
+    def evaluate(points: Sequence[sut.Point]) -> List[List[Fraction]]:
+        values = []
+
+        for point in points:
+            subs = _rationals(point)
+            values.append([Fraction(str(form.subs(subs))) for form in forms])
+
+        return values
+
+    return evaluate
+
+
+def test_reconstruct() -> None:
+    """Known rational functions with monomial denominators are reconstructed."""
+    # GIVEN
+    forms = [
+        (2 * x1 ** 3 - 5 * x1 * x2 * x3 + x2 ** 2 * x3) / (7 * x1 ** 2 * x3),
+        (x3 ** 2 - 4 * (x1 - x2) ** 2) / (16 * x1 * x2),
+        Rational(3, 4),
+        Rational(0),
+    ]
+
+    # WHEN
+    reconstructed = sut.reconstruct(_evaluator(forms))
+
+    # THEN
+    assert all(cancel(e - f) == 0 for e, f in zip(reconstructed, forms))
+    assert sut.verify(reconstructed, _evaluator(forms)) == []
+
+
+def test_degree_above_max_degree_raises() -> None:
+    """A component with a higher degree than expected is not silently truncated."""
+    # GIVEN
+    evaluate = _evaluator([x1 ** 5 / x3 ** 5])
+
+    # WHEN / THEN
+    with pytest.raises(ValueError, match="max_degree"):
+        sut.reconstruct(evaluate, max_degree=3)
+
+
+def test_verify() -> None:
+    """Forms which are not the evaluated functions fail verification."""
+    # GIVEN
+    evaluate = _evaluator([x1 / x2 + x3 / x1])
+
+    # WHEN
+    failures = sut.verify([x1 / x2 + x3 / x2], evaluate, samples=3)
+
+    # THEN
+    assert len(failures) == 3
+
+
+@pytest.mark.parametrize("n", [2, 3, 4])
+def test_ricci_at(n: int) -> None:
+    """The exact evaluation agrees with the stored results."""
+    # GIVEN
+    point = (Fraction(3, 7), Fraction(5, 11), Fraction(13, 4))
+    expected = RicciStore(calculate=None)[n]
+    subs = _rationals(point)
+
+    # WHEN
+    values = sut.ricci_at(sut.create_structure(n), point)
+
+    # THEN
+    assert sut.create_structure(n).rows == representative_indices(n)
+    assert [Rational(v.numerator, v.denominator) for v in values] == [
+        e.subs(subs) for e in expected
+    ]
+
+
+@pytest.mark.parametrize("n", [2, 3, 5])
+def test_reconstruct_ricci(n: int) -> None:
+    """The reconstructed elements are those of the symbolic pipeline."""
+    # WHEN
+    elements = sut.reconstruct_ricci(n)
+
+    # THEN
+    expected = RicciStore(calculate=None)[n]
+    assert all(cancel(e - f) == 0 for e, f in zip(elements, expected))
+
+
+def test_parallel_evaluation() -> None:
+    """The evaluations are spread over worker processes with the same results."""
+    # GIVEN
+    points = [(Fraction(i), Fraction(2), Fraction(i, 3)) for i in range(1, 5)]
+    structure = sut.create_structure(3)
+
+    # WHEN
+    values = pmap(sut.ricci_at, points, shared=structure, workers=2)
+
+    # THEN
+    assert values == [sut.ricci_at(structure, point) for point in points]
@@ -0,0 +1,110 @@
+"""Test the ricci_store module."""
+
+import json
+import os
+import pytest
+
+from sympy import Rational, cancel, sqrt
+from typing import List
+
+import ricci_store as sut
+
+from metric import x1, x2, x3
+
+
+def test_string_round_trip() -> None:
+    """An expression in the metric constants survives to_string and from_string."""
+    # GIVEN
+    expr = (Rational(3, 4) * x1 ** 2 - sqrt(3) * x2 * x3) / (x1 * x3 ** 2)
+
+    # WHEN
+    string = sut.to_string(expr)
+
+    # THEN
+    assert "x1" in string and "₁" not in string
+    assert sut.from_string(string) == expr
+
+
+def test_lookup_is_lazy(tmp_path: str) -> None:
+    """Nothing is read until the first access and only the n looked up is parsed."""
+    # GIVEN
+    path = os.path.join(str(tmp_path), "ricci.json")
+
+    with open(path, "w") as fout:
+        json.dump({"2": ["x1", "x2", "x3"], "3": ["not an ( expression"] * 3}, fout)
+
+    store = sut.RicciStore(path, calculate=None)
+    assert store._raw is None
+
+    # WHEN
+    elements = store[2]
+
+    # THEN
+    assert elements == [x1, x2, x3]
+    assert 3 in store and len(store) == 2
+    assert list(store) == [2, 3]
+
+
+def test_miss_is_calculated_but_not_stored(tmp_path: str) -> None:
+    """A miss calculates the elements (once per store) without writing them."""
+    # GIVEN
+    path = os.path.join(str(tmp_path), "ricci.json")
+    calls: List[int] = []
+
+    def calculate(n: int) -> List[Rational]:
+        calls.append(n)
+        return [x1 / n, x2 / n, x3 / n]
+
+    store = sut.RicciStore(path, calculate)
+
+    # WHEN
+    first = store[4]
+    second = store[4]
+    third = sut.RicciStore(path, calculate)[4]
+
+    # THEN
+    assert first == second == third == [x1 / 4, x2 / 4, x3 / 4]
+    assert calls == [4, 4]
+    assert 4 not in store and len(store) == 0
+    assert not os.path.exists(path)
+
+
+def test_miss_without_calculate_raises(tmp_path: str) -> None:
+    """A miss raises KeyError if no calculate function is specified."""
+    # GIVEN
+    store = sut.RicciStore(os.path.join(str(tmp_path), "ricci.json"), calculate=None)
+
+    # WHEN / THEN
+    with pytest.raises(KeyError):
+        store[2]
+
+
+def test_put_merges_with_the_file(tmp_path: str) -> None:
+    """Writing from one store keeps the entries another store has written."""
+    # GIVEN
+    path = os.path.join(str(tmp_path), "ricci.json")
+    first = sut.RicciStore(path, calculate=None)
+    second = sut.RicciStore(path, calculate=None)
+
+    # WHEN
+    assert len(first) == len(second) == 0
+    first.put(2, [x1, x1, x1])
+    second.put(3, [x2, x2, x2])
+
+    # THEN
+    store = sut.RicciStore(path, calculate=None)
+    assert store[2] == [x1, x1, x1]
+    assert store[3] == [x2, x2, x2]
+
+
+@pytest.mark.parametrize("n", [2, 3])
+def test_stored_results_are_correct(n: int) -> None:
+    """The stored elements agree with the representative calculation."""
+    # GIVEN
+    stored = sut.RicciStore(calculate=None)[n]
+
+    # WHEN
+    calculated = sut.calculate_ricci(n)
+
+    # THEN
+    assert all(cancel(s - c) == 0 for s, c in zip(stored, calculated))
@@ -0,0 +1,91 @@
+"""Test the riemann_io module."""
+
+import json
+import os
+import pytest
+
+from sympy import sqrt
+
+import riemann_io as sut
+
+from calculate import create_theta
+from laurent import LaurentPolynomial, as_expr
+from metric import x1, x2, x3
+from ricci import create_R_uddd_sparse, iter_R_uddd
+
+
+def test_encode_and_decode() -> None:
+    """Coefficients are encoded as integer term lists and decoded back."""
+    # GIVEN
+    expr = sqrt(2) * x1 / (3 * x2) - x3 ** 2
+
+    # WHEN
+    terms = sut.encode(expr)
+
+    # THEN
+    assert terms == [[0, 0, 2, 1, -1, 1], [1, -1, 0, 2, 1, 3]]
+    assert sut.decode(terms) == LaurentPolynomial.from_expr(expr)
+
+
+@pytest.mark.parametrize("n", (2, 3))
+def test_write_and_read(n: int, tmp_path: str) -> None:
+    """The non-zero entries of R_uddd round trip (in full and by rows)."""
+    # GIVEN
+    path = os.path.join(tmp_path, sut.riemann_path(n))
+    theta_ud = create_theta(n)
+    expected = create_R_uddd_sparse(n, theta_ud)
+
+    # WHEN
+    with sut.RiemannWriter(path, n) as writer:
+        writer.write_all(iter_R_uddd(theta_ud))
+
+    R = sut.read_riemann(path)
+    R_rows = sut.read_riemann(path, rows=[2, 0])
+
+    # THEN
+    assert sut.read_header(path) == {
+        "format": "sun-riemann",
+        "version": 1,
+        "n": n,
+        "dim": n ** 2 - 1,
+    }
+    assert {index: as_expr(value) for index, value in R.items()} == expected
+    assert R_rows == {index: value for index, value in R.items() if index[0] in (0, 2)}
+
+
+def test_failed_write_keeps_previous_file(tmp_path: str) -> None:
+    """A block which raises leaves no partial file and keeps the previous one."""
+    # GIVEN
+    n = 2
+    path = os.path.join(tmp_path, sut.riemann_path(n))
+    entries = list(iter_R_uddd(create_theta(n)))
+
+    with sut.RiemannWriter(path, n) as writer:
+        writer.write_all(entries[:1])
+
+    # WHEN
+    with pytest.raises(RuntimeError):
+        with sut.RiemannWriter(path, n) as writer:
+            writer.write_all(entries)
+            raise RuntimeError("Interrupted")
+
+    # THEN
+    assert sorted(os.listdir(tmp_path)) == [
+        sut.riemann_path(n),
+        f"{sut.riemann_path(n)}.idx",
+    ]
+    assert len(sut.read_riemann(path)) == 2
+    assert len(sut.read_riemann(path, rows=[entries[0][0][0]])) == 2
+
+
+def test_unsupported_version(tmp_path: str) -> None:
+    """Files of other formats or versions are rejected."""
+    # GIVEN
+    path = os.path.join(tmp_path, "R.jsonl")
+
+    with open(path, "w") as fout:
+        fout.write(json.dumps({"format": "sun-riemann", "version": 99}) + "\n")
+
+    # THEN
+    with pytest.raises(ValueError):
+        sut.read_riemann(path)
@@ -0,0 +1,67 @@
+"""Test the structure_constants module."""
+
+import pytest
+
+from itertools import product
+from sympy import sqrt
+
+from c_tensor import create_c_ddu
+from differentials import create_dK
+
+import structure_constants as sut
+
+
+def test_create_c_table_n_equals_2() -> None:
+    """Test the table against hand calculations for n = 2."""
+    # WHEN
+    c_table = sut.create_c_table(2)
+
+    # THEN
+    assert c_table == {
+        (1, 2, 0): sqrt(2),
+        (2, 1, 0): -sqrt(2),
+        (0, 2, 1): -sqrt(2),
+        (2, 0, 1): sqrt(2),
+        (0, 1, 2): 1 / sqrt(2),
+        (1, 0, 2): -1 / sqrt(2),
+    }
+
+
+@pytest.mark.parametrize("n", (3, 4))
+def test_create_c_table(n: int) -> None:
+    """The table agrees with the c_ddu extracted from the dK 2-forms."""
+    # GIVEN
+    dim = n ** 2 - 1
+    c_ddu = create_c_ddu(create_dK(n), n)
+
+    # WHEN
+    c_table = sut.create_c_table(n)
+
+    # THEN
+    assert all(value != 0 for value in c_table.values())
+
+    for a, b, c in product(range(dim), repeat=3):
+        assert c_table.get((a, b, c), 0) == c_ddu[a, b, c]
+
+
+@pytest.mark.parametrize("n", (2, 3, 4, 5))
+def test_extend_cartan_table(n: int) -> None:
+    """Extending the Cartan table of SU(n) gives the Cartan table of SU(n + 1)."""
+    # GIVEN
+    table = sut.create_cartan_table(n)
+
+    # WHEN
+    extended = sut.extend_cartan_table(table, n)
+
+    # THEN
+    assert extended == sut.create_cartan_table(n + 1)
+
+
+def test_iter_c_tables() -> None:
+    """The tables are created incrementally for every n."""
+    # WHEN
+    tables = dict(sut.iter_c_tables(6, n_min=3))
+
+    # THEN
+    assert sorted(tables) == [3, 4, 5, 6]
+    assert all(table == sut.create_c_table(n) for n, table in tables.items())
@@ -0,0 +1,21 @@
+"""Test the surd module."""
+
+from fractions import Fraction
+from sympy import sqrt
+
+import surd as sut
+
+
+def test_surd_arithmetic() -> None:
+    """Products of square roots are reduced to squarefree radicands."""
+    # GIVEN
+    u = sut.to_surd(sqrt(2) / 2 + sqrt(6))
+    v = sut.to_surd(sqrt(3))
+
+    # WHEN
+    product_ = sut.surd_mul(u, v)
+
+    # THEN
+    assert sut.from_surd(product_) == sqrt(6) / 2 + 3 * sqrt(2)
+    assert sut.surd_sum([u, {2: -u[2]}, {6: -u[6]}]) == {}
+    assert sut.surd_scale(u, Fraction(-2)) == sut.to_surd(-sqrt(2) - 2 * sqrt(6))
@@ -0,0 +1,66 @@
+"""Test the sweep module."""
+
+import numpy as np
+import pytest
+
+from sympy import Rational
+
+import sweep as sut
+
+from cache import ricci
+from metric import x1, x2, x3
+
+
+@pytest.mark.parametrize("n", [2, 3, 4])
+def test_compile_lambdas_matches_sympy(n: int) -> None:
+    """The compiled lambdas agree with evaluating R_ii / x_i with sympy."""
+    # GIVEN
+    point = (Rational(3, 7), Rational(5, 4), Rational(2, 3))
+    subs = dict(zip((x1, x2, x3), point))
+
+    # WHEN
+    values = sut.compile_lambdas(n)(*(np.array([float(p)]) for p in point))
+
+    # THEN
+    expected = [float((e / x).subs(subs)) for e, x in zip(ricci[n], (x1, x2, x3))]
+    assert values.shape == (3, 1)
+    assert np.allclose(values[:, 0], expected)
+
+
+def test_constant_elements_fill_the_grid() -> None:
+    """Elements without some of the constants are still evaluated at every point."""
+    # GIVEN
+    function = sut.compile_lambdas(elements=[x1, 2 * x2, 3 * x3])
+
+    # WHEN
+    values = function(np.ones((2, 3)), np.ones((2, 3)), np.ones((2, 3)))
+
+    # THEN
+    assert values.shape == (3, 2, 3)
+    assert np.array_equal(values[2], np.full((2, 3), 3.0))
+
+
+def test_sweep_finds_the_round_metric() -> None:
+    """For n=3 the bi-invariant metric x1 = x2 = x3 is Einstein."""
+    # GIVEN
+    grid = np.linspace(0.5, 1.5, 101)
+
+    # WHEN
+    result = sut.sweep(grid, grid, n=3)
+
+    # THEN
+    assert result.lmbda.shape == result.residuals[0].shape == (101, 101)
+    assert abs(result.residuals[:, 50, 50]).max() < 1e-12
+    assert any(np.allclose(c, (1, 1), atol=0.01) for c in sut.candidates(result))
+
+
+def test_sign_changes() -> None:
+    """Only the cells the zero set passes through are marked."""
+    # GIVEN
+    values = np.array([[1.0, 1.0, 1.0], [1.0, -1.0, 1.0], [1.0, 1.0, np.nan]])
+
+    # WHEN
+    mask = sut.sign_changes(values)
+
+    # THEN
+    assert mask.tolist() == [[True, True], [True, False]]
@@ -0,0 +1,83 @@
+"""Test the symmetric module."""
+
+import pytest
+
+from itertools import product
+from sympy import Array
+from sympy.abc import a, b, c
+
+import symmetric as sut
+
+
+def test_antisymmetric() -> None:
+    """Components of an antisymmetric matrix are derived by a sign flip."""
+    # GIVEN
+    tensor = sut.SymmetricTensor((3, 3), (sut.antisymmetric(0, 1, 2),))
+
+    # WHEN
+    tensor[0, 1] = a
+    tensor[2, 1] = b
+
+    # THEN
+    assert len(tensor) == 2
+    assert dict(tensor.items()) == {(0, 1): a, (1, 2): -b}
+
+    assert tensor[1, 0] == -a
+    assert tensor[1, 2] == -b
+    assert tensor[0, 2] == 0
+    assert tensor[1, 1] == 0
+
+    assert tensor.to_array() == Array([[0, a, 0], [-a, 0, -b], [0, b, 0]])
+
+
+def test_identically_zero_components() -> None:
+    """Components mapped to themselves with a sign flip can only be zero."""
+    # GIVEN
+    tensor = sut.SymmetricTensor((2, 2), (sut.antisymmetric(0, 1, 2),))
+
+    # WHEN
+    tensor[1, 1] = 0
+
+    # THEN
+    assert tensor.canonical((1, 1)) == (None, 0)
+    assert len(tensor) == 0
+
+    with pytest.raises(ValueError):
+        tensor[1, 1] = a
+
+
+def test_riemann_symmetries() -> None:
+    """A single component of R_abcd determines its orbit of eight components."""
+    # GIVEN
+    tensor = sut.SymmetricTensor((4, 4, 4, 4), sut.RIEMANN_SYMMETRIES)
+
+    # WHEN
+    tensor[3, 2, 1, 0] = c
+
+    # THEN
+    assert dict(tensor.items()) == {(0, 1, 2, 3): c}
+
+    for i, j, k, l in product(range(4), repeat=4):
+        assert tensor[i, j, k, l] == -tensor[j, i, k, l]
+        assert tensor[i, j, k, l] == -tensor[i, j, l, k]
+        assert tensor[i, j, k, l] == tensor[k, l, i, j]
+
+    nonzero = [index for index in product(range(4), repeat=4) if tensor[index] != 0]
+    assert len(nonzero) == 8
+    assert len(list(tensor.independent_indices())) == 21
+
+
+def test_scale_index() -> None:
+    """Only axes that are not moved by the symmetries can be scaled."""
+    # GIVEN
+    tensor = sut.SymmetricTensor((2, 2, 2), (sut.antisymmetric(0, 1, 3),))
+    tensor[0, 1, 1] = a
+
+    # WHEN
+    scaled = tensor.scale_index(2, (b, c))
+
+    # THEN
+    assert scaled[1, 0, 1] == -a * c
+
+    with pytest.raises(ValueError):
+        tensor.scale_index(0, (b, c))
@@ -7,10 +7,12 @@ from sympy import expand, Array
 
 import theta_tensor as sut
 
+from forms import TwoForm, TwoFormMatrix
 from K_1_forms import K
-from metric import x1, x2, x3
+from metric import create_diagonal_metric, x1, x2, x3
 from utilities import is_Wedge_of_K_in_expr
 from wedge import Wedge
+from zero_test import are_equal
 
 
 @pytest.mark.parametrize("n", (3,))
@@ -38,21 +40,24 @@ def test_create_theta_ud_n_equals_2(n: int, dw_ud: Array, w_wedge_ud: Array) ->
     for i in range(n ** 2 - 1):
         assert theta_ud[i, i] == 0
 
-    assert expand(theta_ud[0, 1]) == expand(
+    assert are_equal(
+        theta_ud[0, 1],
         (
             (2 * x1 + 2 * x2 - x3) / (4 * x1)
             + (2 * x1 - 2 * x2 + x3) * (2 * x1 - 2 * x2 - x3) / (8 * x1 * x3)
         )
         * Wedge(K(0), K(1))
     )
-    assert expand(theta_ud[1, 2]) == expand(
+    assert are_equal(
+        theta_ud[1, 2],
         (
             -(2 * x1 - 2 * x2 - x3) / (2 * x2)
             - (2 * x1 + 2 * x2 - x3) * (2 * x1 - 2 * x2 + x3) / (8 * x1 * x2)
         )
         * Wedge(K(1), K(2))
     )
-    assert expand(theta_ud[2, 0]) == expand(
+    assert are_equal(
+        theta_ud[2, 0],
         (
             -(2 * x1 - 2 * x2 + x3) / (2 * x3)
             - (2 * x1 - 2 * x2 - x3) * (2 * x1 + 2 * x2 - x3) / (8 * x2 * x3)
@@ -60,24 +65,58 @@ def test_create_theta_ud_n_equals_2(n: int, dw_ud: Array, w_wedge_ud: Array) ->
         * Wedge(K(0), K(2))
     )
 
-    assert expand(theta_ud[1, 0]) == expand(
+    assert are_equal(
+        theta_ud[1, 0],
         (
             -(2 * x1 + 2 * x2 - x3) / (4 * x2)
             - (2 * x1 - 2 * x2 + x3) * (2 * x1 - 2 * x2 - x3) / (8 * x2 * x3)
         )
         * Wedge(K(0), K(1))
     )
-    assert expand(theta_ud[2, 1]) == expand(
+    assert are_equal(
+        theta_ud[2, 1],
         (
             (2 * x1 - 2 * x2 - x3) / (2 * x3)
             + (2 * x1 + 2 * x2 - x3) * (2 * x1 - 2 * x2 + x3) / (8 * x1 * x3)
         )
         * Wedge(K(1), K(2))
     )
-    assert expand(theta_ud[0, 2]) == expand(
+    assert are_equal(
+        theta_ud[0, 2],
         (
             (2 * x1 - 2 * x2 + x3) / (2 * x1)
             + (2 * x1 - 2 * x2 - x3) * (2 * x1 + 2 * x2 - x3) / (8 * x1 * x2)
         )
         * Wedge(K(0), K(2))
     )
+
+
+@pytest.mark.parametrize("n", (2,))
+def test_create_theta_ud_forms_n_equals_2(
+    n: int, theta_ud_forms: TwoFormMatrix, dw_ud: Array, w_wedge_ud: Array
+) -> None:
+    """The TwoForm theta_ud agrees with the sympy calculation for n=2."""
+    # GIVEN
+    theta_ud = sut.create_theta_ud(dw_ud, w_wedge_ud)
+
+    # THEN
+    for i, j in product(range(n ** 2 - 1), repeat=2):
+        expected = TwoForm.from_expr(expand(theta_ud[i, j])).applyfunc(expand)
+        assert theta_ud_forms[i][j] == expected
+
+
+@pytest.mark.parametrize("n", (3,))
+def test_create_theta_ud_forms_antisymmetric_half(
+    n: int, theta_ud_forms: TwoFormMatrix
+) -> None:
+    """Calculating only a < b with the metric gives the full theta_ud."""
+    # GIVEN
+    metric = create_diagonal_metric(n)
+    dw_ud = [[form for form in row] for row in theta_ud_forms]
+    w_wedge_ud = [[TwoForm() for _ in row] for row in theta_ud_forms]
+
+    # WHEN
+    theta_ud = sut.create_theta_ud_forms(dw_ud, w_wedge_ud, metric)
+
+    # THEN
+    assert theta_ud == theta_ud_forms
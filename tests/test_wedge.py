@@ -1,10 +1,14 @@
 """Test the wrapper Wedge class in the wedge module."""
 
+import pickle
+
+from itertools import product
 from sympy import expand
 from sympy.abc import a, b, x, y
 
 import wedge as sut
 
+from differentials import create_dK
 from K_1_forms import K
 
 
@@ -256,3 +260,72 @@ def test_extract_wedge_coeff_non_matching_wedge_in_linear_combination() -> None:
 
     # THEN
     assert result == 0
+
+
+def test_wedge_coeffs_linear_combination() -> None:
+    """Decompose a linear combination of wedges into its coefficients."""
+    # GIVEN
+    expr = x * sut.Wedge(K(0), K(1)) + y * sut.Wedge(K(1), K(2)) - sut.Wedge(K(0), K(1))
+
+    # WHEN
+    result = sut.wedge_coeffs(expr)
+
+    # THEN
+    assert result == {(0, 1): x - 1, (1, 2): y}
+
+
+def test_wedge_coeffs_factored_expression() -> None:
+    """Decompose an expression where the wedges sit inside a factored Add."""
+    # GIVEN
+    expr = (a * sut.Wedge(K(0), K(1)) + b * sut.Wedge(K(0), K(2))) / x + y * sut.Wedge(
+        K(0), K(1)
+    )
+
+    # WHEN
+    result = sut.wedge_coeffs(expr)
+
+    # THEN
+    assert expand(result[(0, 1)]) == expand(a / x + y)
+    assert result[(0, 2)] == b / x
+
+
+def test_wedge_coeffs_drops_cancelled_terms() -> None:
+    """Wedges whose coefficients cancel are absent from the map."""
+    # GIVEN
+    expr = x * sut.Wedge(K(0), K(1)) + y * sut.Wedge(K(1), K(2))
+
+    # WHEN
+    result = sut.wedge_coeffs(expr - x * sut.Wedge(K(0), K(1)))
+
+    # THEN
+    assert result == {(1, 2): y}
+    assert sut.wedge_coeffs(a * x) == {}
+
+
+def test_wedge_coeffs_matches_extract_wedge_coeff() -> None:
+    """The single-pass decomposition agrees with extract_wedge_coeff on dK."""
+    # GIVEN
+    n = 3
+    dim = n ** 2 - 1
+    dK = create_dK(n)
+
+    for e in dK:
+        # WHEN
+        coeffs = sut.wedge_coeffs(e)
+
+        # THEN
+        for b_, c_ in product(range(dim), repeat=2):
+            assert coeffs.get((b_, c_), 0) == sut.extract_wedge_coeff(e, b_, c_)
+
+
+def test_pickle_wedge() -> None:
+    """Wedges (and expressions containing them) survive pickling."""
+    # GIVEN
+    expr = x * sut.Wedge(K(1), K(2)) - y * sut.Wedge(K(0), K(3))
+
+    # WHEN
+    unpickled = pickle.loads(pickle.dumps(expr))
+
+    # THEN
+    assert unpickled == expr
+    assert sut.wedge_coeffs(unpickled) == {(1, 2): x, (0, 3): -y}
@@ -0,0 +1,70 @@
+"""Test the zero_test module."""
+
+import pytest
+
+from sympy import Rational, sqrt
+from typing import Any
+
+import zero_test as sut
+
+from K_1_forms import K
+from laurent import laurent_generators
+from metric import x1, x2, x3
+from wedge import Wedge
+
+
+@pytest.mark.parametrize(
+    "expr, expected",
+    [
+        (0, True),
+        ((x1 + x2) ** 2 - x1 ** 2 - 2 * x1 * x2 - x2 ** 2, True),
+        ((x1 + x2) ** 2 - x1 ** 2 - x2 ** 2, False),
+        (1 / x1 + 1 / x2 - (x1 + x2) / (x1 * x2), True),
+        (1 / (x1 - x2) + 1 / (x2 - x1), True),
+        (Rational(1, 3) * x3 - x3 / 3 + Rational(1, 10 ** 30), False),
+        # Coefficients vanishing modulo the prime are confirmed exactly
+        (sut.PRIME * x1, False),
+        (2 ** 61 * x1 * x2 - x1 * x2, False),
+        (x1 / (sut.PRIME * x2) + x3, False),
+        # Irrational coefficients are evaluated exactly
+        (x1 * (1 + sqrt(2)) ** 2 - x1 * (3 + 2 * sqrt(2)), True),
+        (x1 * (1 + sqrt(2)) ** 2 - x1 * (3 + sqrt(2)), False),
+        ((1 + sqrt(3)) ** 2 - 4 - 2 * sqrt(3), True),
+        # K 1-forms and Wedges are variables
+        (x1 * K(0) * (x2 + 1) - x1 * x2 * K(0) - x1 * K(0), True),
+        ((x1 - x2) * Wedge(K(0), K(1)) + x2 * Wedge(K(0), K(1)), False),
+    ],
+)
+def test_is_zero(expr: Any, expected: bool) -> None:
+    """Zero expressions are recognised without expanding them."""
+    assert sut.is_zero(expr) is expected
+
+
+def test_laurent_polynomials() -> None:
+    """LaurentPolynomials are always canonical so are compared directly."""
+    # GIVEN
+    l1, l2, l3 = laurent_generators()
+
+    # THEN
+    assert sut.is_zero(l1 * l2 - l2 * l1)
+    assert not sut.is_zero(l1 / l2 - l3)
+    assert sut.are_equal((l1 + l2) * (l1 - l2), l1 * l1 - l2 * l2)
+
+
+def test_are_equal() -> None:
+    """Differently arranged expressions are equal, other expressions are not."""
+    assert sut.are_equal(
+        (2 * x1 - x3) * (2 * x1 + x3) / x2, (4 * x1 ** 2 - x3 ** 2) / x2
+    )
+    assert not sut.are_equal(x1 / x2, x2 / x1)
+
+
+@pytest.mark.parametrize("seed", [0, 1, None])
+def test_seeded(seed: int) -> None:
+    """The result does not depend on the seed of the random points."""
+    # GIVEN
+    expr = (x1 + 2 * x2 + 3 * x3) ** 6
+
+    # THEN
+    assert sut.is_zero(expr - expr.expand(), seed=seed)
+    assert not sut.is_zero(expr - expr.expand() + x1 ** 6 * x2 / x3, seed=seed)
@@ -5,8 +5,43 @@ Use the definition: theta^a_b = dw^a_b +  w^a_c ^ w^c_b
 """
 
 from sympy import Array
+from typing import Optional, Tuple
+
+from forms import TwoForm, TwoFormMatrix
+from laurent import expand_coeff
+from metric import DiagonalMetric
+from w_tensor import create_matrix, create_raised_antisymmetric
 
 
 def create_theta_ud(dw_ud: Array, w_wedge_ud: Array) -> Array:
     """Create the theta_ud tensor."""
     return dw_ud + w_wedge_ud
+
+
+def _theta_entry(
+    shared: Tuple[TwoFormMatrix, TwoFormMatrix], ab: Tuple[int, int]
+) -> TwoForm:
+    """Calculate theta^a_b = dw^a_b + (w^a_c ^ w^c_b)."""
+    dw_ud, w_wedge_ud = shared
+    a, b = ab
+
+    return (dw_ud[a][b] + w_wedge_ud[a][b]).applyfunc(expand_coeff)
+
+
+def create_theta_ud_forms(
+    dw_ud: TwoFormMatrix,
+    w_wedge_ud: TwoFormMatrix,
+    metric: Optional[DiagonalMetric] = None,
+) -> TwoFormMatrix:
+    """
+    Create the theta_ud tensor from the TwoForm matrices.
+
+    If the metric is specified only a < b are calculated and the rest follow from the
+    antisymmetry of the lowered theta_ab.
+    """
+    shared = (dw_ud, w_wedge_ud)
+
+    if metric is not None:
+        return create_raised_antisymmetric(len(dw_ud), _theta_entry, shared, metric)
+
+    return create_matrix(len(dw_ud), range(len(dw_ud[0])), _theta_entry, shared)
@@ -1,12 +1,19 @@
 """Implement the 𝜔-tensor, its wedge and its differential."""
 
 from functools import partial
+from itertools import combinations, product
 from sympy import Array, S, expand, factor, Expr
 from sympy.tensor import permutedims as pd, tensorcontraction as tc, tensorproduct as tp
-from typing import List
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
 
+from forms import OneForm, OneFormMatrix, TwoForm, TwoFormMatrix, sum_two_forms
 from K_1_forms import K
+from laurent import expand_coeff
+from metric import DiagonalMetric, as_diagonal_metric
+from parallel import papplyfunc, pmap
+from symmetric import SymmetricTensor
 from wedge import Wedge, antisymm, expand_K, extract_factor_K
+from zero_test import is_zero
 
 
 def create_w_dd(c_ddd: Array, K_u: Array) -> Array:
@@ -15,42 +22,44 @@ def create_w_dd(c_ddd: Array, K_u: Array) -> Array:
     c_ddd = S.Half * tc(tp(c3, K_u), (2, 3))
 
     # Expand all elements
-    c_ddd = c_ddd.applyfunc(expand)
+    c_ddd = papplyfunc(c_ddd, expand)
 
     return c_ddd
 
 
-def create_w_ud(w_dd: Array, g_uu: Array) -> Array:
-    """Create the w^a_b tensor by using the inverse metric."""
-    w_ud = tc(tp(g_uu, w_dd), (1, 2)).applyfunc(expand)
+def create_w_ud(w_dd: Array, g_uu: Union[Array, DiagonalMetric]) -> Array:
+    """Create the w^a_b tensor by using the (diagonal) inverse metric."""
+    w_ud = papplyfunc(as_diagonal_metric(g_uu=g_uu).raise_index(w_dd, 0), expand)
 
     return w_ud
 
 
+def _simplify_wedge(expr: Expr) -> Expr:
+    """
+    Simplify a sum of Wedges of K 1-forms.
+
+    Use the simplification utility functions from the wedge module as well as
+    factorizing the end-result.
+    """
+    simplified = antisymm(extract_factor_K(expand_K(expr)))
+
+    # Prune the entries which vanish before the costly factor
+    return S.Zero if is_zero(simplified) else factor(simplified)
+
+
 def create_w_wedge_ud(n: int, w_ud: Array) -> Array:
     """Create the w^a_c ^ w_c^b wedge with the c being summed over."""
     dim = n ** 2 - 1
 
     # Create the w wedge tensor by summing over the c index
-    # Simplify the expressions using the simplification utility functions from
-    # the wedge module as well as factorizing the end-result
-    wedge = (
-        Array(
-            [
-                [
-                    sum(Wedge(w_ud[a, c], w_ud[c, b]) for c in range(dim))
-                    for b in range(dim)
-                ]
-                for a in range(dim)
-            ]
-        )
-        .applyfunc(expand_K)
-        .applyfunc(extract_factor_K)
-        .applyfunc(antisymm)
-        .applyfunc(factor)
+    wedge = Array(
+        [
+            [sum(Wedge(w_ud[a, c], w_ud[c, b]) for c in range(dim)) for b in range(dim)]
+            for a in range(dim)
+        ]
     )
 
-    return wedge
+    return papplyfunc(wedge, _simplify_wedge)
 
 
 def _differential_of_K_expr(dK: List[Expr], expr: Expr) -> Expr:
@@ -73,3 +82,150 @@ def create_dw_ud(w_ud: Array, dK: List[Expr]) -> Array:
     differentiate = partial(_differential_of_K_expr, dK)
 
     return w_ud.applyfunc(differentiate)
+
+
+def _w_dd_entry(c_ddd: Union[Array, SymmetricTensor], ab: Tuple[int, int]) -> OneForm:
+    """Calculate 𝜔_ab = 1/2 (c_abe + c_aeb + c_eba) K^e."""
+    a, b = ab
+
+    return OneForm(
+        {
+            e: expand_coeff((c_ddd[a, b, e] + c_ddd[a, e, b] + c_ddd[e, b, a]) * S.Half)
+            for e in range(c_ddd.shape[0])
+        }
+    )
+
+
+def create_w_dd_forms(c_ddd: Union[Array, SymmetricTensor]) -> OneFormMatrix:
+    """
+    Create the 𝜔_ab tensor as OneForms directly from the c_ddd tensor.
+
+    𝜔_ab = 1/2 (c_abe + c_aeb + c_eba) K^e, the same as create_w_dd.
+    Since c_ddd is antisymmetric in its first two indices so is 𝜔_ab, so only a < b
+    are calculated.
+    """
+    dim = c_ddd.shape[0]
+    pairs = list(combinations(range(dim), 2))
+
+    w_dd = [[OneForm() for _ in range(dim)] for _ in range(dim)]
+
+    for (a, b), w in zip(pairs, pmap(_w_dd_entry, pairs, c_ddd)):
+        w_dd[a][b] = w
+        w_dd[b][a] = -w
+
+    return w_dd
+
+
+def create_w_ud_forms(
+    w_dd: OneFormMatrix, g_uu: Union[Array, DiagonalMetric]
+) -> OneFormMatrix:
+    """Create the w^a_b OneForms by using the (diagonal) inverse metric."""
+    g = as_diagonal_metric(g_uu=g_uu).inverse_entries
+
+    return [
+        [(g[a] * w).applyfunc(expand_coeff) for w in row] for a, row in enumerate(w_dd)
+    ]
+
+
+def create_raised_antisymmetric(
+    dim: int,
+    entry: Callable[[Any, Tuple[int, int]], TwoForm],
+    shared: Any,
+    metric: DiagonalMetric,
+) -> TwoFormMatrix:
+    """
+    Create a TwoForm matrix X^a_b whose lowered form X_ab = g_aa X^a_b is antisymmetric.
+
+    Only the a < b entries are calculated, in parallel, with entry(shared, (a, b)) and
+    the rest follow from X^b_a = -g^bb g_aa X^a_b and X^a_a = 0.
+    """
+    g_dd = metric.entries
+    g_uu = metric.inverse_entries
+    pairs = list(combinations(range(dim), 2))
+
+    X = [[TwoForm() for _ in range(dim)] for _ in range(dim)]
+
+    for (a, b), form in zip(pairs, pmap(entry, pairs, shared)):
+        X[a][b] = form
+        X[b][a] = (form * (-g_uu[b] * g_dd[a])).applyfunc(expand_coeff)
+
+    return X
+
+
+def create_matrix(
+    rows: int,
+    columns: Sequence[int],
+    entry: Callable[[Any, Tuple[int, int]], TwoForm],
+    shared: Any,
+) -> TwoFormMatrix:
+    """Create a TwoForm matrix, in parallel, with one column per entry of columns."""
+    indices = list(product(range(rows), columns))
+    forms = iter(pmap(entry, indices, shared))
+
+    return [[next(forms) for _ in columns] for _ in range(rows)]
+
+
+def _w_wedge_entry(w_ud: OneFormMatrix, ab: Tuple[int, int]) -> TwoForm:
+    """Calculate w^a_c ^ w^c_b summed over c."""
+    a, b = ab
+
+    return sum_two_forms(w_ud[a][c] ^ w_ud[c][b] for c in range(len(w_ud))).applyfunc(
+        expand_coeff
+    )
+
+
+def create_w_wedge_ud_forms(
+    n: int,
+    w_ud: OneFormMatrix,
+    columns: Optional[Sequence[int]] = None,
+    metric: Optional[DiagonalMetric] = None,
+) -> TwoFormMatrix:
+    """
+    Create the w^a_c ^ w_c^b TwoForms with the c being summed over.
+
+    If columns is specified only those b are calculated and the result has one column
+    per entry of columns (in the same order).
+
+    Otherwise, if the metric is specified, only a < b are calculated and the rest
+    follow from the antisymmetry of the lowered w_ac ^ w^c_b.
+    """
+    dim = n ** 2 - 1
+
+    if columns is None and metric is not None:
+        return create_raised_antisymmetric(dim, _w_wedge_entry, w_ud, metric)
+
+    columns = range(dim) if columns is None else columns
+
+    return create_matrix(dim, columns, _w_wedge_entry, w_ud)
+
+
+def _differential_of_one_form(dK: List[TwoForm], w: OneForm) -> TwoForm:
+    """Calculate the differential of a OneForm (constant coefficients) using dK."""
+    return sum_two_forms(c * dK[i] for i, c in w.coeffs.items()).applyfunc(
+        expand_coeff
+    )
+
+
+def _dw_entry(
+    shared: Tuple[OneFormMatrix, List[TwoForm]], ab: Tuple[int, int]
+) -> TwoForm:
+    """Calculate the differential of w^a_b."""
+    w_ud, dK = shared
+    a, b = ab
+
+    return _differential_of_one_form(dK, w_ud[a][b])
+
+
+def create_dw_ud_forms(
+    w_ud: OneFormMatrix, dK: List[TwoForm], metric: Optional[DiagonalMetric] = None
+) -> TwoFormMatrix:
+    """
+    Create the differential of the w_ud OneForms.
+
+    If the metric is specified only a < b are calculated and the rest follow from the
+    antisymmetry of the lowered dw_ab.
+    """
+    if metric is not None:
+        return create_raised_antisymmetric(len(w_ud), _dw_entry, (w_ud, dK), metric)
+
+    return create_matrix(len(w_ud), range(len(w_ud[0])), _dw_entry, (w_ud, dK))
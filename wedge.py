@@ -4,7 +4,7 @@ from more_itertools import partition
 from sympy import Expr, Integer
 from sympy.core import Add, Mul
 from sympy.printing import StrPrinter
-from typing import Any, List
+from typing import Any, Dict, Iterable, List, Tuple
 
 from K_1_forms import K
 
@@ -27,6 +27,14 @@ class Wedge(Expr):  # type: ignore
         obj = Expr.__new__(cls, op1, op2)
         return obj
 
+    def __reduce__(self) -> Tuple[type, Tuple[Expr, ...]]:
+        """Pickle as just the operands (sympy's default pickles the cached state)."""
+        return (Wedge, self.args)
+
+    def __reduce_ex__(self, protocol: Any) -> Tuple[type, Tuple[Expr, ...]]:
+        """Use __reduce__ for every protocol."""
+        return self.__reduce__()
+
     def _sympystr(self, printer: StrPrinter, **kwargs: Any) -> str:
         """Custom printer for the Wedge operation."""
 
@@ -171,3 +179,60 @@ def extract_wedge_coeff(expr: Expr, b: int, c: int) -> Expr:
         return e  # Return (immutable) leafs as is
 
     return sub(expr)
+
+
+def wedge_coeffs(expr: Expr) -> Dict[Tuple[int, int], Expr]:
+    """
+    Decompose a 2-form expression into its wedge coefficients in a single pass.
+
+    Returns a {(b, c): coeff} map such that coeff is the value that
+    extract_wedge_coeff(expr, b, c) would return. Pairs that do not appear in the
+    expression are absent from the map (their coefficient is zero).
+    """
+
+    def _merge(maps: Iterable[Dict[Tuple[int, int], List[Expr]]]) -> Dict[
+        Tuple[int, int], List[Expr]
+    ]:
+        """Merge the lists of terms from several maps key-wise."""
+        merged: Dict[Tuple[int, int], List[Expr]] = {}
+
+        for m in maps:
+            for key, terms in m.items():
+                merged.setdefault(key, []).extend(terms)
+
+        return merged
+
+    def _decompose(e: Expr) -> Dict[Tuple[int, int], List[Expr]]:
+        """Recurse into the expression collecting the terms multiplying each Wedge."""
+        if isinstance(e, Wedge):
+            i1, i2 = (_.index for _ in e.args)
+
+            return {(i1, i2): [Integer(1)]}
+
+        if isinstance(e, Add):
+            return _merge(_decompose(arg) for arg in e.args)
+
+        if isinstance(e, Mul):
+            # 2-forms are linear in the Wedges so at most one factor carries them
+            factors, forms = partition(lambda arg: arg.has(Wedge), e.args)
+            wedge_factors = list(forms)
+
+            if len(wedge_factors) == 1:
+                scale = Mul(*factors)
+
+                return {
+                    key: [scale * term for term in terms]
+                    for key, terms in _decompose(wedge_factors[0]).items()
+                }
+
+        if not e.has(Wedge):
+            return {}
+
+        # Fallback for any other structure: extract each wedge separately
+        keys = {tuple(_.index for _ in w.args) for w in e.atoms(Wedge)}
+
+        return {key: [extract_wedge_coeff(e, *key)] for key in keys}
+
+    coeffs = ((key, Add(*terms)) for key, terms in _decompose(expr).items())
+
+    return {key: coeff for key, coeff in coeffs if coeff != 0}
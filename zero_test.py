@@ -0,0 +1,240 @@
+"""
+Randomised zero testing of expressions (Schwartz-Zippel).
+
+Deciding whether an expression vanishes with expand is costly since the whole
+expansion has to be built. Instead the expression is evaluated at random points:
+a non-zero rational function whose numerator has degree d vanishes at a point drawn
+uniformly from a field of size p with probability at most d / p, so with the prime
+p = 2^61 - 1 a few evaluations make an error practically impossible, while an
+expression which is zero always passes.
+
+The evaluation is modulo p whenever the expression only has rational coefficients.
+That bound only holds while the expression does not vanish modulo p (which e.g.
+(2^61 - 1) x1 does), so an expression found to be zero modulo p is confirmed at a
+random rational point, exactly. Otherwise (e.g. the square roots of the structure
+constants) every evaluation is exact, at random rational points. The symbols, and
+any other sub-expression which is not a sum, product, power or number (e.g. a K
+1-form or a Wedge, which must be in canonical form), are treated as independent
+variables. The random points are seeded so the tests are reproducible.
+"""
+
+import random
+
+from fractions import Fraction
+from sympy import Expr, Rational, expand, nan, sympify, zoo
+from typing import Any, Dict, List, Optional
+
+from laurent import LaurentPolynomial
+
+
+PRIME = 2 ** 61 - 1
+
+
+class _Unsupported(Exception):
+    """The expression can not be evaluated modulo the prime."""
+
+
+def _is_variable(expr: Expr) -> bool:
+    """Whether the sub-expression is a variable, i.e. not a number or an operation."""
+    return not (expr.is_number or expr.is_Add or expr.is_Mul or _is_power(expr))
+
+
+def _is_power(expr: Expr) -> bool:
+    """Whether the sub-expression is an integer power of a non-number."""
+    return bool(expr.is_Pow and expr.exp.is_Integer and not expr.base.is_number)
+
+
+def _evaluate_mod(expr: Expr, values: Dict[Expr, int], cache: Dict[Expr, int]) -> int:
+    """
+    Evaluate the expression modulo PRIME with the values of its variables.
+
+    Raises ZeroDivisionError if a denominator vanishes and _Unsupported for
+    irrational numbers and denominators divisible by PRIME.
+    """
+    if expr in cache:
+        return cache[expr]
+
+    if expr.is_Rational:
+        if expr.q % PRIME == 0:
+            raise _Unsupported(expr)
+
+        result = int(expr.p) * pow(int(expr.q), -1, PRIME) % PRIME
+
+    elif expr.is_Add:
+        result = sum(_evaluate_mod(arg, values, cache) for arg in expr.args) % PRIME
+
+    elif expr.is_Mul:
+        result = 1
+
+        for arg in expr.args:
+            result = result * _evaluate_mod(arg, values, cache) % PRIME
+
+    elif _is_power(expr):
+        base = _evaluate_mod(expr.base, values, cache)
+
+        if base == 0 and expr.exp < 0:
+            raise ZeroDivisionError(f"{expr.base} vanishes")
+
+        result = pow(base, int(expr.exp), PRIME)
+
+    elif expr.is_number:
+        raise _Unsupported(expr)
+
+    else:
+        result = values[expr]
+
+    cache[expr] = result
+
+    return result
+
+
+def _evaluate_fraction(
+    expr: Expr, values: Dict[Expr, Fraction], cache: Dict[Expr, Fraction]
+) -> Fraction:
+    """
+    Evaluate the expression exactly with rational values of its variables.
+
+    Raises ZeroDivisionError if a denominator vanishes and _Unsupported for
+    irrational numbers.
+    """
+    if expr in cache:
+        return cache[expr]
+
+    if expr.is_Rational:
+        result = Fraction(int(expr.p), int(expr.q))
+
+    elif expr.is_Add:
+        result = sum(
+            (_evaluate_fraction(arg, values, cache) for arg in expr.args), Fraction(0)
+        )
+
+    elif expr.is_Mul:
+        result = Fraction(1)
+
+        for arg in expr.args:
+            result *= _evaluate_fraction(arg, values, cache)
+
+    elif _is_power(expr):
+        result = _evaluate_fraction(expr.base, values, cache) ** int(expr.exp)
+
+    elif expr.is_number:
+        raise _Unsupported(expr)
+
+    else:
+        result = values[expr]
+
+    cache[expr] = result
+
+    return result
+
+
+def _random_rational(rng: random.Random) -> Fraction:
+    """A random positive rational."""
+    return Fraction(rng.randint(1, 10 ** 9), rng.randint(1, 10 ** 9))
+
+
+def _variables(expr: Expr) -> List[Expr]:
+    """The sub-expressions treated as variables, in a deterministic order."""
+    variables: Dict[Expr, None] = {}
+    stack = [expr]
+
+    while stack:
+        e = stack.pop()
+
+        if _is_variable(e):
+            variables.setdefault(e)
+        elif not e.is_number:
+            stack.extend(reversed(e.args))
+
+    return list(variables)
+
+
+def _evaluate_exact(expr: Expr, point: Dict[Expr, Expr]) -> Optional[Expr]:
+    """Evaluate the expression exactly (None if a denominator vanishes)."""
+    value = expand(expr.xreplace(point))
+
+    return None if value.has(zoo, nan) else value
+
+
+def _confirm(expr: Expr, variables: List[Expr], rng: random.Random) -> bool:
+    """Confirm that an expression vanishing modulo PRIME is zero at a rational point."""
+    for _ in range(8):
+        values = {v: _random_rational(rng) for v in variables}
+
+        try:
+            return _evaluate_fraction(expr, values, {}) == 0
+        except ZeroDivisionError:
+            continue
+
+    return bool(expand(expr) == 0)
+
+
+def is_zero(expr: Any, samples: int = 2, seed: Optional[int] = 0) -> bool:
+    """
+    Test whether the expression is identically zero.
+
+    A zero expression is always recognised and a non-zero one is wrongly declared zero
+    with negligible probability (at most (d / 2^61)^samples, times d / 10^9 for the
+    exact confirmation, for degree d).
+
+    :param expr: A sympy expression, number or LaurentPolynomial
+    :param samples: The number of random points
+    :param seed: The seed of the random points (None for a random seed)
+    """
+    if isinstance(expr, LaurentPolynomial):
+        return not expr  # Always in canonical form
+
+    expr = sympify(expr)
+
+    if expr == 0:
+        return True
+
+    variables = _variables(expr)
+
+    if not variables:
+        return bool(expand(expr) == 0)
+
+    rng = random.Random(seed)
+    modular = True
+    evaluated = 0
+
+    # Allow a few extra points in case a denominator vanishes at some of them
+    for _ in range(samples + 8):
+        value: Any
+
+        if modular:
+            values = {v: rng.randrange(1, PRIME) for v in variables}
+
+            try:
+                value = _evaluate_mod(expr, values, {})
+            except ZeroDivisionError:
+                continue
+            except _Unsupported:
+                modular = False
+
+        if not modular:
+            point = {
+                v: Rational(rng.randint(1, 10 ** 9), rng.randint(1, 10 ** 9))
+                for v in variables
+            }
+            value = _evaluate_exact(expr, point)
+
+            if value is None:
+                continue
+
+        if value != 0:
+            return False
+
+        evaluated += 1
+
+        if evaluated == samples:
+            # The expression might only vanish modulo PRIME
+            return _confirm(expr, variables, rng) if modular else True
+
+    # The denominators vanish everywhere, so fall back on the symbolic test
+    return bool(expand(expr) == 0)
+
+
+def are_equal(a: Any, b: Any, samples: int = 2, seed: Optional[int] = 0) -> bool:
+    """Test whether two expressions are identically equal (see is_zero)."""
+    return is_zero(a - b, samples, seed)